@@ -1,65 +1,113 @@
+import argparse
+import json
+import time
+
 import cv2
-from transformers import pipeline
-from PIL import Image
-
-# Initialize the emotion recognition pipeline
-pipe = pipeline("image-classification", model="prithivMLmods/Facial-Emotion-Detection-SigLIP2")
-
-# Start capturing video from the default camera
-cap = cv2.VideoCapture(0)
-
-if not cap.isOpened():
-    print("Cannot open webcam")
-    exit()
-
-while True:
-    # Capture frame-by-frame
-    ret, frame = cap.read()
-    # if not ret:
-    #     print("Failed to grab frame")
-    #     break
-
-    # Convert the frame from BGR (OpenCV format) to RGB (PIL format)
-    rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-    
-    # Convert to a PIL image
-    pil_image = Image.fromarray(rgb_frame)
-
-    # Run emotion recognition on the current frame
-    predictions = pipe(pil_image)
-
-    # Extract the top prediction details
-    if predictions:
-        emotion = predictions[0]['label']
-        score = predictions[0]['score']
-        #text = f"{emotion}: {score:.2f}"
-        print(emotion)
-        if(emotion=="Happy"):
-            t="Confident"
-            print("Good confidence and body language !!!")
-        elif(emotion=='Neutral'):
-            print("Low confidence need to improve !!!")
-            t="less Confident"
-        else:
-            print("Low enthusiasm be more intercative !!!")
-            t="no Confidence"
-        text = f"{t}: {score:.2f}"
 
+from interview_core.camera import CaptureService
+from interview_core.emotion import LiveEmotionPipeline
+from interview_core.face import FaceTracker
+from interview_core.metrics import RateMeter
+
+# Capture runs at camera rate in its own thread, emotion inference samples
+# frames at --infer-hz and classifies them in batches in another, and this
+# loop only draws the latest smoothed result, so the display never waits on
+# the model. Frames are cropped to the face first (--no-face to disable) and
+# skipped when nobody is in view.
+#
+#   python CV.py                                  # default webcam
+#   python CV.py --source clip.mp4 --seconds 30 --no-display   # benchmark, prints JSON
+
+
+def confidence_text(emotion, score):
+    if emotion is None:
+        return "No emotion detected"
+    if emotion == "Happy":
+        t = "Confident"
+    elif emotion == 'Neutral':
+        t = "less Confident"
     else:
-        text = "No emotion detected"
+        t = "no Confidence"
+    return f"{t}: {score:.2f}"
+
+
+def confidence_message(emotion):
+    if emotion == "Happy":
+        return "Good confidence and body language !!!"
+    if emotion == 'Neutral':
+        return "Low confidence need to improve !!!"
+    return "Low enthusiasm be more intercative !!!"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Live facial emotion recognition")
+    parser.add_argument("--source", default="0", help="Camera index, video file or 'synthetic'")
+    parser.add_argument("--infer-hz", type=float, default=4.0, help="Frames classified per second")
+    parser.add_argument("--batch", type=int, default=2, help="Frames per classifier call")
+    parser.add_argument("--alpha", type=float, default=0.3, help="EMA weight of the newest scores")
+    parser.add_argument("--no-face", action="store_true", help="Classify the whole frame instead of the face crop")
+    parser.add_argument("--seconds", type=float, default=0, help="Stop after this long (0 = until 'q')")
+    parser.add_argument("--no-display", action="store_true", help="Run headless (for benchmarking)")
+    args = parser.parse_args()
+
+    # Start capturing video from the chosen source
+    capture = CaptureService(args.source).start()
+    if not capture.ready.wait(10):
+        print(f"Cannot open video source: {capture.error or args.source}")
+        capture.stop()
+        return
+
+    face_tracker = None if args.no_face else FaceTracker()
+    emotions = LiveEmotionPipeline(capture, infer_hz=args.infer_hz, batch_size=args.batch, alpha=args.alpha,
+                                   face_tracker=face_tracker).start()
+    display_fps = RateMeter()
+    started = time.perf_counter()
+    last_emotion = None
+    index = 0
+
+    try:
+        while not args.seconds or time.perf_counter() - started < args.seconds:
+            frame, index = capture.wait_frame(timeout=1.0, after=index)
+            if frame is None:
+                continue
+            display_fps.tick()
+
+            emotion, score = emotions.result
+            if emotion != last_emotion and emotion is not None:
+                print(emotion)
+                print(confidence_message(emotion))
+                last_emotion = emotion
+
+            if args.no_display:
+                continue
 
+            # Overlay the smoothed emotion and the counters on a copy of the frame
+            frame = frame.copy()
+            if face_tracker is not None and face_tracker.box is not None:
+                x, y, w, h = face_tracker.box
+                cv2.rectangle(frame, (x, y), (x + w, y + h), (255, 0, 0), 2)
+            cv2.putText(frame, confidence_text(emotion, score), (10, 30),
+                        cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2, cv2.LINE_AA)
+            stats = f"display {display_fps.rate():.0f} fps | inference {emotions.inference_rate.rate():.1f} fps"
+            cv2.putText(frame, stats, (10, 60), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 1, cv2.LINE_AA)
 
-    # Overlay the emotion prediction on the original frame
-    cv2.putText(frame, text, (10, 30),
-                cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2, cv2.LINE_AA)
+            # Display the resulting frame
+            cv2.imshow("Facial Emotion Recognition - Live Feed", frame)
 
-    # Display the resulting frame
-    cv2.imshow("Facial Emotion Recognition - Live Feed", frame)
+            # Break the loop on 'q' key press
+            if cv2.waitKey(1) & 0xFF == ord('q'):
+                break
+    finally:
+        report = emotions.stats()
+        report["display_fps"] = round(display_fps.rate(), 1)
+        if face_tracker is not None:
+            report["face"] = face_tracker.stats()
+        emotions.stop()
+        capture.stop()
+        if not args.no_display:
+            cv2.destroyAllWindows()
+        print(json.dumps(report, indent=2))
 
-    # Break the loop on 'q' key press 
-    if cv2.waitKey(1) & 0xFF == ord('q'):
-        break
 
-# When everything done, release the capture and destroy windows
-cap.release()
-cv2.destroyAllWindows()
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,18 @@
 import streamlit as st
-import time
-import numpy as np
-import sounddevice as sd
-import whisper
-from gtts import gTTS
-from io import BytesIO
-from openai import OpenAI
+import threading
 import os
-import base64 # Import base64 for data URI
+import uuid
+from interview_core import EnergyEndpointer, StreamingTranscriber, VadStats, get_backend, get_tts_cache, presynthesize, synthesize_mp3, synthesize_text
+from interview_core.batching import get_batch_transcriber
+from interview_core.context import ConversationContext
+from interview_core.feedback import CONNECTION_ERROR_MESSAGE
+from interview_core.llm import stream_sentences
+from interview_core.media_server import media_url
+from interview_core.speech import synthesize_sentences
+from interview_core.tiers import get_tiered_transcriber
+from interview_core.tracing import get_tracer, span, transition
+from interview_core import config as interview_config
+from interview_core import models as interview_models
 
 # --- !!! FIRST STREAMLIT COMMAND !!! ---
 st.set_page_config(layout="wide", page_title="AI Voice Interviewer")
@@ -54,10 +59,13 @@ if API_KEY == "nvapi-...":
     st.stop()
 
 MODEL_NAME = "meta/llama3-70b-instruct" # Or "meta/llama3-8b-instruct"
-WHISPER_MODEL = "base" # Options: "tiny", "base", "small", "medium", "large"
+WHISPER_FAST_MODEL = interview_config.WHISPER_FAST_MODEL # Speculative pass; rescored by a larger model
 SAMPLE_RATE = 16000
-RECORDING_DURATION_SECONDS = 15 # Duration for user recording
+RECORDING_DURATION_SECONDS = 15 # Maximum duration for user recording
+TRAILING_SILENCE_SECONDS = 1.2 # Stop recording after this much silence
 NUM_QUESTIONS = 5
+CONTEXT_TOKEN_BUDGET = 1500 # Hard cap on estimated prompt tokens per LLM call
+REVISION_POLL_SECONDS = 0.5 # How often a speculative reply checks for the accurate transcript
 
 # --- Asset Paths ---
 # --- IMPORTANT: SET PATHS TO YOUR VIDEO AND IMAGE FILES ---
@@ -74,16 +82,7 @@ if not os.path.exists(IMAGE_PATH):
     st.error(f"Image file not found at: {IMAGE_PATH}", icon="🚨")
     st.stop()
 
-video_bytes = None
 image_bytes = None
-try:
-    with open(VIDEO_PATH, "rb") as f:
-        video_bytes = f.read()
-    print(f"Successfully read {len(video_bytes)} bytes from video file.")
-except Exception as e:
-    st.error(f"Failed to read video file '{VIDEO_PATH}': {e}")
-    st.stop()
-
 try:
     with open(IMAGE_PATH, "rb") as f:
         image_bytes = f.read()
@@ -92,99 +91,90 @@ except Exception as e:
     st.error(f"Failed to read image file '{IMAGE_PATH}': {e}")
     st.stop()
 
-if not video_bytes:
-    st.error("Video data could not be loaded (file might be empty?).")
-    st.stop()
 if not image_bytes:
     st.error("Image data could not be loaded (file might be empty?).")
     st.stop()
 
-# --- Create Base64 Data URI for Video ---
-video_data_uri = None
+# --- Serve the Video by URL ---
+# A shared local media server streams the file (range requests + ETag caching),
+# so reruns only send the <video> tag instead of re-embedding the whole MP4.
+# Browsers on other machines can't reach that server and get a data URI instead.
+video_url = None
 try:
-    video_base64 = base64.b64encode(video_bytes).decode('utf-8')
+    page_host = st.context.headers.get("Host") if hasattr(st, "context") else None
+    video_url = media_url(VIDEO_PATH, page_host)
     # Determine MIME type (common ones) - adjust if your video is different
     video_mime_type = "video/mp4" # Assume mp4, change if webm, ogg etc.
-    video_data_uri = f"data:{video_mime_type};base64,{video_base64}"
-    print("Created video data URI.")
+    print(f"Serving video at {video_url[:80]}")
 except Exception as e:
-    st.error(f"Failed to encode video to Base64: {e}")
+    st.error(f"Failed to serve video file '{VIDEO_PATH}': {e}")
     st.stop()
 
-if not video_data_uri:
-     st.error("Failed to create video data URI.")
-     st.stop()
-
 # --- Create HTML Video Tag String ---
 # Using autoplay, loop, muted, playsinline attributes. controls="false" is redundant with CSS.
 video_html = f"""
-<video loop autoplay muted playsinline>
-  <source src="{video_data_uri}" type="{video_mime_type}">
+<video loop autoplay muted playsinline preload="auto">
+  <source src="{video_url}" type="{video_mime_type}">
   Your browser does not support the video tag. Please ensure you are using a modern browser.
 </video>
 """
 
 # --- Backend Functions ---
-@st.cache_resource
-def load_whisper_model(model_name):
-    """Loads the Whisper model using Streamlit's caching."""
-    print(f"Loading Whisper model '{model_name}'...")
+def load_whisper_tiers():
+    """
+    The process-wide fast/accurate Whisper pair: the fast tier is loaded now,
+    the accurate one is picked from measured CPU throughput in the background.
+    """
     try:
-        model = whisper.load_model(model_name)
-        print("Whisper model loaded successfully.")
-        return model
+        return get_tiered_transcriber()
     except Exception as e:
-        st.error(f"Error loading Whisper model '{model_name}': {e}", icon="🤖")
+        st.error(f"Error loading Whisper model '{WHISPER_FAST_MODEL}': {e}", icon="🤖")
         st.error("Ensure you have PyTorch installed and potentially ffmpeg available.")
         st.stop()
         return None # Should not be reached due to st.stop()
 
-@st.cache_resource
 def get_openai_client(api_key):
-    """Initializes the OpenAI client for NVIDIA API using caching."""
-    print("Initializing OpenAI client for NVIDIA API...")
+    """Returns the process-wide OpenAI client for the NVIDIA API."""
     try:
-        client = OpenAI(
-            base_url="https://integrate.api.nvidia.com/v1",
-            api_key=api_key,
-        )
-        # Optional: Add a simple test call here if needed
-        print("OpenAI client initialized.")
-        return client
+        return interview_models.get_openai_client(api_key)
     except Exception as e:
         st.error(f"Error initializing OpenAI client: {e}", icon="☁️")
         st.stop()
         return None
 
-def record_audio(duration, fs):
-    """Records audio from the default microphone."""
-    print(f"Starting recording for {duration} seconds...")
+def record_and_transcribe(duration, model, fs=SAMPLE_RATE):
+    """
+    Records from the default microphone while a background worker transcribes
+    overlapping windows, so the transcript is ready right after recording ends.
+    Recording stops early once the candidate has been silent for
+    TRAILING_SILENCE_SECONDS. The final pass is batched with other sessions'
+    answers. Returns None if recording failed.
+    """
+    print(f"Starting streaming recording for {duration} seconds...")
+    endpointer = EnergyEndpointer(fs=fs, trailing_silence_s=TRAILING_SILENCE_SECONDS)
+    transcriber = StreamingTranscriber(model, fs=fs, endpointer=endpointer, batcher=batch_transcriber)
     try:
-        recording = sd.rec(int(duration * fs), samplerate=fs, channels=1, dtype='int16')
-        sd.wait() # Wait until recording is finished
-        audio_np = recording.astype(np.float32) / 32768.0 # Normalize to [-1, 1]
-        print("Recording finished.")
-        return audio_np.flatten()
+        transcriber.start()
     except Exception as e:
         st.error(f"Audio recording failed: {e}", icon="🎤")
         st.error("Please ensure your microphone is connected, selected as default, and permissions are granted.", icon="⚙️")
         return None # Return None on failure
-
-def transcribe_audio(audio_np, model, fs=SAMPLE_RATE):
-    """Transcribes the given audio numpy array using the loaded Whisper model."""
-    if audio_np is None or audio_np.size < fs * 0.5: # Check if audio exists and is reasonably long
-        print("Transcription skipped: No valid audio data.")
-        return ""
-    print("Transcribing audio...")
     try:
-        # Consider adding fp16=False if experiencing precision issues, though usually fine
-        result = model.transcribe(audio_np, language="en")
-        transcription = result.get("text", "").strip()
-        print(f"Transcription result: '{transcription}'")
-        return transcription
-    except Exception as e:
-        st.error(f"Error during transcription: {e}", icon="🎧")
-        return "" # Return empty string on failure
+        with span("record"):
+            transcriber.wait(duration)
+    finally:
+        try:
+            transcription = transcriber.stop()
+        except Exception as e:
+            st.error(f"Error during transcription: {e}", icon="🎧")
+            transcription = "" # Return empty string on failure
+    print("Recording finished.")
+    # Rescore the answer with the accurate Whisper tier while the LLM works on the fast transcript.
+    st.session_state.rescore_future = whisper_tiers.rescore(transcriber.speech_audio())
+    if transcriber.trim_stats is not None:
+        st.session_state.vad_stats.add(transcriber.trim_stats)
+        print(st.session_state.vad_stats.report(fs))
+    return transcription
 
 def text_to_speech_bytes(text):
     """Converts text to speech audio bytes using gTTS."""
@@ -193,24 +183,36 @@ def text_to_speech_bytes(text):
         return None
     print(f"Generating speech for: '{text[:50]}...'")
     try:
-        tts = gTTS(text=text, lang='en', slow=False) # slow=False for normal speed
-        audio_stream = BytesIO()
-        tts.write_to_fp(audio_stream)
-        audio_stream.seek(0)
+        audio_bytes = synthesize_text(text, lang='en') # gTTS, cached per sentence
         print("Speech generation complete.")
-        return audio_stream.getvalue()
+        return audio_bytes
     except Exception as e:
         st.error(f"Error during Text-to-Speech generation: {e}", icon="🗣️")
         return None # Return None on failure
 
+def sentence_to_speech_bytes(sentence):
+    """TTS for one sentence of a streamed reply; returns b"" on failure so the rest still plays."""
+    try:
+        return synthesize_mp3(sentence, lang='en')
+    except Exception as e:
+        print(f"Error during TTS generation for sentence: {e}")
+        return b""
+
 # --- Streamlit App Title/Markdown ---
 st.title("🎙️ AI Voice Interviewer")
 st.markdown("Answer the interviewer's questions using your voice. The interviewer video will play automatically while speaking.")
 
 # --- Initialization ---
-whisper_model_instance = load_whisper_model(WHISPER_MODEL)
+whisper_tiers = load_whisper_tiers()
+whisper_model_instance = whisper_tiers.fast_model
+batch_transcriber = get_batch_transcriber(whisper_tiers.fast) # Shared by every session in this process
 openai_client = get_openai_client(API_KEY)
 
+# Pre-render fixed phrases into the TTS cache in the background (once per session)
+if 'tts_presynthesized' not in st.session_state:
+    st.session_state.tts_presynthesized = True
+    threading.Thread(target=presynthesize, args=([CONNECTION_ERROR_MESSAGE],), kwargs={"backend": get_backend("gtts")}, daemon=True).start()
+
 # --- Candidate Skillset (Can be adjusted here) ---
 candidate_skillset = """
 Problem Solving: Data Structures & Algorithms (DSA), Object-Oriented Programming (OOP), Database Management Systems (DBMS), Operating Systems (OS)
@@ -270,8 +272,16 @@ if 'show_video' not in st.session_state:
     st.session_state.show_video = False # Controls display of video vs image
 if 'current_interviewer_text' not in st.session_state:
     st.session_state.current_interviewer_text = "Initializing interview..." # Text to display below video
+if 'llm_context' not in st.session_state:
+    st.session_state.llm_context = ConversationContext(keep_turns=2, max_tokens=CONTEXT_TOKEN_BUDGET)
+if 'trace_key' not in st.session_state:
+    st.session_state.trace_key = uuid.uuid4().hex[:8] # Tells sessions apart in the trace
+if 'vad_stats' not in st.session_state:
+    st.session_state.vad_stats = VadStats()
 if 'last_user_transcription' not in st.session_state:
     st.session_state.last_user_transcription = "" # Last thing user said
+if 'pending_revision' not in st.session_state:
+    st.session_state.pending_revision = None # Speculative reply awaiting the accurate transcript
 
 # --- UI Layout ---
 col1, col2 = st.columns([0.6, 0.4]) # Left for media, Right for chat
@@ -350,27 +360,32 @@ with col2:
                      st.markdown(msg['content']) # Use markdown for potential formatting in LLM response
 
 # --- Main Interview Logic Function ---
-def call_llm():
-    """Calls the LLM, updates state, generates audio."""
+def call_llm(reissue=False):
+    """Calls the LLM, updates state, generates audio. `reissue` re-sends the latest turn."""
     if not openai_client:
         st.error("LLM Client not initialized.", icon="☁️")
         st.session_state.interview_state = 'finished'
         return
 
     # Prepare messages: Send only system + user/assistant turns
-    messages_to_send = [msg for msg in st.session_state.conversation if msg["role"] != "system" or msg == st.session_state.conversation[0]] # Include system only once at start
+    history = [msg for msg in st.session_state.conversation if msg["role"] != "system" or msg == st.session_state.conversation[0]] # Include system only once at start
+    # Keep the last turns verbatim and condense older ones into a scorecard, under the token budget
+    messages_to_send = st.session_state.llm_context.build(history, reissue=reissue)
 
     print(f"Calling LLM. State: {st.session_state.interview_state}, Q#: {st.session_state.question_count}")
     try:
-        completion = openai_client.chat.completions.create(
+        # Stream the reply and synthesize each sentence as soon as it is complete,
+        # so TTS runs while the remaining tokens are still arriving.
+        sentences = stream_sentences(
+            openai_client,
+            messages_to_send,
             model=MODEL_NAME,
-            messages=messages_to_send,
             temperature=0.4, # Slightly higher for potentially more varied questions, but still focused
             top_p=0.9,
             max_tokens=300, # Allow slightly longer responses for summary/questions
-            stream=False
         )
-        assistant_reply = completion.choices[0].message.content.strip()
+        _, reply_audio = synthesize_sentences(sentences, synthesize=sentence_to_speech_bytes)
+        assistant_reply = sentences.text.strip()
         print(f"LLM Raw Reply: '{assistant_reply}'")
 
         if not assistant_reply:
@@ -386,7 +401,7 @@ def call_llm():
         if "Thank you for appearing for the interview" in assistant_reply:
              st.session_state.interview_state = 'show_summary'
              st.session_state.show_video = True # Keep video for final message
-             st.session_state.audio_to_play = text_to_speech_bytes(assistant_reply)
+             st.session_state.audio_to_play = reply_audio or text_to_speech_bytes(assistant_reply)
              print("Interview concluded by LLM.")
         # Check if LLM failed to conclude after expected number of questions
         elif st.session_state.question_count >= NUM_QUESTIONS:
@@ -402,20 +417,47 @@ def call_llm():
              # It's a regular question, prepare for next user answer
              st.session_state.interview_state = 'waiting_for_answer'
              st.session_state.show_video = True # Show video while asking question
-             st.session_state.audio_to_play = text_to_speech_bytes(assistant_reply)
+             st.session_state.audio_to_play = reply_audio or text_to_speech_bytes(assistant_reply)
              print("Proceeding to wait for user answer.")
 
     except Exception as e:
         print(f"Error calling LLM: {e}")
         st.error(f"An error occurred while communicating with the AI: {e}", icon="☁️")
-        error_message = "Sorry, there was a connection error. Please try refreshing."
+        error_message = CONNECTION_ERROR_MESSAGE
         st.session_state.current_interviewer_text = error_message
         st.session_state.audio_to_play = text_to_speech_bytes(error_message)
         st.session_state.show_video = True # Show video even for error message
         st.session_state.interview_state = 'finished' # Stop interview on major error
 
+# --- Transcript Revision ---
+@st.fragment(run_every=REVISION_POLL_SECONDS)
+def poll_revision():
+    """
+    The reply to the last answer was generated from the fast transcript and
+    is already playing. Once the accurate transcript is in, re-issue the turn
+    if it differs materially, unless the candidate has started the next answer.
+    """
+    pending = st.session_state.pending_revision
+    if pending is None or not pending["future"].done():
+        return # Nothing to check yet; the fragment polls again
+    st.session_state.pending_revision = None
+    conversation = st.session_state.conversation
+    if st.session_state.interview_state != 'waiting_for_answer' or len(conversation) != pending["length"]:
+        return # The interview has moved on
+    revised = whisper_tiers.revision(pending["future"], pending["fast_text"])
+    if not revised:
+        return # The speculative reply stands
+    print(f"Accurate transcript differs, re-issuing the LLM turn: '{revised}'")
+    with st.spinner("Interviewer is revising the question..."):
+        del conversation[pending["answer_index"] + 1:] # Replace the speculative reply
+        conversation[pending["answer_index"]]["content"] = revised
+        st.session_state.last_user_transcription = revised
+        call_llm(reissue=True)
+    st.rerun() # Show and play the revised reply
+
 
 # --- State Machine Logic ---
+transition(st.session_state.interview_state, key=st.session_state.trace_key)
 
 # State: 'start' -> Get the first question from LLM
 if st.session_state.interview_state == 'start':
@@ -444,13 +486,15 @@ elif st.session_state.interview_state == 'waiting_for_answer':
     # Display the recording button in its placeholder
     with controls_placeholder:
         # Use a unique key to ensure Streamlit recognizes the button state correctly on reruns
-        if st.button(f"🎤 Record Answer ({RECORDING_DURATION_SECONDS}s)", key=f"record_q_{st.session_state.question_count}"):
+        if st.button(f"🎤 Record Answer (up to {RECORDING_DURATION_SECONDS}s)", key=f"record_q_{st.session_state.question_count}"):
             st.session_state.interview_state = 'processing_answer'
             st.session_state.show_video = False # Switch to static image during recording/processing
             st.session_state.audio_to_play = None # Stop any ongoing TTS playback
             st.session_state.last_user_transcription = "" # Clear previous transcription
+            st.session_state.pending_revision = None # The candidate has moved on
             print("Record button clicked. Moving to processing_answer state.")
             st.rerun() # Rerun immediately to switch UI for recording
+    poll_revision() # Re-issue the last reply if the accurate transcript disagrees
 
 # State: 'processing_answer' -> Record, Transcribe, Send to LLM
 elif st.session_state.interview_state == 'processing_answer':
@@ -459,21 +503,19 @@ elif st.session_state.interview_state == 'processing_answer':
     st.session_state.audio_to_play = None # Ensure no TTS is playing
 
     user_transcription = ""
-    audio_data = None
-
-    # Record Audio
-    with st.spinner(f"Listening... (Speak for {RECORDING_DURATION_SECONDS} seconds)"):
-        audio_data = record_audio(RECORDING_DURATION_SECONDS, SAMPLE_RATE)
-
-    # Transcribe Audio if recording was successful
-    if audio_data is not None:
-        with st.spinner("Transcribing your answer..."):
-            if whisper_model_instance:
-                user_transcription = transcribe_audio(audio_data, whisper_model_instance)
+    transcription = None
+    st.session_state.rescore_future = None
+
+    # Record and transcribe concurrently
+    with st.spinner(f"Listening... (Stops when you finish, max {RECORDING_DURATION_SECONDS} seconds)"):
+        if whisper_model_instance:
+            transcription = record_and_transcribe(RECORDING_DURATION_SECONDS, whisper_model_instance)
+            if transcription is not None:
+                user_transcription = transcription
                 st.session_state.last_user_transcription = user_transcription # Store for display below image
-            else:
-                st.error("Transcription model not loaded.", icon="🤖")
-                st.session_state.interview_state = 'waiting_for_answer' # Go back
+        else:
+            st.error("Transcription model not loaded.", icon="🤖")
+            st.session_state.interview_state = 'waiting_for_answer' # Go back
 
     # Process Transcription if valid
     if user_transcription:
@@ -481,19 +523,30 @@ elif st.session_state.interview_state == 'processing_answer':
         st.session_state.question_count += 1
         # Add user's answer to conversation history
         st.session_state.conversation.append({"role": "user", "content": user_transcription})
+        answer_index = len(st.session_state.conversation) - 1
 
         # Call LLM for next question or summary
         with st.spinner("Interviewer is processing your answer..."):
             call_llm() # LLM call updates state and sets show_video=True
 
+        # The reply is speculative on the fast transcript and plays right away;
+        # poll_revision() re-issues it if the accurate transcript disagrees.
+        if st.session_state.interview_state == 'waiting_for_answer' and st.session_state.rescore_future is not None:
+            st.session_state.pending_revision = {
+                "future": st.session_state.rescore_future,
+                "fast_text": user_transcription,
+                "answer_index": answer_index,
+                "length": len(st.session_state.conversation),
+            }
+
     # Handle cases where transcription failed or recording was too short/empty
-    elif audio_data is not None: # Recording happened but transcription was empty
+    elif transcription is not None: # Recording happened but transcription was empty
         print("Warning: Transcription was empty or failed.")
         st.warning("Could not understand audio or it was silent. Please try recording again.", icon="🤔")
         st.session_state.interview_state = 'waiting_for_answer' # Go back to allow re-recording
         st.session_state.show_video = True # Show video again for the re-prompt / waiting state
-    # else: audio_data was None (recording failed, error already shown) -> Stay in processing or move back? Let's move back.
-    elif audio_data is None:
+    # else: transcription was None (recording failed, error already shown) -> move back.
+    elif transcription is None:
         print("Processing aborted due to recording failure.")
         st.session_state.interview_state = 'waiting_for_answer' # Go back after recording error
 
@@ -503,6 +556,15 @@ elif st.session_state.interview_state == 'processing_answer':
 # State: 'show_summary' -> Display final message and summary video/audio
 elif st.session_state.interview_state == 'show_summary':
     print("State: show_summary")
+    print(st.session_state.vad_stats.report(SAMPLE_RATE))
+    print(get_tts_cache().report())
+    print(whisper_tiers.report())
+    print(batch_transcriber.report())
+    print(st.session_state.llm_context.report())
+    tracer = get_tracer()
+    if tracer.enabled:
+        print(tracer.report())
+        print(f"Trace written to {tracer.export()}")
     st.session_state.show_video = True # Ensure video plays for the final message
     st.success("Interview Concluded.")
     # Don't disable button yet, wait for 'finished' state
@@ -1,28 +1,38 @@
+import time
+
 import sounddevice as sd
-import soundfile as sf
-from transformers import pipeline
 
-# Initialize the audio classification pipeline with your model
-audio_pipe = pipeline("audio-classification", model="Hatman/audio-emotion-detection")
+from interview_core.audio_emotion import AudioEmotionScorer
+from interview_core.streaming import RingBuffer
 
 # Parameters for recording
 duration = 5  # seconds
 fs = 16000    # sample rate
 
+# Microphone samples go straight into a ring buffer; the scorer classifies
+# sliding windows of it in memory (the int8 ONNX model is used when exported,
+# see interview_core.onnx_models), so nothing is written to disk.
+buffer = RingBuffer(fs * 30)
+scorer = AudioEmotionScorer(fs=fs, window_seconds=2.0, hop_seconds=1.0)
+
+
+def callback(indata, frames, time_info, status):
+    if status:
+        print(f"Input stream status: {status}")
+    buffer.write(indata[:, 0])
+
+
 print("Recording for 5 seconds...")
 
 # Record audio from the microphone (mono channel)
-audio_data = sd.rec(int(duration * fs), samplerate=fs, channels=1, dtype='float32')
-sd.wait()  # Wait until the recording is complete
+with sd.InputStream(samplerate=fs, channels=1, dtype='float32', blocksize=int(fs * 0.1), callback=callback):
+    scorer.start(buffer)
+    time.sleep(duration)
 
 print("Recording finished.")
 
-# Save the recording to a temporary WAV file
-temp_filename = "temp_audio.wav"
-sf.write(temp_filename, audio_data, fs)
-
-# Run the audio classification pipeline on the recorded file
-result = audio_pipe(temp_filename)
+result = scorer.stop()
 
 print("Emotion detection results:")
 print(result)
+print(f"Scored {scorer.windows_scored} windows ({scorer.windows_silent} silent windows skipped).")
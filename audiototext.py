@@ -61,45 +61,48 @@ if __name__ == "__main__":
     print("Transcription:")
     print(transcription)'''
 
-import sounddevice as sd
-import numpy as np
-import whisper
+from interview_core import EnergyEndpointer, VadStats, get_whisper_model, record_until_silence, trim_silence
 
-def record_audio(duration, fs=16000):
+def record_audio(duration, fs=16000, trailing_silence=1.0):
     """
-    Record audio from the microphone for a given duration.
+    Record audio from the microphone until the speaker goes quiet.
     
     Parameters:
-      duration (float): Duration in seconds.
+      duration (float): Maximum duration in seconds.
       fs (int): Sampling rate (Hz).
+      trailing_silence (float): Seconds of silence that end the recording.
       
     Returns:
-      np.ndarray: Recorded audio as a 1D float32 numpy array normalized to [-1, 1].
+      tuple: (audio, stats) where audio is a 1D float32 numpy array normalized
+      to [-1, 1] with leading/trailing silence removed, and stats is the
+      TrimStats of how many samples were cut.
     """
     print("Recording...")
-    # Record audio (channels=1 for mono)
-    recording = sd.rec(int(duration * fs), samplerate=fs, channels=1, dtype='int16')
-    sd.wait()  # Wait for the recording to finish
+    # Record audio (mono) until the endpointer detects the end of speech
+    recording = record_until_silence(duration, fs, EnergyEndpointer(fs=fs, trailing_silence_s=trailing_silence))
     print("Recording complete!")
     
-    # Convert int16 recording to float32 normalized values
-    audio = recording.astype(np.float32) / 32768.0
-    # Flatten to a 1D array if needed
-    return audio.flatten()
+    # Drop silence so Whisper only sees speech
+    return trim_silence(recording, fs)
 
 def main():
-    # Load the Whisper model (using the "base" model as an example)
-    print("Loading Whisper model...")
-    model = whisper.load_model("base")
+    # Shared, lazily loaded Whisper model (see interview_core.models)
+    model = get_whisper_model("base")
     
     fs = 16000       # Sampling rate
-    duration = 5     # Duration of each recording in seconds
+    duration = 15    # Maximum duration of each recording in seconds
+    vad_stats = VadStats()
     
     print("Press Enter to start recording, or Ctrl+C to exit.")
     while True:
-        input(f"\nPress Enter to record for {duration} seconds...")
+        input(f"\nPress Enter to record (stops when you finish, max {duration} seconds)...")
         # Record audio from microphone without saving to a file
-        audio = record_audio(duration, fs)
+        audio, stats = record_audio(duration, fs)
+        vad_stats.add(stats)
+        print(f"Trimmed {100 * stats.trimmed_ratio:.1f}% of samples as silence. {vad_stats.report(fs)}")
+        if audio.size == 0:
+            print("No speech detected.")
+            continue
         
         # Transcribe the recorded audio
         print("Transcribing...")
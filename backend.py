@@ -1,17 +1,24 @@
 import streamlit as st
-import cv2
-import time
-import numpy as np
-import sounddevice as sd
-import whisper
-from transformers import pipeline
-from gtts import gTTS
-from io import BytesIO
-from openai import OpenAI
+import threading
 import os
-import base64
-from collections import Counter
-from PIL import Image
+import uuid
+from interview_core import EnergyEndpointer, StreamingTranscriber, VadStats, get_backend, get_tts_cache, presynthesize, synthesize_mp3, synthesize_text
+from interview_core.audio_emotion import AudioEmotionScorer
+from interview_core.batching import get_batch_transcriber
+from interview_core.camera import get_capture_service
+from interview_core.context import ConversationContext
+from interview_core.dataflow import get_answer_scheduler
+from interview_core.emotion import get_emotion_classifier, to_pil
+from interview_core.face import FaceTracker
+from interview_core.feedback import CONNECTION_ERROR_MESSAGE, FINAL_SUMMARY_TEMPLATE, FIXED_UTTERANCES, emotion_label, merged_emotion_feedback
+from interview_core.llm import stream_sentences
+from interview_core.tiers import get_tiered_transcriber
+from interview_core.timeline import EmotionSampler, EmotionTimeline
+from interview_core.tracing import get_tracer, span, transition
+from interview_core.media_server import media_url
+from interview_core.speech import synthesize_sentences
+from interview_core import config as interview_config
+from interview_core import models as interview_models
 
 # --- Streamlit Page Configuration ---
 st.set_page_config(layout="wide", page_title="AI Voice Interviewer with Emotion Feedback")
@@ -52,10 +59,14 @@ if API_KEY == "nvapi-...":
     st.stop()
 
 MODEL_NAME = "meta/llama3-70b-instruct"  # Or "meta/llama3-8b-instruct"
-WHISPER_MODEL = "base"
+WHISPER_FAST_MODEL = interview_config.WHISPER_FAST_MODEL  # Speculative pass; rescored by a larger model
 SAMPLE_RATE = 16000
-RECORDING_DURATION_SECONDS = 15
+RECORDING_DURATION_SECONDS = 15  # Upper bound; recording stops once the candidate goes quiet
+TRAILING_SILENCE_SECONDS = 1.2
 NUM_QUESTIONS = 5
+CONTEXT_TOKEN_BUDGET = 1500  # Hard cap on estimated prompt tokens per LLM call
+EMOTION_SAMPLE_HZ = 1.0  # Webcam emotion samples per second while the candidate answers
+REVISION_POLL_SECONDS = 0.5  # How often a speculative reply checks for the accurate transcript
 
 # --- Asset Paths (change these to your actual paths) ---
 VIDEO_PATH = r"D:\COEP HACK\Untitled video - Made with Clipchamp (1).mp4"
@@ -69,16 +80,7 @@ if not os.path.exists(IMAGE_PATH):
     st.error(f"Image file not found at: {IMAGE_PATH}", icon="🚨")
     st.stop()
 
-video_bytes = None
 image_bytes = None
-try:
-    with open(VIDEO_PATH, "rb") as f:
-        video_bytes = f.read()
-    print(f"Successfully read {len(video_bytes)} bytes from video file.")
-except Exception as e:
-    st.error(f"Failed to read video file: {e}")
-    st.stop()
-
 try:
     with open(IMAGE_PATH, "rb") as f:
         image_bytes = f.read()
@@ -87,27 +89,26 @@ except Exception as e:
     st.error(f"Failed to read image file: {e}")
     st.stop()
 
-if not video_bytes:
-    st.error("Video data could not be loaded.")
-    st.stop()
 if not image_bytes:
     st.error("Image data could not be loaded.")
     st.stop()
 
-# --- Create Base64 Data URI for Video ---
+# --- Serve the Video by URL ---
+# The file is served (with range requests and ETag caching) by a shared local
+# media server, so each rerun only sends this small tag, not the video itself.
+# Browsers on other machines can't reach that server and get a data URI instead.
 try:
-    video_base64 = base64.b64encode(video_bytes).decode('utf-8')
+    page_host = st.context.headers.get("Host") if hasattr(st, "context") else None
+    video_url = media_url(VIDEO_PATH, page_host)
     video_mime_type = "video/mp4"
-    video_data_uri = f"data:{video_mime_type};base64,{video_base64}"
-    print("Created video data URI.")
 except Exception as e:
-    st.error(f"Failed to encode video: {e}")
+    st.error(f"Failed to serve video file: {e}")
     st.stop()
 
 # --- Create HTML Video Tag String ---
 video_html = f"""
-<video loop autoplay muted playsinline>
-  <source src="{video_data_uri}" type="{video_mime_type}">
+<video loop autoplay muted playsinline preload="auto">
+  <source src="{video_url}" type="{video_mime_type}">
   Your browser does not support the video tag.
 </video>
 """
@@ -117,29 +118,28 @@ video_html = f"""
 # ---------------------------
 def capture_emotion():
     """
-    Captures one frame from the webcam using the DirectShow backend (for Windows)
-    and returns the detected emotion using a pre-trained pipeline.
+    Takes the latest frame from the shared background webcam capture (the
+    device stays open, so there is no open/warm-up cost here) and returns the
+    detected emotion using a pre-trained pipeline.
     """
     try:
-        cap = cv2.VideoCapture(0, cv2.CAP_DSHOW)
-        if not cap.isOpened():
-            st.error("Cannot open webcam for emotion capture.")
+        frame = camera.latest_frame()
+        if frame is None:
+            st.error(f"No webcam frame available for emotion capture. {camera.error or ''}")
             return None
 
-        ret, frame = cap.read()
-        cap.release()
-        if not ret:
-            st.error("Failed to capture frame for emotion detection.")
+        # Classify only the face; with nobody in view there is nothing to classify.
+        if 'face_tracker' not in st.session_state:
+            st.session_state.face_tracker = FaceTracker()
+        face = st.session_state.face_tracker.crop(frame)
+        if face is None:
+            print("No face in view; skipping emotion inference.")
             return None
 
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        pil_image = Image.fromarray(rgb_frame)
+        pipe = get_emotion_classifier()
 
-        if 'emotion_pipe' not in st.session_state:
-            st.session_state.emotion_pipe = pipeline("image-classification", model="prithivMLmods/Facial-Emotion-Detection-SigLIP2")
-        pipe = st.session_state.emotion_pipe
-
-        predictions = pipe(pil_image)
+        with span("emotion.face", snapshot=True):
+            predictions = pipe(to_pil(face))
         if predictions:
             detected_emotion = predictions[0]['label']
             return detected_emotion
@@ -152,62 +152,108 @@ def capture_emotion():
 # ---------------------------
 # Caching Models and Clients
 # ---------------------------
-@st.cache_resource
-def load_whisper_model(model_name):
-    print(f"Loading Whisper model '{model_name}'...")
+def load_whisper_tiers():
+    """
+    The process-wide fast/accurate Whisper pair: the fast tier is loaded now,
+    the accurate one is picked from measured CPU throughput in the background.
+    """
     try:
-        model = whisper.load_model(model_name)
-        print("Whisper model loaded successfully.")
-        return model
+        return get_tiered_transcriber()
     except Exception as e:
-        st.error(f"Error loading Whisper model '{model_name}': {e}", icon="🤖")
+        st.error(f"Error loading Whisper model '{WHISPER_FAST_MODEL}': {e}", icon="🤖")
         st.stop()
 
-@st.cache_resource
 def get_openai_client(api_key):
-    print("Initializing OpenAI client for NVIDIA API...")
     try:
-        client = OpenAI(
-            base_url="https://integrate.api.nvidia.com/v1",
-            api_key=api_key,
-        )
-        print("OpenAI client initialized.")
-        return client
+        return interview_models.get_openai_client(api_key)
     except Exception as e:
         st.error(f"Error initializing OpenAI client: {e}", icon="☁")
         st.stop()
 
-whisper_model_instance = load_whisper_model(WHISPER_MODEL)
+whisper_tiers = load_whisper_tiers()
+whisper_model_instance = whisper_tiers.fast_model
+batch_transcriber = get_batch_transcriber(whisper_tiers.fast)
 openai_client = get_openai_client(API_KEY)
+# Opened once per process and kept warm in a background thread (CAMERA_SOURCE).
+camera = get_capture_service()
+
+# Render the fixed phrases into the TTS cache in parallel, off the answer path.
+if 'tts_presynthesized' not in st.session_state:
+    st.session_state.tts_presynthesized = True
+    threading.Thread(target=presynthesize, args=(FIXED_UTTERANCES,), kwargs={"backend": get_backend("gtts")}, daemon=True).start()
 
 # ---------------------------
 # Audio & Transcription Functions
 # ---------------------------
-def record_audio(duration, fs):
-    print(f"Starting recording for {duration} seconds...")
+def record_and_transcribe(duration, model, fs=SAMPLE_RATE):
+    """
+    Records for `duration` seconds while a background worker transcribes the
+    audio captured so far, so the text is ready right after recording stops.
+    Recording stops early once the candidate has been silent for
+    TRAILING_SILENCE_SECONDS. Voice emotion is scored from the same buffer
+    and facial emotion sampled from the webcam while recording.
+
+    The streaming transcription windows and the facial emotion samples run
+    on the shared answer scheduler. The final pass goes through
+    the process-wide BatchTranscriber, batched with other sessions' answers. When recording stops, the
+    transcript, the voice-emotion tail and the facial timeline are finished
+    concurrently on it; only the transcript is waited for, so the LLM
+    request can go out right away. The facial result is left in
+    st.session_state.face_emotion_future. Returns None if the microphone
+    could not be opened.
+    """
+    print(f"Starting streaming recording for {duration} seconds...")
+    scheduler = get_answer_scheduler()
+    endpointer = EnergyEndpointer(fs=fs, trailing_silence_s=TRAILING_SILENCE_SECONDS)
+    transcriber = StreamingTranscriber(model, fs=fs, endpointer=endpointer, scheduler=scheduler,
+                                       batcher=batch_transcriber)
     try:
-        recording = sd.rec(int(duration * fs), samplerate=fs, channels=1, dtype='int16')
-        sd.wait()
-        audio_np = recording.astype(np.float32) / 32768.0
-        print("Recording finished.")
-        return audio_np.flatten()
+        transcriber.start()
     except Exception as e:
         st.error(f"Audio recording failed: {e}", icon="🎤")
         return None
-
-def transcribe_audio(audio_np, model, fs=SAMPLE_RATE):
-    if audio_np is None or audio_np.size < fs * 0.5:
-        print("Transcription skipped: No valid audio data.")
-        return ""
-    print("Transcribing audio...")
+    st.session_state.voice_emotions.start(transcriber.buffer)
+    sampler = st.session_state.emotion_sampler
+    answer = sampler.start_answer()
     try:
-        result = model.transcribe(audio_np, language="en")
-        transcription = result.get("text", "").strip()
-        print(f"Transcription result: '{transcription}'")
-        return transcription
+        with span("record"):
+            transcriber.wait(duration)
+    finally:
+        asr = scheduler.submit("transcribe", transcriber.stop)
+        voice = scheduler.submit("voice_emotion", st.session_state.voice_emotions.stop)
+        voice.add_done_callback(lambda f: print(f"Voice emotion for this answer: "
+                                                f"{f.exception() or f.result()}"))
+        # Stops only this answer, even if it runs after the next one started; a
+        # dropped stop still closes it, so the next answer gets a timeline of its own.
+        st.session_state.face_emotion_future = scheduler.submit(
+            "face_emotion", lambda: sampler.stop_answer(answer), on_drop=lambda stop: stop())
+        try:
+            transcription = asr.result()
+        except Exception as e:
+            st.error(f"Error during transcription: {e}", icon="🎧")
+            transcription = ""
+    print("Recording finished.")
+    # Rescore the answer with the accurate Whisper tier while the LLM works on the fast transcript.
+    st.session_state.rescore_future = whisper_tiers.rescore(transcriber.speech_audio())
+    if transcriber.trim_stats is not None:
+        st.session_state.vad_stats.add(transcriber.trim_stats)
+        print(st.session_state.vad_stats.report(fs))
+    return transcription
+
+def answer_emotion(face_future):
+    """
+    Dominant facial emotion of the answer just recorded; falls back to a
+    single snapshot if nothing was sampled or the result was dropped.
+    """
+    try:
+        summary = face_future.result(timeout=5) if face_future else None
     except Exception as e:
-        st.error(f"Error during transcription: {e}", icon="🎧")
-        return ""
+        print(f"Facial emotion timeline unavailable for this answer: {e}")
+        summary = None
+    if summary and summary["dominant"]:
+        print(f"Emotion timeline for this answer: {summary}")
+        return summary["dominant"]
+    return capture_emotion()
 
 def text_to_speech_bytes(text):
     if not text:
@@ -215,16 +261,21 @@ def text_to_speech_bytes(text):
         return None
     print(f"Generating speech for: '{text[:50]}...'")
     try:
-        tts = gTTS(text=text, lang='en', slow=False)
-        audio_stream = BytesIO()
-        tts.write_to_fp(audio_stream)
-        audio_stream.seek(0)
+        audio_bytes = synthesize_text(text, lang='en') # Cached per sentence
         print("Speech generation complete.")
-        return audio_stream.getvalue()
+        return audio_bytes
     except Exception as e:
         st.error(f"Error during TTS generation: {e}", icon="🗣")
         return None
 
+def sentence_to_speech_bytes(sentence):
+    """TTS for one sentence of a streamed reply; returns b"" on failure so the rest still plays."""
+    try:
+        return synthesize_mp3(sentence, lang='en')
+    except Exception as e:
+        print(f"Error during TTS generation for sentence: {e}")
+        return b""
+
 # ---------------------------
 # Session State Initialization
 # ---------------------------
@@ -262,10 +313,24 @@ if 'show_video' not in st.session_state:
     st.session_state.show_video = False
 if 'current_interviewer_text' not in st.session_state:
     st.session_state.current_interviewer_text = "Initializing interview..."
+if 'llm_context' not in st.session_state:
+    st.session_state.llm_context = ConversationContext(keep_turns=2, max_tokens=CONTEXT_TOKEN_BUDGET)
+if 'trace_key' not in st.session_state:
+    st.session_state.trace_key = uuid.uuid4().hex[:8] # Tells sessions apart in the trace
+if 'vad_stats' not in st.session_state:
+    st.session_state.vad_stats = VadStats()
 if 'last_user_transcription' not in st.session_state:
     st.session_state.last_user_transcription = ""
+if 'pending_revision' not in st.session_state:
+    st.session_state.pending_revision = None
 if 'emotions' not in st.session_state:
     st.session_state.emotions = []
+if 'emotion_sampler' not in st.session_state:
+    st.session_state.emotion_sampler = EmotionSampler(camera, EmotionTimeline(), rate_hz=EMOTION_SAMPLE_HZ,
+                                                      face_tracker=FaceTracker(),
+                                                      scheduler=get_answer_scheduler())
+if 'voice_emotions' not in st.session_state:
+    st.session_state.voice_emotions = AudioEmotionScorer(fs=SAMPLE_RATE)
 
 # ---------------------------
 # UI Layout
@@ -329,24 +394,29 @@ with col2:
 # ---------------------------
 # LLM Call Function
 # ---------------------------
-def call_llm():
+def call_llm(reissue=False):
     if not openai_client:
         st.error("LLM Client not initialized.", icon="☁")
         st.session_state.interview_state = 'finished'
         return
 
-    messages_to_send = [msg for msg in st.session_state.conversation if msg["role"] != "system" or msg == st.session_state.conversation[0]]
+    history = [msg for msg in st.session_state.conversation if msg["role"] != "system" or msg == st.session_state.conversation[0]]
+    # Keep recent turns verbatim and fold older ones into a scorecard under the token budget.
+    messages_to_send = st.session_state.llm_context.build(history, reissue=reissue)
     print(f"Calling LLM. State: {st.session_state.interview_state}, Q#: {st.session_state.question_count}")
     try:
-        completion = openai_client.chat.completions.create(
+        # Stream the reply and synthesize each sentence as soon as it is complete,
+        # so TTS runs while the remaining tokens are still arriving.
+        sentences = stream_sentences(
+            openai_client,
+            messages_to_send,
             model=MODEL_NAME,
-            messages=messages_to_send,
             temperature=0.4,
             top_p=0.9,
             max_tokens=300,
-            stream=False
         )
-        assistant_reply = completion.choices[0].message.content.strip()
+        _, reply_audio = synthesize_sentences(sentences, synthesize=sentence_to_speech_bytes)
+        assistant_reply = sentences.text.strip()
         print(f"LLM Raw Reply: '{assistant_reply}'")
 
         if not assistant_reply:
@@ -359,7 +429,7 @@ def call_llm():
         if "Thank you for appearing for the interview" in assistant_reply:
              st.session_state.interview_state = 'show_summary'
              st.session_state.show_video = True
-             st.session_state.audio_to_play = text_to_speech_bytes(assistant_reply)
+             st.session_state.audio_to_play = reply_audio or text_to_speech_bytes(assistant_reply)
              print("Interview concluded by LLM.")
         elif st.session_state.question_count >= NUM_QUESTIONS:
              st.warning("Reached question limit, but LLM did not provide summary. Ending interview.")
@@ -372,20 +442,46 @@ def call_llm():
         else:
              st.session_state.interview_state = 'waiting_for_answer'
              st.session_state.show_video = True
-             st.session_state.audio_to_play = text_to_speech_bytes(assistant_reply)
+             st.session_state.audio_to_play = reply_audio or text_to_speech_bytes(assistant_reply)
              print("Proceeding to wait for user answer.")
     except Exception as e:
         print(f"Error calling LLM: {e}")
         st.error(f"Error communicating with the AI: {e}", icon="☁")
-        error_message = "Sorry, there was a connection error. Please try refreshing."
+        error_message = CONNECTION_ERROR_MESSAGE
         st.session_state.current_interviewer_text = error_message
         st.session_state.audio_to_play = text_to_speech_bytes(error_message)
         st.session_state.show_video = True
         st.session_state.interview_state = 'finished'
 
+@st.fragment(run_every=REVISION_POLL_SECONDS)
+def poll_revision():
+    """
+    The reply to the last answer was generated from the fast transcript and
+    is already playing. Once the accurate transcript is in, re-issue the turn
+    if it differs materially, unless the candidate has started the next answer.
+    """
+    pending = st.session_state.pending_revision
+    if pending is None or not pending["future"].done():
+        return
+    st.session_state.pending_revision = None
+    conversation = st.session_state.conversation
+    if st.session_state.interview_state != 'waiting_for_answer' or len(conversation) != pending["length"]:
+        return
+    revised = whisper_tiers.revision(pending["future"], pending["fast_text"])
+    if not revised:
+        return
+    print(f"Accurate transcript differs, re-issuing the LLM turn: '{revised}'")
+    with st.spinner("Interviewer is revising the question..."):
+        del conversation[pending["answer_index"] + 1:]
+        conversation[pending["answer_index"]]["content"] = revised
+        st.session_state.last_user_transcription = revised
+        call_llm(reissue=True)
+    st.rerun()
+
 # ---------------------------
 # State Machine Logic
 # ---------------------------
+transition(st.session_state.interview_state, key=st.session_state.trace_key)
 if st.session_state.interview_state == 'start':
     print("State: start")
     has_assistant_message = any(msg["role"] == "assistant" and msg["content"] != "Please ask the first interview question." for msg in st.session_state.conversation)
@@ -404,13 +500,15 @@ elif st.session_state.interview_state == 'waiting_for_answer':
     print("State: waiting_for_answer")
     st.session_state.show_video = True
     with controls_placeholder:
-        if st.button(f"🎤 Record Answer ({RECORDING_DURATION_SECONDS}s)", key=f"record_q_{st.session_state.question_count}"):
+        if st.button(f"🎤 Record Answer (up to {RECORDING_DURATION_SECONDS}s)", key=f"record_q_{st.session_state.question_count}"):
             st.session_state.interview_state = 'processing_answer'
             st.session_state.show_video = False
             st.session_state.audio_to_play = None
             st.session_state.last_user_transcription = ""
+            st.session_state.pending_revision = None
             print("Record button clicked. Moving to processing_answer state.")
             st.rerun()
+    poll_revision()
 
 elif st.session_state.interview_state == 'processing_answer':
     print("State: processing_answer")
@@ -418,33 +516,47 @@ elif st.session_state.interview_state == 'processing_answer':
     st.session_state.audio_to_play = None
 
     user_transcription = ""
-    audio_data = record_audio(RECORDING_DURATION_SECONDS, SAMPLE_RATE)
-
-    if audio_data is not None:
-        with st.spinner(f"Transcribing your answer..."):
-            if whisper_model_instance:
-                user_transcription = transcribe_audio(audio_data, whisper_model_instance)
+    st.session_state.face_emotion_future = None
+    st.session_state.rescore_future = None
+    with st.spinner(f"Listening... (Stops when you finish, max {RECORDING_DURATION_SECONDS} seconds)"):
+        if whisper_model_instance:
+            transcription = record_and_transcribe(RECORDING_DURATION_SECONDS, whisper_model_instance)
+            if transcription is not None:
+                user_transcription = transcription
                 st.session_state.last_user_transcription = user_transcription
-            else:
-                st.error("Transcription model not loaded.", icon="🤖")
-                st.session_state.interview_state = 'waiting_for_answer'
+        else:
+            st.error("Transcription model not loaded.", icon="🤖")
+            st.session_state.interview_state = 'waiting_for_answer'
+            transcription = None
 
     if user_transcription:
         print(f"Transcription successful: '{user_transcription}'")
         st.session_state.question_count += 1
         st.session_state.conversation.append({"role": "user", "content": user_transcription})
-        
-        # Capture emotion snapshot after answer
-        detected_emotion = capture_emotion()
+        answer_index = len(st.session_state.conversation) - 1
+
+        # The LLM request goes out as soon as the transcript is ready; the
+        # emotion stages finish alongside it and are collected afterwards.
+        with st.spinner("Interviewer is processing your answer..."):
+            call_llm()
+
+        # The reply is speculative on the fast transcript and plays right away;
+        # poll_revision() re-issues it if the accurate transcript disagrees.
+        if st.session_state.interview_state == 'waiting_for_answer' and st.session_state.rescore_future is not None:
+            st.session_state.pending_revision = {
+                "future": st.session_state.rescore_future,
+                "fast_text": user_transcription,
+                "answer_index": answer_index,
+                "length": len(st.session_state.conversation),
+            }
+
+        detected_emotion = answer_emotion(st.session_state.face_emotion_future)
         if detected_emotion:
             st.session_state.emotions.append(detected_emotion)
             print(f"Captured emotion: {detected_emotion}")
         else:
             print("No emotion detected for this answer.")
-        
-        with st.spinner("Interviewer is processing your answer..."):
-            call_llm()
-    elif audio_data is not None:
+    elif transcription is not None:
         st.warning("Could not understand audio or it was silent. Please try recording again.", icon="🤔")
         st.session_state.interview_state = 'waiting_for_answer'
         st.session_state.show_video = True
@@ -453,32 +565,38 @@ elif st.session_state.interview_state == 'processing_answer':
 
 elif st.session_state.interview_state == 'show_summary':
     print("State: show_summary")
+    print(st.session_state.vad_stats.report(SAMPLE_RATE))
+    print(get_tts_cache().report())
+    print(whisper_tiers.report())
+    print(batch_transcriber.report())
+    print(st.session_state.llm_context.report())
+    print(get_answer_scheduler().report())
+    tracer = get_tracer()
+    if tracer.enabled:
+        print(tracer.report())
+        print(f"Trace written to {tracer.export()}")
     st.session_state.show_video = True
     st.success("Interview Concluded.")
     st.session_state.interview_state = 'finished'
     
     # Generate feedback solely based on captured emotions (do not pass to LLM)
-    if st.session_state.emotions:
-        emotion_counts = Counter(st.session_state.emotions)
-        most_common_emotion, count = emotion_counts.most_common(1)[0]
-        if most_common_emotion.lower() == "happy":
-            feedback_message = "Great job! Your expressions suggest confidence and positivity."
-        elif most_common_emotion.lower() == "nervous":
-            feedback_message = "It seems you were nervous. Consider practicing to build more confidence."
-        else:
-            feedback_message = "Your expressions were neutral. Try to be more expressive to convey enthusiasm. Speak clear and stay confident."
-    else:
-        feedback_message = "No emotion data was captured."
+    # Each answer's dominant facial and vocal emotion counts as one vote.
+    timeline = st.session_state.emotion_sampler.timeline
+    voice_timeline = st.session_state.voice_emotions.timeline
+    feedback_message = merged_emotion_feedback(timeline, voice_timeline, fallback=st.session_state.emotions)
     
-    final_summary = (
-        "Thank you for appearing for the interview.\n"
-        "Summary: Correct answers: X, Incorrect answers: Y.\n"
-        "Result: [Pass/Fail]\n"
-    )
+    final_summary = FINAL_SUMMARY_TEMPLATE
     # Print the summary and then a dedicated Feedback section
     st.write(final_summary)
     st.subheader("Feedback")
     st.write(feedback_message)
+    for number, answer in enumerate(timeline.summaries(), start=1):
+        if answer["samples"]:
+            st.caption(f"Answer {number}: mostly {emotion_label(answer['dominant'])} ({answer['dominant_share']:.0%} of "
+                       f"{answer['samples']} samples over {answer['seconds']}s), {answer['transitions']} changes.")
+    voice_dominant = voice_timeline.dominant_label()
+    if voice_dominant:
+        st.caption(f"Voice: mostly {emotion_label(voice_dominant)} across {len(voice_timeline.dominant_labels())} answers.")
     
     # Optionally, add these details to the conversation log and update TTS output.
     st.session_state.conversation.append({"role": "assistant", "content": final_summary + "\nFeedback: " + feedback_message})
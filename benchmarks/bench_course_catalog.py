@@ -0,0 +1,107 @@
+"""
+Local course catalog against upstream search: builds a catalog from the
+backend datasets plus results harvested from a stand-in YouTube search
+cache (optionally padded with synthetic courses to a target size), then
+times the index build, opening it (memory-mapped), and answering a mix of
+topics, against the stand-in YouTube search the catalog saves on every
+hit. Prints JSON.
+
+Usage:
+    python benchmarks/bench_course_catalog.py [--courses 20000] [--latency 0.4]
+        [--embedder hashing]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from course_search import (CourseCatalog, SearchCache, build_catalog, courses_from_json,  # noqa: E402
+                           courses_to_json, parse_video_items)
+from course_search.catalog import (DEFAULT_CSVS, harvest_search_cache, make_embedder,  # noqa: E402
+                                   records_from_csv)
+from course_search.fakes import FakeYouTubeClient  # noqa: E402
+from interview_core.metrics import summarize  # noqa: E402
+
+HARVESTED = ["python", "react", "docker", "kubernetes", "sql", "rust", "system design", "graph algorithms"]
+QUERIES = ["machine learning", "neural networks", "quantum physics", "javascript", "linked list", "calculus",
+           "python", "docker", "system design", "rust", "cooking", "watercolor painting"]
+WORDS = ("data web cloud mobile security network design testing systems compiler database analytics "
+         "statistics algebra geometry chemistry biology history economics marketing finance").split()
+
+
+def synthetic(n, seed=0):
+    rng = random.Random(seed)
+    records = []
+    for i in range(n):
+        words = rng.sample(WORDS, 4)
+        records.append({"title": f"{words[0].title()} {words[1]} course {i}",
+                        "description": "Covers " + ", ".join(words) + ".", "difficulty_level": "unknown",
+                        "is_free": True, "video_id": f"synthetic{i:07d}", "thumbnail_url": None,
+                        "topics": " ".join(words[2:]), "subject": words[0]})
+    return records
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--courses", type=int, default=20000, help="Pad the catalog to this many courses")
+    parser.add_argument("--latency", type=float, default=0.4, help="Stand-in YouTube seconds per search")
+    parser.add_argument("--embedder", default="hashing")
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        client = FakeYouTubeClient(latency=0)
+        cache = SearchCache(lambda q, tag, n: parse_video_items(
+            client.search().list(q=f"Courses on {q} for {tag}", maxResults=n).execute()["items"]),
+            namespace="bench", directory=os.path.join(directory, "cache"), encode=courses_to_json,
+            decode=courses_from_json)
+        for topic in HARVESTED:
+            cache.get(topic, "beginners", 5)
+
+        records = [record for path in DEFAULT_CSVS for record in records_from_csv(path)]
+        records += harvest_search_cache(os.path.join(directory, "cache"))
+        records += synthetic(max(0, args.courses - len(records)))
+        catalog_dir = os.path.join(directory, "catalog")
+        started = time.perf_counter()
+        count = build_catalog(records, catalog_dir, make_embedder(args.embedder))
+        build_s = time.perf_counter() - started
+
+        started = time.perf_counter()
+        catalog = CourseCatalog(catalog_dir)
+        open_ms = 1000 * (time.perf_counter() - started)
+
+        latencies, results = [], {}
+        for _ in range(args.rounds):
+            for query in QUERIES:
+                started = time.perf_counter()
+                courses = catalog.search(query, limit=5)
+                latencies.append(time.perf_counter() - started)
+                results[query] = [course.title for course in courses[:3]]
+
+        upstream = FakeYouTubeClient(latency=args.latency)
+        started = time.perf_counter()
+        upstream.search().list(q="Courses on python for beginners", maxResults=5).execute()
+        upstream_ms = 1000 * (time.perf_counter() - started)
+
+        size = sum(os.path.getsize(os.path.join(catalog_dir, name)) for name in os.listdir(catalog_dir))
+        print(json.dumps({
+            "courses": count,
+            "build_s": round(build_s, 2),
+            "index_mb": round(size / 1e6, 2),
+            "open_ms": round(open_ms, 2),
+            "search": summarize(latencies),
+            "upstream_search_ms": round(upstream_ms, 2),
+            "catalog": catalog.stats(),
+            "top_results": results,
+        }, indent=4))
+
+
+if __name__ == "__main__":
+    main()
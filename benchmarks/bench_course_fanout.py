@@ -0,0 +1,79 @@
+"""
+Check()-style multi-tier course queries against stand-in YouTube clients:
+the tiers searched one after another (as Check() used to) against
+CourseAggregator's concurrent fan-out, and the fan-out again with one tier
+slower than the deadline (partial results). Prints latency percentiles and
+result counts as JSON.
+
+Usage:
+    python benchmarks/bench_course_fanout.py [--topics 20] [--tier-latency 0.4 0.6]
+        [--slow-latency 5] [--deadline 1.5]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from course_search import CourseAggregator, merge, parse_video_items  # noqa: E402
+from course_search.fakes import FakeYouTubeClient  # noqa: E402
+from interview_core.metrics import summarize  # noqa: E402
+
+TAGS = ["beginners", "Complex Concepts", "projects", "interview questions"]
+
+
+def make_search(latencies):
+    """search(query, tag, max_results) with a stand-in client per tier tag."""
+    clients = {tag: FakeYouTubeClient(latency=latency) for tag, latency in latencies.items()}
+
+    def search(query, tag, max_results):
+        request = clients[tag].search().list(part="snippet", q=f"Courses on {query} for {tag}", type="video",
+                                             maxResults=max_results)
+        return parse_video_items(request.execute().get("items", []))
+    return search
+
+
+def measure(gather, topics):
+    latencies, counts = [], []
+    for topic in topics:
+        started = time.perf_counter()
+        counts.append(len(gather(topic)))
+        latencies.append(time.perf_counter() - started)
+    return {"latency": summarize(latencies), "courses_per_topic": sum(counts) / len(counts)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--topics", type=int, default=20)
+    parser.add_argument("--tier-latency", type=float, nargs="+", default=[0.4, 0.6],
+                        help="Seconds per search for each tier (one value per tier)")
+    parser.add_argument("--slow-latency", type=float, default=5.0, help="Seconds for the tier that misses the deadline")
+    parser.add_argument("--deadline", type=float, default=1.5)
+    parser.add_argument("--max-results", type=int, default=2)
+    args = parser.parse_args()
+    latencies = dict(zip(TAGS, args.tier_latency))
+    tiers = [(tag, args.max_results) for tag in latencies]
+    topics = [f"topic {i}" for i in range(args.topics)]
+    report = {"tiers": latencies, "deadline_s": args.deadline}
+
+    search = make_search(latencies)
+    report["sequential"] = measure(lambda topic: merge([search(topic, tag, n) for tag, n in tiers]), topics)
+
+    aggregator = CourseAggregator(make_search(latencies), deadline=args.deadline)
+    report["fanout"] = {**measure(lambda topic: aggregator.gather(topic, tiers), topics), **aggregator.stats()}
+
+    slow = dict(latencies, **{TAGS[len(latencies)]: args.slow_latency})
+    aggregator = CourseAggregator(make_search(slow), deadline=args.deadline)
+    slow_tiers = tiers + [(TAGS[len(latencies)], args.max_results)]
+    report["fanout_with_slow_tier"] = {**measure(lambda topic: aggregator.gather(topic, slow_tiers), topics[:5]),
+                                       **aggregator.stats()}
+    print(json.dumps(report, indent=4))
+    os._exit(0)  # Don't wait for the slow tier's searches still running in the background
+
+
+if __name__ == "__main__":
+    main()
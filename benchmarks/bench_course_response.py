@@ -0,0 +1,67 @@
+"""
+/get-courses response encoding: the old path (Check() pretty-printing a
+JSON string that the route decoded and re-encoded) against Course records
+serialized once to compact JSON, plus the bytes sent for a gzipped
+response and for a repeat request answered 304 from its ETag.
+
+Usage:
+    python benchmarks/bench_course_response.py [--courses 10] [--iterations 5000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from course_search import dumps, encode_response, parse_video_items, serialize  # noqa: E402
+from course_search.fakes import FakeYouTubeClient  # noqa: E402
+
+
+def per_call_us(function, iterations):
+    started = time.perf_counter()
+    for _ in range(iterations):
+        function()
+    return round(1e6 * (time.perf_counter() - started) / iterations, 2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--courses", type=int, default=10)
+    parser.add_argument("--iterations", type=int, default=5000)
+    args = parser.parse_args()
+    items = FakeYouTubeClient(latency=0).search().list(q="python", maxResults=args.courses).execute()["items"]
+    courses = parse_video_items(items)
+    dicts = [course.to_dict() for course in courses]
+
+    def old_path():
+        text = json.dumps({"python": dicts}, indent=4)  # Check()
+        return json.dumps({"success": True, "courses": json.loads(text)["python"]}).encode("utf-8")  # jsonify
+
+    payload = {"success": True, "source": "catalog", "courses": courses}
+    body, _, headers = encode_response(payload)
+    gzipped, _, _ = encode_response(payload, accept_encoding="gzip")
+    not_modified, status, _ = encode_response(payload, if_none_match=headers["ETag"])
+    print(json.dumps({
+        "courses": args.courses,
+        "serializer": "orjson" if serialize.orjson is not None else "json",
+        "encode_us": {
+            "pretty_string_round_trip": per_call_us(old_path, args.iterations),
+            "compact_records": per_call_us(lambda: dumps(payload), args.iterations),
+            "compact_records_with_etag": per_call_us(lambda: encode_response(payload), args.iterations),
+        },
+        "bytes": {
+            "pretty_string": len(json.dumps({"python": dicts}, indent=4).encode("utf-8")),
+            "compact": len(body),
+            "gzip": len(gzipped),
+            "not_modified": len(not_modified),
+        },
+        "repeat_status": status,
+    }, indent=4))
+
+
+if __name__ == "__main__":
+    main()
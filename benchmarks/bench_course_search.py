@@ -0,0 +1,108 @@
+"""
+Course search cache against a stand-in YouTube client (no credentials or
+quota needed). Replays a skewed stream of topic lookups uncached and
+through SearchCache, then checks request coalescing (concurrent identical
+lookups), a warm restart from the disk tier and stale-while-revalidate
+latency. Prints lookup latency percentiles and upstream call counts as
+JSON.
+
+Usage:
+    python benchmarks/bench_course_search.py [--lookups 200] [--latency 0.4] [--threads 16]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from course_search import SearchCache, courses_from_json, courses_to_json, parse_video_items  # noqa: E402
+from course_search.fakes import FakeYouTubeClient  # noqa: E402
+from interview_core.metrics import summarize  # noqa: E402
+
+TOPICS = ["python", "react", "java", "machine learning", "sql", "docker", "rust", "graph algorithms",
+          "operating systems", "linear algebra", "kubernetes", "system design"]
+
+
+def make_fetch(client):
+    def fetch(query, tag, max_results):
+        request = client.search().list(part="snippet", q=f"Courses on {query} for {tag}", type="video",
+                                       maxResults=max_results)
+        return parse_video_items(request.execute().get("items", []))
+    return fetch
+
+
+def workload(n, seed=0):
+    """Zipf-like topic popularity, with the casing/spacing variations users type."""
+    rng = random.Random(seed)
+    weights = [1 / (rank + 1) for rank in range(len(TOPICS))]
+    topics = rng.choices(TOPICS, weights, k=n)
+    return [rng.choice([topic, topic.title(), f" {topic.upper()} "]) for topic in topics]
+
+
+def timed(lookup, queries):
+    latencies = []
+    for query in queries:
+        started = time.perf_counter()
+        lookup(query)
+        latencies.append(time.perf_counter() - started)
+    return summarize(latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lookups", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.4, help="Fake YouTube seconds per search")
+    parser.add_argument("--threads", type=int, default=16, help="Concurrent identical lookups")
+    args = parser.parse_args()
+    queries = workload(args.lookups)
+    report = {}
+
+    with tempfile.TemporaryDirectory() as directory:
+        client = FakeYouTubeClient(latency=args.latency)
+        fetch = make_fetch(client)
+        report["uncached"] = {"latency": timed(lambda q: fetch(q, "beginners", 2), queries),
+                              "upstream_calls": client.calls}
+
+        client = FakeYouTubeClient(latency=args.latency)
+        cache = SearchCache(make_fetch(client), directory=directory, encode=courses_to_json, decode=courses_from_json)
+        report["cached"] = {"latency": timed(lambda q: cache.get(q, "beginners", 2), queries),
+                            "upstream_calls": client.calls, "stats": cache.stats()}
+
+        client = FakeYouTubeClient(latency=args.latency)
+        cache = SearchCache(make_fetch(client), directory=None)
+        threads = [threading.Thread(target=cache.get, args=("Docker", "beginners", 2)) for _ in range(args.threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        report["coalescing"] = {"concurrent_lookups": args.threads, "upstream_calls": client.calls,
+                                "coalesced": cache.stats()["coalesced"]}
+
+        client = FakeYouTubeClient(latency=args.latency)
+        cache = SearchCache(make_fetch(client), directory=directory, encode=courses_to_json, decode=courses_from_json)
+        report["warm_restart"] = {"latency": timed(lambda q: cache.get(q, "beginners", 2), TOPICS),
+                                  "upstream_calls": client.calls, "disk_hits": cache.stats()["disk_hits"]}
+
+        client = FakeYouTubeClient(latency=args.latency)
+        cache = SearchCache(make_fetch(client), directory=None, ttl=0.05)
+        cache.get("python", "beginners", 2)
+        time.sleep(0.1)
+        started = time.perf_counter()
+        cache.get("python", "beginners", 2)
+        stale_ms = 1000 * (time.perf_counter() - started)
+        time.sleep(args.latency + 0.1)  # Let the background refresh land
+        report["stale_while_revalidate"] = {"stale_lookup_ms": round(stale_ms, 2), "upstream_calls": client.calls,
+                                            "stats": cache.stats()}
+
+    print(json.dumps(report, indent=4))
+
+
+if __name__ == "__main__":
+    main()
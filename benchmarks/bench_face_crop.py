@@ -0,0 +1,96 @@
+"""
+Full-frame vs face-crop emotion classification on a fixed clip.
+
+Reads every --stride-th frame of the clip and classifies it twice: the whole
+frame (what backend.py and CV.py used to do) and the FaceTracker crop
+(skipped when no face is found). Reports per-frame latency for both paths
+and, given the clip's true --label (e.g. a clip of an acted "Happy" face),
+the share of frames each path labels correctly. Frames without a face count
+as misses for the crop path's accuracy.
+
+Usage:
+    python benchmarks/bench_face_crop.py clip.mp4 [--label Happy] [--stride 5] [--max-frames 200]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from interview_core.emotion import classify_frames, get_emotion_classifier  # noqa: E402
+from interview_core.face import FaceTracker  # noqa: E402
+from interview_core.metrics import summarize  # noqa: E402
+
+
+def read_frames(path, stride, max_frames):
+    import cv2
+
+    capture = cv2.VideoCapture(path)
+    if not capture.isOpened():
+        raise SystemExit(f"Cannot open clip: {path}")
+    frames = []
+    index = 0
+    while len(frames) < max_frames:
+        ok, frame = capture.read()
+        if not ok:
+            break
+        if index % stride == 0:
+            frames.append(frame)
+        index += 1
+    capture.release()
+    return frames
+
+
+def top_label(scores):
+    return max(scores, key=scores.get)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("clip")
+    parser.add_argument("--label", default=None, help="True emotion label for the whole clip")
+    parser.add_argument("--stride", type=int, default=5)
+    parser.add_argument("--max-frames", type=int, default=200)
+    args = parser.parse_args()
+
+    frames = read_frames(args.clip, args.stride, args.max_frames)
+    classifier = get_emotion_classifier()
+    classify_frames(frames[:1], classifier)  # Warm-up
+
+    full_times, full_labels = [], []
+    for frame in frames:
+        started = time.perf_counter()
+        full_labels.append(top_label(classify_frames([frame], classifier)[0]))
+        full_times.append(time.perf_counter() - started)
+
+    tracker = FaceTracker()
+    crop_times, crop_labels = [], []
+    for frame in frames:
+        started = time.perf_counter()
+        face = tracker.crop(frame)
+        crop_labels.append(top_label(classify_frames([face], classifier)[0]) if face is not None else None)
+        crop_times.append(time.perf_counter() - started)
+
+    report = {
+        "clip": args.clip,
+        "frames": len(frames),
+        "full_frame_latency": summarize(full_times),
+        "face_crop_latency": summarize(crop_times),
+        "frames_without_face": crop_labels.count(None),
+        "face_tracker": tracker.stats(),
+        "agreement": round(sum(a == b for a, b in zip(full_labels, crop_labels)) / max(1, len(frames)), 3),
+    }
+    if args.label:
+        label = args.label.lower()
+        report["full_frame_accuracy"] = round(sum(l.lower() == label for l in full_labels) / max(1, len(frames)), 3)
+        report["face_crop_accuracy"] = round(
+            sum(l is not None and l.lower() == label for l in crop_labels) / max(1, len(frames)), 3)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
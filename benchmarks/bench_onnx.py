@@ -0,0 +1,90 @@
+"""
+PyTorch pipeline vs int8 ONNX Runtime for the emotion classifiers.
+
+Each runtime is measured in a fresh process (so load time and RSS are not
+shared): time to load the classifier, per-image (face) or per-clip (audio)
+latency over --runs calls, and peak resident memory. Export the ONNX
+artifacts first with `python -m interview_core.onnx_models face audio`.
+
+Usage:
+    python benchmarks/bench_onnx.py [face|audio ...] [--runs 20]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+SNIPPET = """
+import json, time
+import numpy as np
+from interview_core import models
+from interview_core.metrics import summarize
+from interview_core.onnx_models import EMOTION_MODELS, _sample_inputs
+
+task, model = EMOTION_MODELS[{name!r}]
+started = time.perf_counter()
+classifier = models.get_classifier(task, model)
+load_seconds = time.perf_counter() - started
+inputs = _sample_inputs(task, {runs}, seed=2)
+classifier(inputs[0])  # Warm-up
+latencies = []
+for item in inputs:
+    started = time.perf_counter()
+    classifier(item)
+    latencies.append(time.perf_counter() - started)
+
+def peak_rss_mb():
+    try:
+        import psutil
+        info = psutil.Process().memory_info()
+        return getattr(info, "peak_wset", info.rss) / 2**20
+    except ImportError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # KiB on Linux
+
+print(json.dumps({{
+    "runtime": type(classifier).__name__,
+    "load_seconds": round(load_seconds, 2),
+    "latency": summarize(latencies),
+    "peak_rss_mb": round(peak_rss_mb(), 1),
+}}))
+"""
+
+
+def measure(name, runs, use_onnx):
+    env = dict(os.environ, INTERVIEW_ONNX="1" if use_onnx else "0")
+    output = subprocess.check_output(
+        [sys.executable, "-c", SNIPPET.format(name=name, runs=runs)],
+        cwd=REPO_ROOT,
+        env=env,
+        text=True,
+    )
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    from interview_core.onnx_models import EMOTION_MODELS, has_artifact
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("models", nargs="*", default=sorted(EMOTION_MODELS), choices=sorted(EMOTION_MODELS))
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    report = {}
+    for name in args.models:
+        _, model = EMOTION_MODELS[name]
+        report[name] = {"pytorch": measure(name, args.runs, use_onnx=False)}
+        if has_artifact(model):
+            report[name]["onnx_int8"] = measure(name, args.runs, use_onnx=True)
+        else:
+            report[name]["onnx_int8"] = "not exported (python -m interview_core.onnx_models %s)" % name
+    print(json.dumps(report, indent=4))
+
+
+if __name__ == "__main__":
+    main()
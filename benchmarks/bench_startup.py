@@ -0,0 +1,74 @@
+"""
+Cold- vs warm-start cost of the shared interview engine.
+
+Cold start: a fresh Python process imports interview_core and fetches the
+Whisper model and the OpenAI client (what every script paid before).
+Warm start: the same calls again inside a process that already has them
+(what every later script, rerun or session pays now).
+
+Usage:
+    python benchmarks/bench_startup.py [--model base] [--runs 3]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+COLD_SNIPPET = """
+import json, time
+started = time.perf_counter()
+from interview_core import models
+models.get_whisper_model({model!r})
+models.get_openai_client()
+print(json.dumps({{"seconds": time.perf_counter() - started}}))
+"""
+
+
+def cold_start(model):
+    output = subprocess.check_output(
+        [sys.executable, "-c", COLD_SNIPPET.format(model=model)],
+        cwd=REPO_ROOT,
+        text=True,
+    )
+    return json.loads(output.strip().splitlines()[-1])["seconds"]
+
+
+def warm_start(model, runs):
+    from interview_core import models
+
+    models.get_whisper_model(model)
+    models.get_openai_client()
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        models.get_whisper_model(model)
+        models.get_openai_client()
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default="base")
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    cold = [cold_start(args.model) for _ in range(args.runs)]
+    warm = warm_start(args.model, args.runs)
+    print(json.dumps({
+        "model": args.model,
+        "cold_start_seconds": cold,
+        "warm_start_seconds": warm,
+        "cold_mean": sum(cold) / len(cold),
+        "warm_mean": sum(warm) / len(warm),
+    }, indent=4))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Whisper tiers on a recorded answer: per-model real-time factor, the
+transcript each tier produces, its word error rate against the largest
+tier measured, and which accurate tier auto-selection picks on this
+machine.
+
+Usage:
+    python benchmarks/bench_whisper_tiers.py [--audio recording.wav] [--models tiny base small]
+        [--max-rtf 0.5]
+"""
+
+import argparse
+import json
+import os
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from interview_core import config  # noqa: E402
+from interview_core.models import get_whisper_model  # noqa: E402
+from interview_core.replay import load_wav  # noqa: E402
+from interview_core.tiers import TIERS, measure_rtf, select_accurate_tier, word_error_rate  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--audio", default=os.path.join(REPO_ROOT, "recording.wav"))
+    parser.add_argument("--models", nargs="+", default=["tiny", "base", "small"], choices=TIERS)
+    parser.add_argument("--max-rtf", type=float, default=0.5)
+    args = parser.parse_args()
+
+    audio = load_wav(args.audio)
+    models = sorted(args.models, key=TIERS.index)
+    tiers = {}
+    for name in models:
+        model = get_whisper_model(name)
+        rtf = measure_rtf(model, audio)
+        text = model.transcribe(audio, language="en", condition_on_previous_text=False).get("text", "").strip()
+        tiers[name] = {"rtf": round(rtf, 3), "transcript": text}
+    reference = tiers[models[-1]]["transcript"]
+    for name in models:
+        tiers[name]["wer_vs_" + models[-1]] = round(word_error_rate(reference, tiers[name]["transcript"]), 3)
+
+    chosen, _ = select_accurate_tier(models[0], models[1:], max_rtf=args.max_rtf, audio=audio)
+    print(json.dumps({"audio_seconds": round(audio.size / config.SAMPLE_RATE, 2), "tiers": tiers,
+                      "auto_accurate_tier": chosen, "max_rtf": args.max_rtf}, indent=4))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Per-request overhead of the YouTube API client: building it for every
+search (unpickle the token, refresh it if expired, parse the discovery
+document, open a new connection) against the process-wide
+YouTubeClientManager (built once, credentials refreshed in the background,
+one kept-alive connection per thread).
+
+By default the Google libraries are replaced by stand-ins with the given
+costs, so no credentials or quota are needed. With --live the real token
+file and googleapiclient are used, and only client setup is timed (no
+searches are sent).
+
+Usage:
+    python benchmarks/bench_youtube_client.py [--requests 200] [--threads 4] [--latency 0.05]
+        [--handshake 0.08] [--refresh-latency 0.3] [--discovery-kb 400] [--lifetime 2]
+    python benchmarks/bench_youtube_client.py --live --requests 20
+"""
+
+import argparse
+import json
+import os
+import pickle
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from course_search.client import (TOKEN_FILE, YouTubeClientManager, build_service,  # noqa: E402
+                                  load_credentials, save_credentials)
+from course_search.fakes import FakeCredentials, FakeHttp, FakeYouTubeClient  # noqa: E402
+from interview_core.metrics import summarize  # noqa: E402
+
+
+def discovery_document(kb):
+    """A JSON document about the size of the YouTube v3 discovery document."""
+    methods = {f"method{i}": {"id": f"youtube.method{i}", "httpMethod": "GET", "path": f"resource/{i}",
+                              "parameters": {f"param{j}": {"type": "string", "location": "query"} for j in range(8)}}
+               for i in range(kb * 2)}
+    return json.dumps({"name": "youtube", "version": "v3", "resources": {"search": {"methods": methods}}})
+
+
+def stand_ins(args):
+    document = discovery_document(args.discovery_kb)
+
+    def refresh(credentials):
+        time.sleep(args.refresh_latency)
+        credentials.refresh(None)
+
+    def load(token_file, client_secrets_file=None, scopes=None):
+        with open(token_file, "rb") as token:
+            credentials = pickle.load(token)
+        if credentials.expired:
+            refresh(credentials)
+            save_credentials(credentials, token_file)
+        return credentials
+
+    def build(credentials):
+        json.loads(document)
+        return FakeYouTubeClient(latency=args.latency, handshake=args.handshake)
+
+    def connect(credentials):
+        return FakeHttp(args.handshake)
+
+    return load, build, connect, refresh
+
+
+def run(search, requests, threads):
+    def timed(i):
+        started = time.perf_counter()
+        search(f"topic {i % 10}")
+        return time.perf_counter() - started
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        started = time.perf_counter()
+        latencies = list(pool.map(timed, range(requests)))
+        wall = time.perf_counter() - started
+    return latencies, wall
+
+
+def overhead(latencies, latency):
+    stats = summarize([max(0.0, seconds - latency) for seconds in latencies])
+    return {"overhead_" + key if key != "count" else key: value for key, value in stats.items()}
+
+
+def simulated(args):
+    report = {}
+    with tempfile.TemporaryDirectory() as directory:
+        token_file = os.path.join(directory, "token.pkl")
+        save_credentials(FakeCredentials(lifetime=args.lifetime), token_file)
+        load, build, connect, refresh = stand_ins(args)
+
+        def per_request(query):
+            youtube = build(load(token_file))
+            return youtube.search().list(part="snippet", q=query, type="video", maxResults=5).execute()
+
+        latencies, wall = run(per_request, args.requests, args.threads)
+        report["per_request_client"] = {**overhead(latencies, args.latency), "wall_s": round(wall, 2)}
+
+        save_credentials(FakeCredentials(lifetime=args.lifetime), token_file)
+        manager = YouTubeClientManager(token_file, refresh_margin=args.lifetime / 2, retry_delay=1,
+                                       load=load, build=build, connect=connect, refresh=refresh)
+
+        def shared(query):
+            youtube = manager.client()
+            return manager.execute(youtube.search().list(part="snippet", q=query, type="video", maxResults=5))
+
+        latencies, wall = run(shared, args.requests, args.threads)
+        manager.close()
+        report["shared_client"] = {**overhead(latencies, args.latency), "wall_s": round(wall, 2),
+                                   "manager": manager.stats()}
+    return report
+
+
+def live(args):
+    def per_request():
+        build_service(load_credentials(TOKEN_FILE))
+
+    manager = YouTubeClientManager(TOKEN_FILE)
+    report = {}
+    for name, setup in (("per_request_client", per_request), ("shared_client", manager.client)):
+        latencies = []
+        for _ in range(args.requests):
+            started = time.perf_counter()
+            setup()
+            latencies.append(time.perf_counter() - started)
+        report[name] = {"setup": summarize(latencies)}
+    manager.close()
+    report["shared_client"]["manager"] = manager.stats()
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds the API takes per search")
+    parser.add_argument("--handshake", type=float, default=0.08, help="Seconds to open a connection")
+    parser.add_argument("--refresh-latency", type=float, default=0.3, help="Seconds per token refresh")
+    parser.add_argument("--discovery-kb", type=int, default=400, help="Size of the parsed discovery document")
+    parser.add_argument("--lifetime", type=float, default=2.0, help="Seconds the stand-in tokens stay valid")
+    parser.add_argument("--live", action="store_true", help="Time real client setup from token.pkl")
+    args = parser.parse_args()
+    print(json.dumps(live(args) if args.live else simulated(args), indent=4))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Load test for the asyncio interview service.
+
+Drives N simulated candidates through full interviews at once against a
+local stand-in LLM (FakeLLMClient) and a stand-in Whisper model, then
+reports per-answer turnaround and per-stage latency percentiles plus
+throughput as JSON. Pass --whisper to transcribe with a real Whisper model
+instead (answers are then synthetic noise, so transcripts come back empty
+and candidates retry until --max-attempts).
+
+Usage:
+    python benchmarks/load_test.py [--candidates 20] [--asr-workers 1]
+        [--llm-latency 0.3] [--asr-rtf 0.1] [--answer-seconds 5] [--whisper base]
+        [--batch 8 --batch-wait-ms 30]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from interview_core import config  # noqa: E402
+from interview_core.batching import BatchTranscriber  # noqa: E402
+from interview_core.fakes import FakeLLMClient, FakeTTSBackend, FakeWhisperModel  # noqa: E402
+from interview_core.metrics import summarize  # noqa: E402
+from interview_core.server import InterviewService  # noqa: E402
+
+
+def fake_answer(seconds, fs=config.SAMPLE_RATE):
+    return (0.05 * np.random.randn(int(seconds * fs))).astype(np.float32)
+
+
+async def candidate(service, args, turnarounds):
+    session = await service.start_session()
+    attempts = 0
+    while session.interview_state == 'waiting_for_answer' and attempts < args.max_attempts:
+        attempts += 1
+        # Reading the question and answering it takes the candidate a while.
+        await asyncio.sleep(random.uniform(0, args.think_time))
+        started = time.perf_counter()
+        await service.submit_answer(session.session_id, fake_answer(args.answer_seconds))
+        turnarounds.append(time.perf_counter() - started)
+    if session.interview_state == 'show_summary':
+        await service.finish(session.session_id)
+    service.close_session(session.session_id)
+    return session.interview_state == 'finished' and session.error is None
+
+
+async def run(args):
+    if args.whisper:
+        from interview_core import get_whisper_model
+        whisper_model = get_whisper_model(args.whisper)
+    else:
+        whisper_model = FakeWhisperModel(realtime_factor=args.asr_rtf)
+    transcriber = None
+    if args.batch > 1:
+        transcriber = BatchTranscriber(whisper_model, max_batch=args.batch, max_wait_s=args.batch_wait_ms / 1000)
+    service = InterviewService(
+        client=FakeLLMClient(first_token_latency=args.llm_latency, num_questions=args.questions),
+        whisper_model=whisper_model,
+        tts_backend=FakeTTSBackend(latency=args.tts_latency),
+        capture_emotion=(lambda session: random.choice(["happy", "neutral", "nervous"])),
+        num_questions=args.questions,
+        asr_workers=args.asr_workers,
+        tts_workers=args.tts_workers,
+        tts_cache=False,
+        transcriber=transcriber,
+    )
+    turnarounds = []
+    started = time.perf_counter()
+    # The per-call context/transcription prints would drown the report.
+    with contextlib.redirect_stdout(io.StringIO()):
+        completed = await asyncio.gather(*(candidate(service, args, turnarounds) for _ in range(args.candidates)))
+    elapsed = time.perf_counter() - started
+    service.shutdown()
+    report = {
+        "candidates": args.candidates,
+        "completed": sum(completed),
+        "answers": len(turnarounds),
+        "wall_seconds": round(elapsed, 2),
+        "answers_per_second": round(len(turnarounds) / elapsed, 2),
+        "answer_turnaround": summarize(turnarounds),
+        "stages": service.stats(),
+    }
+    if transcriber:
+        transcriber.close()
+        report["batched_asr"] = transcriber.stats()
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--candidates", type=int, default=20)
+    parser.add_argument("--questions", type=int, default=config.NUM_QUESTIONS)
+    parser.add_argument("--asr-workers", type=int, default=1)
+    parser.add_argument("--tts-workers", type=int, default=4)
+    parser.add_argument("--llm-latency", type=float, default=0.3, help="Seconds until the fake LLM answers")
+    parser.add_argument("--asr-rtf", type=float, default=0.1, help="Fake Whisper seconds per audio second")
+    parser.add_argument("--tts-latency", type=float, default=0.05, help="Fake TTS seconds per sentence")
+    parser.add_argument("--answer-seconds", type=float, default=5.0)
+    parser.add_argument("--think-time", type=float, default=1.0, help="Max random pause before each answer")
+    parser.add_argument("--max-attempts", type=int, default=20)
+    parser.add_argument("--batch", type=int, default=1, help="Micro-batch up to this many answers per Whisper pass")
+    parser.add_argument("--batch-wait-ms", type=float, default=30.0, help="How long a batch waits to fill up")
+    parser.add_argument("--whisper", default=None, help="Use this real Whisper model instead of the fake one")
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
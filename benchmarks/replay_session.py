@@ -0,0 +1,141 @@
+"""
+End-to-end latency replay of full interviews, without devices or the
+remote LLM.
+
+Runs --interviews complete interviews (NUM_QUESTIONS answers each) through
+InterviewEngine: every answer replays --audio (recording.wav by default)
+through the streaming transcriber and endpointer, --video (a file or
+"synthetic") is sampled for facial emotion while answering, replies come
+from a local OpenAI-compatible mock server over HTTP and are synthesized
+with --tts. Prints per-stage timings (capture, vad, asr, emotion, llm, tts,
+turnaround) as JSON and exits non-zero if an interview did not finish.
+
+Usage:
+    python benchmarks/replay_session.py [--audio recording.wav] [--video clip.mp4]
+        [--whisper base | --fake-asr 0.1] [--llm-latency 0.3] [--tts fake]
+        [--speed 1.0] [--interviews 1] [--output replay.json]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from interview_core import config, models  # noqa: E402
+from interview_core.engine import InterviewEngine  # noqa: E402
+from interview_core.fakes import FakeTTSBackend, FakeWhisperModel  # noqa: E402
+from interview_core.metrics import summarize  # noqa: E402
+from interview_core.replay import STAGES, MockLLMServer, ReplayTransport, load_wav  # noqa: E402
+from interview_core.server import FIRST_QUESTION_PROMPT, default_system_prompt  # noqa: E402
+from interview_core.tts import get_backend  # noqa: E402
+
+
+def emotion_sampler(args):
+    """An EmotionSampler over --video, or None without one."""
+    if not args.video:
+        return None
+    from interview_core.camera import CaptureService
+    from interview_core.dataflow import get_answer_scheduler
+    from interview_core.emotion import get_emotion_classifier
+    from interview_core.timeline import EmotionSampler, EmotionTimeline
+
+    capture = CaptureService(args.video).start()
+    if not capture.ready.wait(10):
+        raise SystemExit(f"Could not read frames from {args.video}: {capture.error}")
+    face_tracker = None
+    if not args.no_face:
+        from interview_core.face import FaceTracker
+        face_tracker = FaceTracker()
+    return EmotionSampler(capture, EmotionTimeline(), rate_hz=args.emotion_hz,
+                          classifier=get_emotion_classifier(), face_tracker=face_tracker,
+                          scheduler=get_answer_scheduler())
+
+
+def run(args):
+    server = MockLLMServer(first_token_latency=args.llm_latency, token_latency=args.token_latency,
+                           num_questions=args.questions)
+    client = models.get_openai_client(api_key="replay", base_url=server.base_url)
+    model = FakeWhisperModel(realtime_factor=args.fake_asr) if args.fake_asr else models.get_whisper_model(args.whisper)
+    tts_backend = FakeTTSBackend(latency=args.tts_latency) if args.tts == "fake" else get_backend(args.tts)
+    audio = load_wav(args.audio)
+    sampler = emotion_sampler(args)
+
+    interviews = []
+    stages = {stage: [] for stage in STAGES}
+    started = time.perf_counter()
+    for _ in range(args.interviews):
+        transport = ReplayTransport(audio, model, speed=args.speed, tail_silence=args.tail_silence,
+                                    tts_backend=tts_backend, emotion_sampler=sampler)
+        engine = InterviewEngine(default_system_prompt(args.questions), num_questions=args.questions,
+                                 client=client, stream=True)
+        interview_started = time.perf_counter()
+        # The transcriber's and engine's progress prints would drown the report.
+        with contextlib.redirect_stdout(io.StringIO()):
+            engine.run(transport, first_prompt=FIRST_QUESTION_PROMPT)
+        report = transport.report()
+        report["seconds"] = round(time.perf_counter() - interview_started, 2)
+        report["completed"] = config.CONCLUSION_PHRASE in engine.conversation[-1]["content"]
+        interviews.append(report)
+        for stage in STAGES:
+            stages[stage].extend(transport.stages[stage])
+    elapsed = time.perf_counter() - started
+    if sampler is not None:
+        sampler.capture.stop()
+    server.close()
+
+    return {
+        "audio": os.path.relpath(args.audio, REPO_ROOT),
+        "audio_seconds": round(len(audio) / config.SAMPLE_RATE, 2),
+        "video": args.video,
+        "asr": f"fake (rtf {args.fake_asr})" if args.fake_asr else args.whisper,
+        "tts": tts_backend.name,
+        "speed": args.speed,
+        "interviews": args.interviews,
+        "completed": sum(report["completed"] for report in interviews),
+        "answers": len(stages["asr"]),
+        "llm_requests": server.requests,
+        "wall_seconds": round(elapsed, 2),
+        "load_seconds": {name: round(seconds, 2) for name, seconds in models.load_times.items()},
+        "stages": {stage: summarize(values) for stage, values in stages.items()},
+        "runs": interviews,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--audio", default=os.path.join(REPO_ROOT, "recording.wav"), help="WAV file replayed as every answer")
+    parser.add_argument("--video", default=None, help="Video file (or 'synthetic') sampled for facial emotion")
+    parser.add_argument("--no-face", action="store_true", help="Classify whole frames instead of face crops")
+    parser.add_argument("--emotion-hz", type=float, default=1.0)
+    parser.add_argument("--interviews", type=int, default=1)
+    parser.add_argument("--questions", type=int, default=config.NUM_QUESTIONS)
+    parser.add_argument("--whisper", default=config.WHISPER_MODEL, help="Whisper model to transcribe with")
+    parser.add_argument("--fake-asr", type=float, default=None, metavar="RTF",
+                        help="Use the stand-in Whisper model at this real-time factor instead")
+    parser.add_argument("--llm-latency", type=float, default=0.3, help="Seconds until the mock LLM's first token")
+    parser.add_argument("--token-latency", type=float, default=0.01, help="Seconds per streamed word")
+    parser.add_argument("--tts", default="fake", choices=["fake", "espeak", "gtts", "auto"])
+    parser.add_argument("--tts-latency", type=float, default=0.05, help="Fake TTS seconds per sentence")
+    parser.add_argument("--speed", type=float, default=1.0, help="Replay speed (1 = real time, 0 = as fast as possible)")
+    parser.add_argument("--tail-silence", type=float, default=1.5, help="Silence appended after each answer")
+    parser.add_argument("--output", default=None, help="Also write the report to this file")
+    args = parser.parse_args()
+
+    report = run(args)
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    if report["completed"] < args.interviews:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
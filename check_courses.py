@@ -60,130 +60,53 @@
 #     print("\nRelated Video Links:")
 #     for link in related_videos:
 #         print(link)
-import os
-import google_auth_oauthlib.flow
-import googleapiclient.discovery
 import googleapiclient.errors
-import pickle
 import json
-# Import necessary auth libraries
-import google.auth.transport.requests
-import google.auth.exceptions # To catch refresh errors specifically
+from flask import Flask, request
+
+from course_search import (Course, CourseResults, SearchCache, courses_from_json, courses_to_json,
+                           encode_response, get_catalog, get_client_manager, parse_video_items, renumber)
+
+app = Flask(__name__)
 
 scopes = ["https://www.googleapis.com/auth/youtube.readonly"]
 token_file = "token.pkl"
 # IMPORTANT: Replace with your actual client secrets file path
 client_secrets_file = r"""c:\Users\DELL\Downloads\client_secret.json""" 
 
-def get_youtube_client():
-    os.environ["OAUTHLIB_INSECURE_TRANSPORT"] = "1" # Usually for local testing only
-
-    api_service_name = "youtube"
-    api_version = "v3"
+# Built once per process; credentials are refreshed in the background before they expire.
+youtube_clients = get_client_manager(token_file, client_secrets_file, scopes)
 
-    credentials = None
+def get_youtube_client():
+    return youtube_clients.client()
 
-    # Load existing credentials if available
-    if os.path.exists(token_file):
-        try:
-            with open(token_file, "rb") as token:
-                credentials = pickle.load(token)
-        except (EOFError, pickle.UnpicklingError, ImportError, ModuleNotFoundError) as e:
-             # Catch more potential errors during unpickling
-            print(f"Warning: Could not load token from {token_file}. Error: {e}. Re-authenticating.")
-            credentials = None # Force re-authentication
-
-    # If credentials are not available or expired, authenticate
-    # Check if credentials exist and are valid (and have the required scopes)
-    if not credentials or not credentials.valid or not all(scope in credentials.scopes for scope in scopes):
-        if credentials and credentials.expired and credentials.refresh_token:
-            print("Credentials expired, attempting refresh...")
-            try:
-                # Create a Request object for the transport
-                request_object = google.auth.transport.requests.Request()
-                # Attempt to refresh the credentials
-                credentials.refresh(request_object)
-                print("Credentials refreshed successfully.")
-                # --- IMPORTANT: Save the refreshed credentials ---
-                with open(token_file, "wb") as token:
-                    pickle.dump(credentials, token)
-                print(f"Refreshed credentials saved to {token_file}")
-                # -----------------------------------------------
-            except google.auth.exceptions.RefreshError as e:
-                print(f"Error refreshing token: {e}")
-                print("Refresh failed. Deleting potentially invalid token and re-authenticating.")
-                # If refresh fails, remove the old token file and force re-auth
-                if os.path.exists(token_file):
-                    try:
-                        os.remove(token_file)
-                    except OSError as oe:
-                         print(f"Error removing token file {token_file}: {oe}")
-                credentials = None # Force re-authentication
-            except Exception as e:
-                # Catch any other unexpected error during refresh
-                print(f"An unexpected error occurred during token refresh: {e}")
-                credentials = None # Force re-authentication
-
-        # Proceed with full flow if no valid credentials after load/refresh attempt
-        if not credentials or not credentials.valid:
-            print("No valid credentials found or refresh failed, starting authentication flow...")
-            flow = google_auth_oauthlib.flow.InstalledAppFlow.from_client_secrets_file(
-                client_secrets_file, scopes
-            )
-            # port=0 lets it pick a random available port
-            credentials = flow.run_local_server(port=0)
-
-            # Save the new credentials for future use
-            with open(token_file, "wb") as token:
-                pickle.dump(credentials, token)
-            print(f"New credentials obtained and saved to {token_file}")
-
-    # Final check before building the client
-    if not credentials or not credentials.valid:
-         # This should ideally not be reached if the logic above is correct, but as a safeguard
-         print("Error: Could not obtain valid credentials after authentication attempts.")
-         # Optionally, try deleting the token file again if it exists and might be corrupt
-         if os.path.exists(token_file):
-             try:
-                 os.remove(token_file)
-                 print(f"Removed potentially problematic token file: {token_file}. Please re-run.")
-             except OSError as oe:
-                 print(f"Error removing token file {token_file}: {oe}")
-         raise Exception("Failed to obtain valid YouTube API credentials.")
-
-
-    # Build the YouTube client
-    try:
-        return googleapiclient.discovery.build(
-            api_service_name, api_version, credentials=credentials
-        )
-    except Exception as e:
-        print(f"Error building YouTube client: {e}")
-        # Attempt to delete potentially corrupted token file if build fails
-        if os.path.exists(token_file):
-             try:
-                 os.remove(token_file)
-                 print(f"Removed potentially corrupted token file: {token_file}. Please re-run the script.")
-             except OSError as oe:
-                 print(f"Error removing token file {token_file}: {oe}")
-        raise # Re-raise the exception
 
+def _search_youtube(query, tag, max_results):
+    """
+    One live search (the cache passes the normalized query). API errors
+    propagate, so failed searches are never cached.
+    """
+    youtube = get_youtube_client()
+    request = youtube.search().list(
+        part="snippet", # Snippet contains title, description, thumbnails
+        q=query,
+        type="video",
+        maxResults=max_results
+    )
+    # Each thread sends over its own kept-alive connection.
+    return parse_video_items(youtube_clients.execute(request).get("items", []))
+
+# Repeated topics are answered from memory or disk instead of costing quota.
+search_cache = SearchCache(_search_youtube, namespace="check_courses", encode=courses_to_json,
+                           decode=courses_from_json)
 
 def get_related_videos_details(query, max_results=10):
     """
-    Searches YouTube for videos related to the query and returns details
-    in a specific list format.
+    Searches YouTube for videos related to the query and returns them as
+    Course records.
     """
-    youtube = get_youtube_client() # This now uses the corrected auth logic
-
     try:
-        request = youtube.search().list(
-            part="snippet", # Snippet contains title, description, thumbnails
-            q=query,
-            type="video",
-            maxResults=max_results
-        )
-        response = request.execute()
+        videos = search_cache.get(query, "", max_results)
     except googleapiclient.errors.HttpError as e:
         print(f"An API error occurred: {e}")
         # Handle specific errors if needed, e.g., quota exceeded
@@ -203,56 +126,24 @@ def get_related_videos_details(query, max_results=10):
         print(f"An unexpected error occurred during YouTube search: {e}")
         return []
 
-    video_details_list = []
-    items = response.get("items", [])
-
-    for i, item in enumerate(items):
-        # Ensure the item is a video and has the necessary structure
-        if item.get("id", {}).get("kind") == "youtube#video":
-            video_id = item["id"]["videoId"]
-            snippet = item.get("snippet", {})
-            title = snippet.get("title", "N/A")
-            description = snippet.get("description", "N/A")
-
-            # Get thumbnail URL (prefer high quality, fallback to default)
-            thumbnails = snippet.get("thumbnails", {})
-            thumbnail_url = thumbnails.get("high", {}).get("url") or \
-                            thumbnails.get("medium", {}).get("url") or \
-                            thumbnails.get("default", {}).get("url", None)
-
-            # --- Placeholder values for non-API fields ---
-            difficulty_level = "unknown" # Not provided by YouTube API search
-            is_free = True              # Assume free to watch (standard YouTube)
-            # ---------------------------------------------
-
-            video_data = {
-                "id": str(i + 1), # Sequential ID starting from 1
-                "title": title,
-                "description": description,
-                "difficulty_level": difficulty_level,
-                "is_free": is_free,
-                "video_id": video_id,
-                "thumbnail_url": thumbnail_url
-            }
-            video_details_list.append(video_data)
-        else:
-             print(f"Skipping item {i} as it doesn't seem to be a video result: {item.get('id')}")
+    # Fresh copies numbered from 1; the cached list is shared.
+    return renumber(videos, 1)
 
+# Courses indexed offline (python -m course_search.catalog build); None until one is built.
+catalog = get_catalog()
 
-    return video_details_list
 def Check(query):
+    """CourseResults for `query`, or None when there is no query or nothing was found."""
     if query:
-        related_videos_list = get_related_videos_details(query, max_results=5) # Limit results for demo
+        # Answered from the local catalog in milliseconds; YouTube is only searched on a miss.
+        related_videos_list = catalog.search(query, limit=5) if catalog is not None else []
+        source = "catalog"
+        if not related_videos_list:
+            related_videos_list = get_related_videos_details(query, max_results=5) # Limit results for demo
+            source = "youtube"
 
         if related_videos_list:
-            # Create the final dictionary structure
-            output_json_structure = {
-                query: related_videos_list
-            }
-
-            print("\nRelated Video Details (JSON format):")
-            # Use json.dumps for pretty printing the dictionary
-            return json.dumps(output_json_structure, indent=4)
+            return CourseResults(query, related_videos_list, source)
         else:
             print(f"No video details found for query '{query}' or an error occurred.")
     else:
@@ -260,58 +151,72 @@ def Check(query):
 # q=input("Enter search query: ")
 # print(Check(q))
 
-# ======== Course Generation with LLM ========
-@app.route("/get-courses", methods=["POST"])
+# Fallback when neither the catalog nor YouTube has anything for a topic
+hardcoded_courses = {
+    "python": [
+        Course(
+            id="1",
+            title="Python for Beginners - Full Course",
+            description="Complete Python programming course for beginners",
+            difficulty_level="beginner",
+            is_free=True,
+            video_id="rfscVS0vtbw",
+            thumbnail_url="https://i.ytimg.com/vi/rfscVS0vtbw/maxresdefault.jpg"
+        )
+    ],
+    "react": [
+        Course(
+            id="2",
+            title="React JS Full Course",
+            description="Complete React JS course for beginners",
+            difficulty_level="beginner",
+            is_free=True,
+            video_id="w7ejDZ8SWv8",
+            thumbnail_url="https://i.ytimg.com/vi/w7ejDZ8SWv8/maxresdefault.jpg"
+        )
+    ]
+}
+
+def respond(payload, status=200):
+    """Compact JSON; gzipped when accepted, 304 when the client's ETag is current."""
+    return encode_response(payload, status, request.headers.get("If-None-Match", ""),
+                           request.headers.get("Accept-Encoding", ""))
+
+# ======== Course Search ========
+@app.route("/get-courses", methods=["GET", "POST"])
 def get_courses():
-    data = request.get_json()
-    topic = data.get("topic", "").lower()
-    if topic:
-        courses= Check(topic)
-        for course in courses:
-            if not all(key in course for key in ['id', 'title', 'video_id']):
-                raise ValueError("Invalid course structure")
-        
-        return jsonify({
+    data = request.get_json(silent=True) or {}
+    topic = (data.get("topic") or request.args.get("topic", "")).strip().lower()
+    if not topic:
+        return respond({"success": False, "message": "No topic given", "courses": []}, 400)
+    try:
+        results = Check(topic)
+        if results is None:
+            raise LookupError(f"No courses found for {topic}")
+        for course in results.courses:
+            course.validate()
+
+        return respond({
             "success": True,
-            "courses": courses
+            "source": results.source,
+            "courses": results.courses
         })
-        
+
     except Exception as e:
-        print(f"Error generating courses: {str(e)}")
-        # Fallback to hardcoded courses if LLM fails
-        hardcoded_courses = {
-            "python": [
-                {
-                    "id": "1",
-                    "title": "Python for Beginners - Full Course",
-                    "description": "Complete Python programming course for beginners",
-                    "difficulty_level": "beginner",
-                    "is_free": True,
-                    "video_id": "rfscVS0vtbw",
-                    "thumbnail_url": "https://i.ytimg.com/vi/rfscVS0vtbw/maxresdefault.jpg"
-                }
-            ],
-            "react": [
-                {
-                    "id": "2",
-                    "title": "React JS Full Course",
-                    "description": "Complete React JS course for beginners",
-                    "difficulty_level": "beginner",
-                    "is_free": True,
-                    "video_id": "w7ejDZ8SWv8",
-                    "thumbnail_url": "https://i.ytimg.com/vi/w7ejDZ8SWv8/maxresdefault.jpg"
-                }
-            ]
-        }
-        
+        print(f"Error searching courses: {str(e)}")
         if topic in hardcoded_courses:
-            return jsonify({
+            return respond({
                 "success": True,
+                "source": "fallback",
                 "courses": hardcoded_courses[topic]
             })
         else:
-            return jsonify({
+            return respond({
                 "success": False,
                 "message": f"No courses found for {topic}",
                 "courses": []
-            })
\ No newline at end of file
+            })
+
+
+if __name__ == "__main__":
+    app.run(debug=False)
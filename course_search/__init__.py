@@ -0,0 +1,36 @@
+"""
+Course search shared by the course recommendation scripts
+(check_courses.py, inter_deep.py): a local catalog searched offline first,
+then YouTube results in the /get-courses course format behind a
+TTL-bounded memory + disk cache, over one process-wide API client, with
+the tiers of a topic searched concurrently.
+"""
+
+from .aggregate import CourseAggregator, merge
+from .cache import SearchCache, cache_key, normalize
+from .catalog import CourseCatalog, build_catalog, get_catalog
+from .client import YouTubeClientManager, get_client_manager
+from .records import Course, CourseResults, courses_from_json, courses_to_json
+from .serialize import dumps, encode_response
+from .youtube import parse_video_items, renumber
+
+__all__ = [
+    "Course",
+    "CourseAggregator",
+    "CourseCatalog",
+    "CourseResults",
+    "SearchCache",
+    "YouTubeClientManager",
+    "build_catalog",
+    "cache_key",
+    "courses_from_json",
+    "courses_to_json",
+    "dumps",
+    "encode_response",
+    "get_catalog",
+    "get_client_manager",
+    "merge",
+    "normalize",
+    "parse_video_items",
+    "renumber",
+]
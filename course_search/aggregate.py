@@ -0,0 +1,112 @@
+"""
+Concurrent fan-out of one topic over several course tiers.
+
+Check() searches the same topic once per tier ("beginners",
+"Complex Concepts", ...). CourseAggregator runs those searches in parallel
+on a shared thread pool, so a response takes about as long as the slowest
+tier rather than the sum of all of them. A global `deadline` bounds the
+wait: tiers that have not answered by then are left out (partial results)
+and keep running in the background, where their results still land in the
+search cache for the next request. Results are merged in tier order, with
+repeated video_ids dropped and ids renumbered from 1.
+
+The deadline is meant for the searches, not for setup: `prepare` (e.g.
+building the YouTube client, which on a cold process loads the token and
+may refresh it or run the OAuth flow) runs on the caller's thread before
+the clock starts.
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from .youtube import renumber
+
+DEFAULT_DEADLINE = float(os.environ.get("COURSE_SEARCH_DEADLINE", 3.0))
+
+
+def merge(results):
+    """Concatenates per-tier course lists, keeping the first course per video_id, renumbered from 1."""
+    seen = set()
+    merged = []
+    for courses in results:
+        for course in courses:
+            if course.video_id in seen:
+                continue
+            seen.add(course.video_id)
+            merged.append(course)
+    return renumber(merged, 1)
+
+
+class CourseAggregator:
+    """
+    Fans `search(query, tag, max_results)` (a course list, [] on failure)
+    out over tiers of (tag, max_results), after calling `prepare()` if given.
+    """
+
+    def __init__(self, search, deadline=DEFAULT_DEADLINE, max_workers=8, prepare=None):
+        self.search = search
+        self.deadline = deadline
+        self.prepare = prepare
+        self.requests = 0
+        self.partial = 0
+        self.late_tiers = 0
+        self.failed_tiers = 0
+        self.duplicates = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="course-fanout")
+        self._lock = threading.Lock()
+
+    def gather(self, query, tiers, deadline=None):
+        """Merged courses for `query` from every tier that answered within the deadline."""
+        deadline = self.deadline if deadline is None else deadline
+        if self.prepare is not None:
+            try:
+                self.prepare()
+            except Exception as e:
+                print(f"Preparing the course search failed, searching anyway: {e}")  # Cached tiers can still answer
+        started = time.perf_counter()
+        futures = [self._pool.submit(self.search, query, tag, max_results) for tag, max_results in tiers]
+        done, late = wait(futures, timeout=deadline)
+        results, failed = [], 0
+        for (tag, _), future in zip(tiers, futures):
+            if future not in done:
+                future.cancel()  # Only stops tiers still queued; running ones finish into the cache
+                print(f"Course tier '{tag}' for '{query}' missed the {deadline:.1f}s deadline, leaving it out.")
+                continue
+            try:
+                results.append(future.result())
+            except Exception as e:
+                failed += 1
+                print(f"Course tier '{tag}' for '{query}' failed: {e}")
+        merged = merge(results)
+        with self._lock:
+            self.requests += 1
+            self.partial += bool(late)
+            self.late_tiers += len(late)
+            self.failed_tiers += failed
+            self.duplicates += sum(len(courses) for courses in results) - len(merged)
+            elapsed = time.perf_counter() - started
+            self.total_seconds += elapsed
+            self.max_seconds = max(self.max_seconds, elapsed)
+        return merged
+
+    def stats(self):
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "partial": self.partial,
+                "late_tiers": self.late_tiers,
+                "failed_tiers": self.failed_tiers,
+                "duplicates": self.duplicates,
+                "mean_ms": round(1000 * self.total_seconds / self.requests, 2) if self.requests else 0.0,
+                "max_ms": round(1000 * self.max_seconds, 2),
+            }
+
+    def report(self):
+        stats = self.stats()
+        return (f"Course fan-out: {stats['requests']} requests, mean {stats['mean_ms']:.0f} ms, "
+                f"{stats['partial']} partial ({stats['late_tiers']} late tiers), "
+                f"{stats['duplicates']} duplicate videos dropped.")
@@ -0,0 +1,245 @@
+"""
+Two-tier cache in front of YouTube course searches.
+
+Every live search costs API quota and 300-800 ms, and popular topics
+("python", "react") are searched over and over. SearchCache keys results
+by the normalized (query, tag, max_results) and keeps them
+
+- in memory, least recently used evicted first beyond `max_entries`;
+- on disk as one JSON file per entry, so restarts start warm.
+
+Entries are fresh for `ttl` seconds. For a further `stale_ttl` seconds a
+stale entry is still returned immediately while a background refresh
+fetches a new one (stale-while-revalidate); after that it is fetched
+again before returning. Concurrent lookups of the same key share one
+upstream call. Failed fetches raise and are never cached.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+DEFAULT_DIR = os.environ.get(
+    "COURSE_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "course_search"),
+)
+DEFAULT_TTL = float(os.environ.get("COURSE_CACHE_TTL", 6 * 3600))
+DEFAULT_STALE_TTL = float(os.environ.get("COURSE_CACHE_STALE_TTL", 24 * 3600))
+
+
+def normalize(text):
+    """Lower-cased with runs of whitespace collapsed, so trivially different queries share an entry."""
+    return " ".join(str(text or "").lower().split())
+
+
+def cache_key(query, tag="", max_results=10):
+    return normalize(query), normalize(tag), int(max_results)
+
+
+class _Entry:
+    __slots__ = ("value", "fetched_at")
+
+    def __init__(self, value, fetched_at):
+        self.value = value
+        self.fetched_at = fetched_at
+
+
+class SearchCache:
+    """
+    Caches `fetch(query, tag, max_results)`, which receives the normalized
+    key. Returned lists are shared between callers and must not be edited.
+    `encode`/`decode` convert values to and from JSON for the disk tier
+    (e.g. records.courses_to_json / courses_from_json).
+    """
+
+    def __init__(self, fetch, namespace="default", max_entries=256, ttl=DEFAULT_TTL,
+                 stale_ttl=DEFAULT_STALE_TTL, directory=DEFAULT_DIR, refresh_workers=2, encode=None, decode=None):
+        self.fetch = fetch
+        self.encode = encode or (lambda value: value)
+        self.decode = decode or (lambda data: data)
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.directory = os.path.join(directory, namespace) if directory else None
+        self.hits = 0
+        self.stale_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.upstream_calls = 0
+        self.refresh_errors = 0
+        self._memory = OrderedDict()  # key -> _Entry, least recently used first
+        self._inflight = {}  # key -> Future of the running fetch
+        self._lock = threading.Lock()
+        self._refresher = ThreadPoolExecutor(max_workers=refresh_workers, thread_name_prefix="course-cache-refresh")
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+            self._prune_disk()
+
+    # --- Disk tier ---
+    def _path(self, key):
+        digest = hashlib.sha256(json.dumps(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, digest[:2], digest + ".json")
+
+    def _prune_disk(self):
+        """Removes entries too old to be served even as stale."""
+        cutoff = time.time() - self.ttl - self.stale_ttl
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    if name.endswith(".tmp") or os.stat(path).st_mtime < cutoff:
+                        os.remove(path)
+                except OSError:
+                    pass
+
+    def _read_disk(self, key):
+        if not self.directory:
+            return None
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if tuple(data.get("key", ())) != key:
+            return None  # Hash collision or a foreign file
+        try:
+            return _Entry(self.decode(data["value"]), data["fetched_at"])
+        except (KeyError, TypeError, ValueError):
+            return None  # Written in an older format; fetch again
+
+    def _write_disk(self, key, entry):
+        if not self.directory:
+            return
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write to a temp file first so readers never see a partial entry.
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        except OSError as e:
+            print(f"Could not write course search cache entry: {e}")
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"key": list(key), "fetched_at": entry.fetched_at, "value": self.encode(entry.value)}, f)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Could not write course search cache entry: {e}")
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    # --- Memory tier ---
+    def _remember(self, key, entry):
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def _lookup(self, key):
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                return entry
+        entry = self._read_disk(key)
+        if entry is not None:
+            with self._lock:
+                self.disk_hits += 1
+            self._remember(key, entry)
+        return entry
+
+    # --- Upstream ---
+    def _load(self, key):
+        """Fetches `key` upstream; concurrent callers for the same key wait for one fetch."""
+        with self._lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+            else:
+                self.coalesced += 1
+        if not owner:
+            return future.result()
+        try:
+            with self._lock:
+                self.upstream_calls += 1
+            value = self.fetch(*key)
+            entry = _Entry(value, time.time())
+            self._remember(key, entry)
+            self._write_disk(key, entry)
+        except BaseException as e:
+            with self._lock:
+                del self._inflight[key]
+            future.set_exception(e)
+            raise
+        with self._lock:
+            del self._inflight[key]
+        future.set_result(value)
+        return value
+
+    def _refresh(self, key):
+        try:
+            self._load(key)
+        except Exception as e:
+            with self._lock:
+                self.refresh_errors += 1
+            print(f"Background refresh of course search {key} failed, keeping the stale result: {e}")
+
+    def get(self, query, tag="", max_results=10):
+        key = cache_key(query, tag, max_results)
+        entry = self._lookup(key)
+        if entry is not None:
+            age = time.time() - entry.fetched_at
+            if age <= self.ttl:
+                with self._lock:
+                    self.hits += 1
+                return entry.value
+            if age <= self.ttl + self.stale_ttl:
+                with self._lock:
+                    self.stale_hits += 1
+                    refreshing = key in self._inflight
+                if not refreshing:
+                    self._refresher.submit(self._refresh, key)
+                return entry.value
+        with self._lock:
+            self.misses += 1
+        return self._load(key)
+
+    def invalidate(self, query, tag="", max_results=10):
+        key = cache_key(query, tag, max_results)
+        with self._lock:
+            self._memory.pop(key, None)
+        if self.directory:
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "upstream_calls": self.upstream_calls,
+                "refresh_errors": self.refresh_errors,
+                "entries": len(self._memory),
+            }
+
+    def report(self):
+        stats = self.stats()
+        lookups = stats["hits"] + stats["stale_hits"] + stats["misses"]
+        hit_rate = 100 * (stats["hits"] + stats["stale_hits"]) / lookups if lookups else 0.0
+        return (f"Course search cache: {lookups} lookups, {hit_rate:.0f}% served from cache "
+                f"({stats['stale_hits']} stale), {stats['upstream_calls']} upstream calls, "
+                f"{stats['coalesced']} coalesced.")
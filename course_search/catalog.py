@@ -0,0 +1,367 @@
+"""
+Local course catalog with offline full-text and semantic search.
+
+The catalog is built from the course datasets under backend/
+(YouTube_Video_Dataset.csv, as read by Course_Recommendation.py) and from
+the YouTube results already harvested into the search cache, and is
+answered without any network call:
+
+- an inverted index for full-text search, with BM25 weights precomputed
+  per (term, course) and stored in CSR form (`ptr`, `doc`, `weight`);
+- a row-normalized embedding matrix for semantic search, so a query is
+  one matrix-vector product.
+
+Arrays are saved as .npy files and opened with mmap_mode="r": loading is
+instant, pages are read on demand and shared between worker processes.
+A course's relevance is the share of query terms it contains blended with
+its embedding similarity. Only courses above `min_score` (or very close
+semantically) are returned, ranked by relevance and then BM25, and only
+playable ones (with a YouTube video_id) unless asked otherwise. A query
+with fewer than a full page (`limit`) of such matches is a miss, so one
+loosely related course never stands in for a proper search, and the caller
+goes upstream.
+
+The CSV datasets have no YouTube ids, so their rows are never served to
+/get-courses: they only shape the index (term statistics, document
+lengths) and answer `search(..., playable=False)`. Everything served comes
+from harvested YouTube results.
+
+Build (or rebuild) it with:
+
+    python -m course_search.catalog build [--csv path.csv ...] [--no-harvest]
+"""
+
+import argparse
+import csv
+import json
+import math
+import os
+import re
+import shutil
+import threading
+import time
+import zlib
+from collections import Counter
+
+import numpy as np
+
+from .cache import DEFAULT_DIR as CACHE_DIR
+from .records import Course
+from .youtube import renumber
+
+FORMAT_VERSION = 1
+DEFAULT_DIR = os.environ.get(
+    "COURSE_CATALOG_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "course_catalog"),
+)
+DEFAULT_CSVS = [os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                             "backend", "YouTube_Video_Dataset.csv")]
+DIFFICULTY = {"easy": "beginner", "medium": "intermediate", "hard": "advanced"}
+STOPWORDS = frozenset("a an and are as at be by course courses for from how in into is it its of on or "
+                      "the this to with your you learn".split())
+_WORD = re.compile(r"[a-z0-9+#]+")
+
+
+def tokenize(text):
+    return [word for word in _WORD.findall(str(text or "").lower()) if word not in STOPWORDS]
+
+
+# --- Sources ---
+def records_from_csv(path):
+    """Courses from a Name/Description/Topics Covered/Subject/Difficulty dataset (no YouTube ids)."""
+    with open(path, newline="", encoding="utf-8") as f:
+        return [{
+            "title": row.get("Name", "").strip(),
+            "description": row.get("Description", "").strip(),
+            "difficulty_level": DIFFICULTY.get(row.get("Difficulty", "").strip().lower(), "unknown"),
+            "is_free": True,
+            "video_id": "",
+            "thumbnail_url": None,
+            "topics": row.get("Topics Covered", "").strip(),
+            "subject": row.get("Subject", "").strip(),
+        } for row in csv.DictReader(f) if row.get("Name")]
+
+
+def harvest_search_cache(directory=CACHE_DIR):
+    """Courses from every entry SearchCache has written to disk, tagged with the query that found them."""
+    records = []
+    for root, _, files in os.walk(directory):
+        for name in files:
+            if not name.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(root, name), encoding="utf-8") as f:
+                    entry = json.load(f)
+                query, tag, _ = entry["key"]
+                videos = entry["value"]
+            except (OSError, ValueError, KeyError, TypeError):
+                continue
+            for video in videos:
+                records.append(dict(video, topics=query, subject=tag))
+    return records
+
+
+def dedupe(records):
+    """First record per video_id (per title for courses without one)."""
+    seen = set()
+    unique = []
+    for record in records:
+        key = record.get("video_id") or "title:" + record.get("title", "").lower()
+        if key not in seen:
+            seen.add(key)
+            unique.append(record)
+    return unique
+
+
+def _document(record):
+    # The title counts twice: it is the best summary of what a course covers.
+    return " ".join([record.get("title", "")] * 2 + [record.get(field, "") for field in
+                                                     ("topics", "subject", "description")])
+
+
+# --- Embeddings ---
+class HashingEmbedder:
+    """
+    Dependency-free embeddings: word and character-trigram features hashed
+    into `dim` signed buckets (stable across processes), L2-normalized.
+    Trigrams make "javascript" close to "java script" and catch plural and
+    misspelled forms.
+    """
+
+    name = "hashing"
+
+    def __init__(self, dim=512):
+        self.dim = dim
+
+    def _features(self, text):
+        features = []
+        for word in tokenize(text):
+            features.append(("w:" + word, 1.0))
+            padded = f"<{word}>"
+            features.extend(("c:" + padded[i:i + 3], 0.5) for i in range(len(padded) - 2))
+        return features
+
+    def encode(self, texts):
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature, weight in self._features(text):
+                digest = zlib.crc32(feature.encode("utf-8"))
+                matrix[row, digest % self.dim] += weight if digest & 0x80000000 else -weight
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / np.maximum(norms, 1e-9)
+
+
+class SentenceTransformerEmbedder:
+    """The sentence-transformers model Course_Recommendation.py uses (needs the package)."""
+
+    def __init__(self, model="all-mpnet-base-v2"):
+        from sentence_transformers import SentenceTransformer
+        self.name = "sentence-transformers:" + model
+        self._model = SentenceTransformer(model)
+        self.dim = self._model.get_sentence_embedding_dimension()
+
+    def encode(self, texts):
+        return self._model.encode(list(texts), normalize_embeddings=True).astype(np.float32)
+
+
+def make_embedder(name, dim=512):
+    if name == "hashing":
+        return HashingEmbedder(dim)
+    if name.startswith("sentence-transformers:"):
+        return SentenceTransformerEmbedder(name.split(":", 1)[1])
+    raise ValueError(f"Unknown catalog embedder: {name}")
+
+
+# --- Build ---
+def build_catalog(records, directory=DEFAULT_DIR, embedder=None, k1=1.2, b=0.75):
+    """
+    Indexes `records` into `directory`, replacing any previous catalog
+    only once the new one is complete. Returns the number of courses.
+    """
+    embedder = embedder or HashingEmbedder()
+    records = dedupe(records)
+    documents = [tokenize(_document(record)) for record in records]
+    lengths = np.array([len(tokens) for tokens in documents], dtype=np.float32)
+    avgdl = float(lengths.mean()) if len(records) else 0.0
+
+    postings = {}  # term -> [(doc, tf)]
+    for doc, tokens in enumerate(documents):
+        for term, tf in Counter(tokens).items():
+            postings.setdefault(term, []).append((doc, tf))
+    terms = sorted(postings)
+    ptr = np.zeros(len(terms) + 1, dtype=np.int64)
+    docs, weights = [], []
+    for row, term in enumerate(terms):
+        entries = postings[term]
+        idf = math.log(1 + (len(records) - len(entries) + 0.5) / (len(entries) + 0.5))
+        for doc, tf in entries:
+            docs.append(doc)
+            weights.append(idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * lengths[doc] / avgdl)))
+        ptr[row + 1] = len(docs)
+
+    staging = directory.rstrip(os.sep) + ".building"
+    shutil.rmtree(staging, ignore_errors=True)
+    os.makedirs(staging)
+    np.save(os.path.join(staging, "ptr.npy"), ptr)
+    np.save(os.path.join(staging, "doc.npy"), np.array(docs, dtype=np.int32))
+    np.save(os.path.join(staging, "weight.npy"), np.array(weights, dtype=np.float32))
+    np.save(os.path.join(staging, "embeddings.npy"),
+            embedder.encode([_document(record) for record in records]) if records
+            else np.zeros((0, embedder.dim), dtype=np.float32))
+    with open(os.path.join(staging, "terms.json"), "w", encoding="utf-8") as f:
+        json.dump(terms, f)
+    with open(os.path.join(staging, "records.json"), "w", encoding="utf-8") as f:
+        json.dump(records, f)
+    with open(os.path.join(staging, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump({"version": FORMAT_VERSION, "courses": len(records), "terms": len(terms),
+                   "embedder": embedder.name, "dim": embedder.dim, "built_at": time.time()}, f)
+
+    previous = directory.rstrip(os.sep) + ".previous"
+    shutil.rmtree(previous, ignore_errors=True)
+    if os.path.exists(directory):
+        os.replace(directory, previous)
+    os.replace(staging, directory)
+    shutil.rmtree(previous, ignore_errors=True)
+    return len(records)
+
+
+# --- Search ---
+class CourseCatalog:
+    """
+    A built catalog, memory-mapped from `directory`. `search` returns
+    Course records (ids from 1), or [] on a miss.
+    """
+
+    def __init__(self, directory=DEFAULT_DIR, lexical_weight=0.5, min_score=0.6, semantic_threshold=0.6):
+        with open(os.path.join(directory, "meta.json"), encoding="utf-8") as f:
+            self.meta = json.load(f)
+        if self.meta.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Course catalog in {directory} has format {self.meta.get('version')}, "
+                             f"expected {FORMAT_VERSION}; rebuild it.")
+        self.directory = directory
+        self.lexical_weight = lexical_weight
+        self.min_score = min_score
+        self.semantic_threshold = semantic_threshold
+        self.embedder = make_embedder(self.meta["embedder"], self.meta["dim"])
+        with open(os.path.join(directory, "terms.json"), encoding="utf-8") as f:
+            self.terms = {term: row for row, term in enumerate(json.load(f))}
+        with open(os.path.join(directory, "records.json"), encoding="utf-8") as f:
+            # Row numbers as ids; search results are renumbered anyway.
+            self.courses = [Course.from_dict(dict(record, id=row + 1)) for row, record in enumerate(json.load(f))]
+        self.playable = np.array([bool(course.video_id) for course in self.courses], dtype=bool)
+        self.ptr = np.load(os.path.join(directory, "ptr.npy"), mmap_mode="r")
+        self.doc = np.load(os.path.join(directory, "doc.npy"), mmap_mode="r")
+        self.weight = np.load(os.path.join(directory, "weight.npy"), mmap_mode="r")
+        self.embeddings = np.load(os.path.join(directory, "embeddings.npy"), mmap_mode="r")
+        self.hits = 0
+        self.misses = 0
+        self.search_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.courses)
+
+    def lexical_scores(self, query):
+        """(BM25 score, share of the query's terms present) per course."""
+        scores = np.zeros(len(self.courses), dtype=np.float32)
+        matched = np.zeros(len(self.courses), dtype=np.float32)
+        terms = set(tokenize(query))
+        for term in terms:
+            row = self.terms.get(term)
+            if row is not None:
+                start, end = self.ptr[row], self.ptr[row + 1]
+                np.add.at(scores, self.doc[start:end], self.weight[start:end])
+                np.add.at(matched, self.doc[start:end], 1.0)
+        return scores, matched / max(len(terms), 1)
+
+    def semantic_scores(self, query):
+        if not self.courses:
+            return np.zeros(0, dtype=np.float32)
+        return self.embeddings @ self.embedder.encode([query])[0]
+
+    def relevance(self, query):
+        """(relevance in [0, 1], BM25 score) per course."""
+        lexical, coverage = self.lexical_scores(query)
+        semantic = self.semantic_scores(query)
+        return self.lexical_weight * coverage + (1 - self.lexical_weight) * semantic, lexical, semantic
+
+    def search(self, query, limit=5, playable=True, min_results=None):
+        """
+        Courses relevant enough to serve instead of searching upstream; [] on
+        a miss, i.e. fewer than `min_results` (default `limit`) strong matches.
+        """
+        started = time.perf_counter()
+        relevance, lexical, semantic = self.relevance(query)
+        matched = (relevance >= self.min_score) | (semantic >= self.semantic_threshold)
+        if playable:
+            matched &= self.playable
+        candidates = np.flatnonzero(matched)
+        results = []
+        if candidates.size and candidates.size >= (limit if min_results is None else min_results):
+            order = candidates[np.lexsort((-lexical[candidates], -relevance[candidates]))][:limit]
+            results = renumber([self.courses[i] for i in order], 1)
+        with self._lock:
+            self.hits += bool(results)
+            self.misses += not results
+            self.search_seconds += time.perf_counter() - started
+        return results
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "courses": len(self.courses),
+                "terms": len(self.terms),
+                "embedder": self.meta["embedder"],
+                "hits": self.hits,
+                "misses": self.misses,
+                "mean_ms": round(1000 * self.search_seconds / lookups, 3) if lookups else 0.0,
+            }
+
+    def report(self):
+        stats = self.stats()
+        return (f"Course catalog: {stats['courses']} courses, {stats['hits']} hits / {stats['misses']} misses, "
+                f"{stats['mean_ms']:.2f} ms per search.")
+
+
+_catalogs = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_catalog(directory=DEFAULT_DIR):
+    """Process-wide CourseCatalog for `directory`, or None when none has been built yet."""
+    with _catalogs_lock:
+        if directory not in _catalogs:
+            try:
+                _catalogs[directory] = CourseCatalog(directory)
+                print(f"Course catalog loaded: {len(_catalogs[directory])} courses from {directory}.")
+            except (OSError, ValueError) as e:
+                print(f"No usable course catalog in {directory}, searching YouTube only: {e}")
+                _catalogs[directory] = None
+        return _catalogs[directory]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the local course catalog.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    build = subparsers.add_parser("build")
+    build.add_argument("--csv", nargs="+", default=DEFAULT_CSVS, help="Name/Description/... datasets")
+    build.add_argument("--cache-dir", default=CACHE_DIR, help="SearchCache directory to harvest")
+    build.add_argument("--no-harvest", action="store_true", help="Index the datasets only")
+    build.add_argument("--output", default=DEFAULT_DIR)
+    build.add_argument("--embedder", default="hashing",
+                       help="'hashing' or 'sentence-transformers:<model>'")
+    args = parser.parse_args()
+
+    records = []
+    for path in args.csv:
+        records.extend(records_from_csv(path))
+    if not args.no_harvest:
+        records.extend(harvest_search_cache(args.cache_dir))
+    started = time.perf_counter()
+    count = build_catalog(records, args.output, make_embedder(args.embedder))
+    print(f"Indexed {count} courses into {args.output} in {time.perf_counter() - started:.2f}s.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+"""
+Process-wide YouTube Data API client.
+
+Building a client per search re-reads and unpickles the token file, may
+refresh the credentials, and parses the API discovery document again in
+`googleapiclient.discovery.build`. YouTubeClientManager does all of that
+once per process and then
+
+- refreshes the credentials on a background thread `refresh_margin`
+  seconds before they expire (and saves them back to the token file), so
+  no search pays for a token refresh;
+- gives every thread its own authorized httplib2 connection (httplib2 is
+  not thread-safe), kept alive across that thread's requests.
+
+Google libraries are imported on first use, like the heavy models in
+interview_core.
+"""
+
+import datetime
+import os
+import pickle
+import tempfile
+import threading
+import time
+
+SCOPES = ["https://www.googleapis.com/auth/youtube.readonly"]
+TOKEN_FILE = os.environ.get("YOUTUBE_TOKEN_FILE", "token.pkl")
+# IMPORTANT: Replace with your actual client secrets file path
+CLIENT_SECRETS_FILE = os.environ.get("YOUTUBE_CLIENT_SECRETS", r"""c:\Users\DELL\Downloads\client_secret.json""")
+
+
+def _remove_token(token_file, reason):
+    if os.path.exists(token_file):
+        try:
+            os.remove(token_file)
+            print(f"Removed {reason} token file: {token_file}.")
+        except OSError as oe:
+            print(f"Error removing token file {token_file}: {oe}")
+
+
+def save_credentials(credentials, token_file=TOKEN_FILE):
+    """Pickles `credentials` to `token_file` via a temp file, so readers never see a partial token."""
+    directory = os.path.dirname(os.path.abspath(token_file))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "wb") as token:
+        pickle.dump(credentials, token)
+    os.replace(tmp_path, token_file)
+
+
+def load_credentials(token_file=TOKEN_FILE, client_secrets_file=CLIENT_SECRETS_FILE, scopes=SCOPES):
+    """
+    Valid credentials from `token_file`, refreshed if expired, or from the
+    interactive OAuth flow when there are none (saved back either way).
+    """
+    import google.auth.exceptions
+    import google.auth.transport.requests
+    import google_auth_oauthlib.flow
+
+    os.environ["OAUTHLIB_INSECURE_TRANSPORT"] = "1"  # Usually for local testing only
+    credentials = None
+
+    # Load existing credentials if available
+    if os.path.exists(token_file):
+        try:
+            with open(token_file, "rb") as token:
+                credentials = pickle.load(token)
+        except (EOFError, pickle.UnpicklingError, ImportError, ModuleNotFoundError) as e:
+            print(f"Warning: Could not load token from {token_file}. Error: {e}. Re-authenticating.")
+            credentials = None
+
+    # Check if credentials exist and are valid (and have the required scopes)
+    if not credentials or not credentials.valid or not all(scope in credentials.scopes for scope in scopes):
+        if credentials and credentials.expired and credentials.refresh_token:
+            print("Credentials expired, attempting refresh...")
+            try:
+                credentials.refresh(google.auth.transport.requests.Request())
+                save_credentials(credentials, token_file)
+                print(f"Credentials refreshed and saved to {token_file}")
+            except google.auth.exceptions.RefreshError as e:
+                print(f"Error refreshing token: {e}")
+                _remove_token(token_file, "invalid")
+                credentials = None
+            except Exception as e:
+                print(f"An unexpected error occurred during token refresh: {e}")
+                credentials = None
+
+        # Proceed with full flow if no valid credentials after load/refresh attempt
+        if not credentials or not credentials.valid:
+            print("No valid credentials found or refresh failed, starting authentication flow...")
+            flow = google_auth_oauthlib.flow.InstalledAppFlow.from_client_secrets_file(client_secrets_file, scopes)
+            credentials = flow.run_local_server(port=0)  # port=0 lets it pick a random available port
+            save_credentials(credentials, token_file)
+            print(f"New credentials obtained and saved to {token_file}")
+
+    if not credentials or not credentials.valid:
+        _remove_token(token_file, "potentially problematic")
+        raise Exception("Failed to obtain valid YouTube API credentials.")
+    return credentials
+
+
+def build_service(credentials):
+    """The YouTube v3 resource (parses the discovery document)."""
+    import googleapiclient.discovery
+    return googleapiclient.discovery.build("youtube", "v3", credentials=credentials, cache_discovery=False)
+
+
+def authorized_http(credentials, timeout=30):
+    """A fresh authorized httplib2 connection for one thread."""
+    import google_auth_httplib2
+    import httplib2
+    return google_auth_httplib2.AuthorizedHttp(credentials, http=httplib2.Http(timeout=timeout))
+
+
+def refresh_credentials(credentials):
+    import google.auth.transport.requests
+    credentials.refresh(google.auth.transport.requests.Request())
+
+
+def _utcnow():
+    # google-auth keeps `expiry` as a naive UTC datetime.
+    return datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+
+
+class YouTubeClientManager:
+    """
+    One YouTube resource and one set of credentials for the process. Use
+    `execute(request)` (not `request.execute()`) so each thread sends over
+    its own connection.
+
+    The loader, builder, connection factory and refresher are parameters
+    so benchmarks can swap in stand-ins for the Google libraries.
+    """
+
+    def __init__(self, token_file=TOKEN_FILE, client_secrets_file=CLIENT_SECRETS_FILE, scopes=SCOPES,
+                 refresh_margin=300, retry_delay=60, load=load_credentials, build=build_service,
+                 connect=authorized_http, refresh=refresh_credentials):
+        self.token_file = token_file
+        self.client_secrets_file = client_secrets_file
+        self.scopes = scopes
+        self.refresh_margin = refresh_margin
+        self.retry_delay = retry_delay
+        self.builds = 0
+        self.connections = 0
+        self.requests = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+        self.build_seconds = 0.0
+        self._load = load
+        self._build = build
+        self._connect = connect
+        self._refresh = refresh
+        self._credentials = None
+        self._service = None
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._refresher = None
+
+    @property
+    def credentials(self):
+        self.client()
+        return self._credentials
+
+    def client(self):
+        """The shared YouTube resource, built on first use."""
+        service = self._service
+        if service is not None:
+            return service
+        with self._lock:
+            if self._service is None:
+                started = time.perf_counter()
+                credentials = self._load(self.token_file, self.client_secrets_file, self.scopes)
+                try:
+                    service = self._build(credentials)
+                except Exception as e:
+                    print(f"Error building YouTube client: {e}")
+                    _remove_token(self.token_file, "potentially corrupted")
+                    raise
+                self._credentials = credentials
+                self._service = service
+                self.builds += 1
+                self.build_seconds += time.perf_counter() - started
+                self._start_refresher()
+            return self._service
+
+    def http(self):
+        """This thread's authorized connection, opened on its first request."""
+        http = getattr(self._local, "http", None)
+        if http is None:
+            http = self._local.http = self._connect(self.credentials)
+            with self._lock:
+                self.connections += 1
+        return http
+
+    def execute(self, request):
+        """Runs a request built from `client()` over this thread's connection."""
+        with self._lock:
+            self.requests += 1
+        return request.execute(http=self.http())
+
+    # --- Proactive credential refresh ---
+    def _start_refresher(self):
+        if self._refresher is None and getattr(self._credentials, "refresh_token", None):
+            self._refresher = threading.Thread(target=self._refresh_loop, name="youtube-credentials", daemon=True)
+            self._refresher.start()
+
+    def _seconds_until_refresh(self):
+        expiry = getattr(self._credentials, "expiry", None)
+        if expiry is None:
+            return None
+        return (expiry - _utcnow()).total_seconds() - self.refresh_margin
+
+    def _refresh_loop(self):
+        while not self._stop.is_set():
+            wait = self._seconds_until_refresh()
+            if wait is None:
+                return  # Credentials that never expire
+            if wait > 0:
+                self._stop.wait(wait)
+                continue
+            try:
+                self._refresh(self._credentials)
+                save_credentials(self._credentials, self.token_file)
+                with self._lock:
+                    self.refreshes += 1
+                if self._seconds_until_refresh() <= 0:
+                    self._stop.wait(self.retry_delay)  # Lifetime shorter than the margin, don't spin
+            except Exception as e:
+                with self._lock:
+                    self.refresh_errors += 1
+                print(f"Background refresh of YouTube credentials failed, retrying in {self.retry_delay}s: {e}")
+                self._stop.wait(self.retry_delay)
+
+    def close(self):
+        self._stop.set()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "builds": self.builds,
+                "build_ms": round(1000 * self.build_seconds, 2),
+                "connections": self.connections,
+                "requests": self.requests,
+                "refreshes": self.refreshes,
+                "refresh_errors": self.refresh_errors,
+            }
+
+    def report(self):
+        stats = self.stats()
+        return (f"YouTube client: built {stats['builds']}x ({stats['build_ms']:.0f} ms), "
+                f"{stats['requests']} requests over {stats['connections']} connections, "
+                f"{stats['refreshes']} background credential refreshes.")
+
+
+_managers = {}
+_managers_lock = threading.Lock()
+
+
+def get_client_manager(token_file=TOKEN_FILE, client_secrets_file=CLIENT_SECRETS_FILE, scopes=SCOPES):
+    """Process-wide YouTubeClientManager per token file."""
+    with _managers_lock:
+        manager = _managers.get(token_file)
+        if manager is None:
+            manager = _managers[token_file] = YouTubeClientManager(token_file, client_secrets_file, scopes)
+    return manager
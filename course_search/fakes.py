@@ -0,0 +1,116 @@
+"""
+Stand-in for the YouTube Data API client, so the course search layer can
+be exercised and benchmarked without credentials, network or quota.
+"""
+
+import datetime
+import hashlib
+import threading
+import time
+
+
+class _Request:
+
+    def __init__(self, client, q, max_results):
+        self._client = client
+        self._q = q
+        self._max_results = max_results
+
+    def execute(self, http=None):
+        return self._client.execute(self._q, self._max_results, http)
+
+
+class _Search:
+
+    def __init__(self, client):
+        self._client = client
+
+    def list(self, part="snippet", q="", type="video", maxResults=5, **params):
+        return _Request(self._client, q, maxResults)
+
+
+class FakeApiError(Exception):
+    """Raised by FakeYouTubeClient for an injected failure."""
+
+
+class FakeHttp:
+    """A keep-alive connection: the first request over it pays `handshake` seconds (TCP + TLS setup)."""
+
+    def __init__(self, handshake=0.0):
+        self.handshake = handshake
+        self.connected = False
+
+    def request(self):
+        if not self.connected:
+            time.sleep(self.handshake)
+            self.connected = True
+
+
+class FakeCredentials:
+    """Picklable stand-in for OAuth user credentials that expire `lifetime` seconds after each refresh."""
+
+    def __init__(self, lifetime=3600, scopes=("https://www.googleapis.com/auth/youtube.readonly",)):
+        self.lifetime = lifetime
+        self.scopes = list(scopes)
+        self.refresh_token = "fake-refresh-token"
+        self.refreshes = 0
+        self.refresh(None)
+
+    def refresh(self, request):
+        self.refreshes += 1
+        self.token = f"fake-token-{self.refreshes}"
+        now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+        self.expiry = now + datetime.timedelta(seconds=self.lifetime)
+
+    @property
+    def expired(self):
+        return datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None) >= self.expiry
+
+    @property
+    def valid(self):
+        return not self.expired
+
+
+class FakeYouTubeClient:
+    """
+    Mimics `googleapiclient.discovery.build("youtube", "v3", ...)` for
+    `search().list(...).execute(http=None)`: every call sleeps `latency`
+    seconds and returns `max_results` deterministic video results for the
+    query. Requests without an `http` go over the client's own connection,
+    which pays `handshake` once. While `failures` is above zero each call
+    raises FakeApiError instead (and counts it down), like a quota or
+    network error.
+    """
+
+    def __init__(self, latency=0.4, handshake=0.0, failures=0):
+        self.latency = latency
+        self.failures = failures
+        self.calls = 0
+        self._http = FakeHttp(handshake)
+        self._lock = threading.Lock()
+
+    def search(self):
+        return _Search(self)
+
+    def execute(self, q, max_results, http=None):
+        with self._lock:
+            self.calls += 1
+            failing = self.failures > 0
+            self.failures -= failing
+        (http or self._http).request()
+        time.sleep(self.latency)
+        if failing:
+            raise FakeApiError(f"Fake search for {q!r} failed")
+        items = []
+        for i in range(max_results):
+            video_id = hashlib.sha1(f"{q}:{i}".encode("utf-8")).hexdigest()[:11]
+            items.append({
+                "kind": "youtube#searchResult",
+                "id": {"kind": "youtube#video", "videoId": video_id},
+                "snippet": {
+                    "title": f"{q} - part {i + 1}",
+                    "description": f"Video {i + 1} about {q}.",
+                    "thumbnails": {"high": {"url": f"https://i.ytimg.com/vi/{video_id}/hqdefault.jpg"}},
+                },
+            })
+        return {"kind": "youtube#searchListResponse", "items": items}
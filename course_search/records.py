@@ -0,0 +1,82 @@
+"""
+Typed course results.
+
+Courses travel from the YouTube parser, the search cache and the catalog
+to the /get-courses response as Course records: slotted, so a cached
+result list costs a few pointers per course instead of a dict each, and
+with a fixed set of fields, so a malformed course cannot reach a client.
+Records are shared between cached lists and must not be edited; use
+`with_id` for a renumbered copy.
+"""
+
+FIELDS = ("id", "title", "description", "difficulty_level", "is_free", "video_id", "thumbnail_url")
+
+
+class Course:
+    __slots__ = FIELDS
+
+    def __init__(self, id, title, description="N/A", difficulty_level="unknown", is_free=True, video_id="",
+                 thumbnail_url=None):
+        self.id = str(id)
+        self.title = title
+        self.description = description
+        self.difficulty_level = difficulty_level
+        self.is_free = is_free
+        self.video_id = video_id
+        self.thumbnail_url = thumbnail_url
+
+    @classmethod
+    def from_dict(cls, data):
+        """From a course dict; keys outside FIELDS (catalog topics, subject) are ignored."""
+        return cls(**{field: data[field] for field in FIELDS if field in data})
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in FIELDS}
+
+    def with_id(self, id):
+        course = Course.__new__(Course)
+        for field in FIELDS:
+            setattr(course, field, getattr(self, field))
+        course.id = str(id)
+        return course
+
+    def validate(self):
+        """Raises ValueError unless the course can be listed and played (an id, a title and a video_id)."""
+        if not self.id or not self.title or not self.video_id:
+            raise ValueError(f"Invalid course structure: {self!r}")
+        return self
+
+    def __eq__(self, other):
+        return isinstance(other, Course) and all(getattr(self, f) == getattr(other, f) for f in FIELDS)
+
+    def __repr__(self):
+        return f"Course(id={self.id!r}, title={self.title!r}, video_id={self.video_id!r})"
+
+
+class CourseResults:
+    """The courses found for one topic, and where they came from ("catalog", "youtube" or "fallback")."""
+
+    __slots__ = ("topic", "courses", "source")
+
+    def __init__(self, topic, courses, source):
+        self.topic = topic
+        self.courses = courses
+        self.source = source
+
+    def __len__(self):
+        return len(self.courses)
+
+    def to_dict(self):
+        return {"topic": self.topic, "source": self.source, "courses": [course.to_dict() for course in self.courses]}
+
+    def __repr__(self):
+        return f"CourseResults(topic={self.topic!r}, source={self.source!r}, courses={self.courses!r})"
+
+
+def courses_to_json(courses):
+    """Course records as plain dicts (the search cache's on-disk format)."""
+    return [course.to_dict() for course in courses]
+
+
+def courses_from_json(data):
+    return [Course.from_dict(item) for item in data]
@@ -0,0 +1,63 @@
+"""
+JSON responses for the course routes.
+
+Payloads (dicts, lists and Course records) are encoded straight to compact
+UTF-8 bytes: with orjson when it is installed, otherwise with the standard
+library and no whitespace. `encode_response` adds a weak ETag over the
+encoded body, answers a matching If-None-Match with 304 and an empty body,
+and gzips larger bodies for clients that accept it. It returns the
+(body, status, headers) tuple Flask views can return as is.
+"""
+
+import gzip
+import hashlib
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+GZIP_MIN_BYTES = 512
+
+
+def _default(obj):
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    raise TypeError(f"{type(obj).__name__} is not JSON serializable")
+
+
+def dumps(payload):
+    """Compact JSON bytes for `payload`."""
+    if orjson is not None:
+        return orjson.dumps(payload, default=_default)
+    return json.dumps(payload, default=_default, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def etag_for(body):
+    # Weak: the gzipped and identity encodings of a body are the same representation.
+    return 'W/"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def _matches(if_none_match, etag):
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison: W/"x" and "x" match.
+    opaque = etag[2:]
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def encode_response(payload, status=200, if_none_match="", accept_encoding="", min_gzip=GZIP_MIN_BYTES):
+    """(body, status, headers) for `payload`; 304 with no body when the client's copy is current."""
+    body = dumps(payload)
+    etag = etag_for(body)
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+    if status == 200 and _matches(if_none_match, etag):
+        return b"", 304, headers
+    headers["Content-Type"] = "application/json"
+    if len(body) >= min_gzip and "gzip" in (accept_encoding or "").lower():
+        body = gzip.compress(body, compresslevel=6)
+        headers["Content-Encoding"] = "gzip"
+    return body, status, headers
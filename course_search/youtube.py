@@ -0,0 +1,38 @@
+"""
+YouTube search results as the Course records the /get-courses route returns.
+"""
+
+from .records import Course
+
+
+def parse_video_items(items, start=1):
+    """
+    Courses for the video results of a search().list() response, with
+    sequential string ids from `start`. Non-video results are skipped.
+    """
+    videos = []
+    for i, item in enumerate(items):
+        if item.get("id", {}).get("kind") != "youtube#video":
+            print(f"Skipping item {i} as it doesn't seem to be a video result: {item.get('id')}")
+            continue
+        snippet = item.get("snippet", {})
+        # Prefer the high quality thumbnail, fall back to smaller ones.
+        thumbnails = snippet.get("thumbnails", {})
+        thumbnail_url = (thumbnails.get("high", {}).get("url")
+                         or thumbnails.get("medium", {}).get("url")
+                         or thumbnails.get("default", {}).get("url"))
+        videos.append(Course(
+            id=start + len(videos),
+            title=snippet.get("title", "N/A"),
+            description=snippet.get("description", "N/A"),
+            difficulty_level="unknown",  # Not provided by YouTube search
+            is_free=True,  # Standard YouTube videos are free to watch
+            video_id=item["id"]["videoId"],
+            thumbnail_url=thumbnail_url,
+        ))
+    return videos
+
+
+def renumber(videos, start=1):
+    """Copies of `videos` with sequential ids from `start` (cached lists are shared, never edit them)."""
+    return [video.with_id(start + i) for i, video in enumerate(videos)]
@@ -60,130 +60,50 @@
 #     print("\nRelated Video Links:")
 #     for link in related_videos:
 #         print(link)
-import os
-import google_auth_oauthlib.flow
-import googleapiclient.discovery
 import googleapiclient.errors
-import pickle
 import json
-# Import necessary auth libraries
-import google.auth.transport.requests
-import google.auth.exceptions # To catch refresh errors specifically
+
+from course_search import (CourseAggregator, CourseResults, SearchCache, courses_from_json, courses_to_json,
+                           get_client_manager, parse_video_items, renumber)
 
 scopes = ["https://www.googleapis.com/auth/youtube.readonly"]
 token_file = "token.pkl"
 # IMPORTANT: Replace with your actual client secrets file path
 client_secrets_file = r"""c:\Users\DELL\Downloads\client_secret.json""" 
 
-def get_youtube_client():
-    os.environ["OAUTHLIB_INSECURE_TRANSPORT"] = "1" # Usually for local testing only
-
-    api_service_name = "youtube"
-    api_version = "v3"
-
-    credentials = None
-
-    # Load existing credentials if available
-    if os.path.exists(token_file):
-        try:
-            with open(token_file, "rb") as token:
-                credentials = pickle.load(token)
-        except (EOFError, pickle.UnpicklingError, ImportError, ModuleNotFoundError) as e:
-             # Catch more potential errors during unpickling
-            print(f"Warning: Could not load token from {token_file}. Error: {e}. Re-authenticating.")
-            credentials = None # Force re-authentication
-
-    # If credentials are not available or expired, authenticate
-    # Check if credentials exist and are valid (and have the required scopes)
-    if not credentials or not credentials.valid or not all(scope in credentials.scopes for scope in scopes):
-        if credentials and credentials.expired and credentials.refresh_token:
-            print("Credentials expired, attempting refresh...")
-            try:
-                # Create a Request object for the transport
-                request_object = google.auth.transport.requests.Request()
-                # Attempt to refresh the credentials
-                credentials.refresh(request_object)
-                print("Credentials refreshed successfully.")
-                # --- IMPORTANT: Save the refreshed credentials ---
-                with open(token_file, "wb") as token:
-                    pickle.dump(credentials, token)
-                print(f"Refreshed credentials saved to {token_file}")
-                # -----------------------------------------------
-            except google.auth.exceptions.RefreshError as e:
-                print(f"Error refreshing token: {e}")
-                print("Refresh failed. Deleting potentially invalid token and re-authenticating.")
-                # If refresh fails, remove the old token file and force re-auth
-                if os.path.exists(token_file):
-                    try:
-                        os.remove(token_file)
-                    except OSError as oe:
-                         print(f"Error removing token file {token_file}: {oe}")
-                credentials = None # Force re-authentication
-            except Exception as e:
-                # Catch any other unexpected error during refresh
-                print(f"An unexpected error occurred during token refresh: {e}")
-                credentials = None # Force re-authentication
-
-        # Proceed with full flow if no valid credentials after load/refresh attempt
-        if not credentials or not credentials.valid:
-            print("No valid credentials found or refresh failed, starting authentication flow...")
-            flow = google_auth_oauthlib.flow.InstalledAppFlow.from_client_secrets_file(
-                client_secrets_file, scopes
-            )
-            # port=0 lets it pick a random available port
-            credentials = flow.run_local_server(port=0)
-
-            # Save the new credentials for future use
-            with open(token_file, "wb") as token:
-                pickle.dump(credentials, token)
-            print(f"New credentials obtained and saved to {token_file}")
-
-    # Final check before building the client
-    if not credentials or not credentials.valid:
-         # This should ideally not be reached if the logic above is correct, but as a safeguard
-         print("Error: Could not obtain valid credentials after authentication attempts.")
-         # Optionally, try deleting the token file again if it exists and might be corrupt
-         if os.path.exists(token_file):
-             try:
-                 os.remove(token_file)
-                 print(f"Removed potentially problematic token file: {token_file}. Please re-run.")
-             except OSError as oe:
-                 print(f"Error removing token file {token_file}: {oe}")
-         raise Exception("Failed to obtain valid YouTube API credentials.")
+# Built once per process; credentials are refreshed in the background before they expire.
+youtube_clients = get_client_manager(token_file, client_secrets_file, scopes)
 
+def get_youtube_client():
+    return youtube_clients.client()
 
-    # Build the YouTube client
-    try:
-        return googleapiclient.discovery.build(
-            api_service_name, api_version, credentials=credentials
-        )
-    except Exception as e:
-        print(f"Error building YouTube client: {e}")
-        # Attempt to delete potentially corrupted token file if build fails
-        if os.path.exists(token_file):
-             try:
-                 os.remove(token_file)
-                 print(f"Removed potentially corrupted token file: {token_file}. Please re-run the script.")
-             except OSError as oe:
-                 print(f"Error removing token file {token_file}: {oe}")
-        raise # Re-raise the exception
 
+def _search_youtube(query, tag, max_results):
+    """
+    One live search (the cache passes the normalized query). API errors
+    propagate, so failed searches are never cached.
+    """
+    youtube = get_youtube_client()
+    request = youtube.search().list(
+        part="snippet", # Snippet contains title, description, thumbnails
+        q="Courses on "+ query +" for "+tag,
+        type="video",
+        maxResults=max_results
+    )
+    # Each thread sends over its own kept-alive connection.
+    return parse_video_items(youtube_clients.execute(request).get("items", []))
+
+# Repeated topics are answered from memory or disk instead of costing quota.
+search_cache = SearchCache(_search_youtube, namespace="inter_deep", encode=courses_to_json,
+                           decode=courses_from_json)
 
 def get_related_videos_details(query,tag,start, max_results=10):
     """
-    Searches YouTube for videos related to the query and returns details
-    in a specific list format.
+    Searches YouTube for videos related to the query and returns them as
+    Course records.
     """
-    youtube = get_youtube_client() # This now uses the corrected auth logic
-
     try:
-        request = youtube.search().list(
-            part="snippet", # Snippet contains title, description, thumbnails
-            q="Courses on "+ query +" for "+tag,
-            type="video",
-            maxResults=max_results
-        )
-        response = request.execute()
+        videos = search_cache.get(query, tag, max_results)
     except googleapiclient.errors.HttpError as e:
         print(f"An API error occurred: {e}")
         # Handle specific errors if needed, e.g., quota exceeded
@@ -203,60 +123,22 @@ def get_related_videos_details(query,tag,start, max_results=10):
         print(f"An unexpected error occurred during YouTube search: {e}")
         return []
 
-    video_details_list = []
-    items = response.get("items", [])
-
-    for i, item in enumerate(items):
-        # Ensure the item is a video and has the necessary structure
-        # if i==2:
-        #     break
-        if item.get("id", {}).get("kind") == "youtube#video":
-            video_id = item["id"]["videoId"]
-            snippet = item.get("snippet", {})
-            title = snippet.get("title", "N/A")
-            description = snippet.get("description", "N/A")
+    # Fresh copies numbered from `start`; the cached list is shared.
+    return renumber(videos, start)
 
-            # Get thumbnail URL (prefer high quality, fallback to default)
-            thumbnails = snippet.get("thumbnails", {})
-            thumbnail_url = thumbnails.get("high", {}).get("url") or \
-                            thumbnails.get("medium", {}).get("url") or \
-                            thumbnails.get("default", {}).get("url", None)
+# (tag, max_results) searched per topic, merged in this order. Limit results for demo.
+course_tiers = [("beginners", 2), ("Complex Concepts", 2)]
+# All tiers are searched at once; a tier slower than the deadline is left out. The client is
+# built first, so a cold start (token load, refresh or OAuth flow) doesn't eat into the deadline.
+course_aggregator = CourseAggregator(lambda query, tag, max_results: get_related_videos_details(query, tag, 1, max_results),
+                                     prepare=get_youtube_client)
 
-            # --- Placeholder values for non-API fields ---
-            difficulty_level = "unknown" # Not provided by YouTube API search
-            is_free = True              # Assume free to watch (standard YouTube)
-            # ---------------------------------------------
-
-            video_data = {
-                "id": str(start), # Sequential ID starting from 1
-                "title": title,
-                "description": description,
-                "difficulty_level": difficulty_level,
-                "is_free": is_free,
-                "video_id": video_id,
-                "thumbnail_url": thumbnail_url
-            }
-            video_details_list.append(video_data)
-            start += 1
-        else:
-             print(f"Skipping item {i} as it doesn't seem to be a video result: {item.get('id')}")
-
-
-    return video_details_list
 def Check(query):
+    """CourseResults for `query`, or None when there is no query or nothing was found."""
     if query:
-        related_videos_list = get_related_videos_details(query,"beginners",1, max_results=2) # Limit results for demo
-        # related_videos_list.extend(get_related_videos_details(query,"",3, max_results=2)) # Limit results for demo
-        related_videos_list.extend(get_related_videos_details(query,"Complex Concepts",3, max_results=2)) # Limit results for demo
+        related_videos_list = course_aggregator.gather(query, course_tiers)
         if related_videos_list:
-            # Create the final dictionary structure
-            output_json_structure = {
-                query: related_videos_list
-            }
-
-            print("\nRelated Video Details (JSON format):")
-            # Use json.dumps for pretty printing the dictionary
-            return json.dumps(output_json_structure, indent=4)
+            return CourseResults(query, related_videos_list, "youtube")
         else:
             print(f"No video details found for query '{query}' or an error occurred.")
     else:
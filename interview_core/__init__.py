@@ -0,0 +1,76 @@
+"""
+Shared building blocks for the AI voice interviewer scripts
+(backend.py, audio_test.py, AIInterviewer.py, Interviewer.py, ...).
+
+Heavy objects (Whisper, the OpenAI client, transformers pipelines) are
+loaded lazily, once per process, through interview_core.models.
+"""
+
+from .audio import play_mp3, record_answer, speak, synthesize_mp3, synthesize_text, transcribe
+from .audio_emotion import AudioEmotionScorer
+from .batching import BatchTranscriber, get_batch_transcriber
+from .camera import CaptureService, get_capture_service
+from .context import ConversationContext, estimate_tokens
+from .dataflow import DataflowScheduler, Stage, StageDropped, get_answer_scheduler
+from .engine import InterviewEngine
+from .media_server import MediaServer, media_url
+from .models import get_classifier, get_openai_client, get_pipeline, get_whisper_model
+from .server import InterviewService, InterviewSession
+from .streaming import RingBuffer, StreamingTranscriber
+from .transport import TextTransport, Transport, VoiceTransport
+from .timeline import EmotionSampler, EmotionTimeline
+from .tracing import Tracer, get_tracer
+from .tts import EspeakBackend, GTTSBackend, TTSBackend, get_backend, presynthesize, synthesize_batch
+from .tts_cache import TTSCache, get_tts_cache
+from .vad import EnergyEndpointer, TrimStats, VadStats, record_until_silence, trim_silence
+
+__all__ = [
+    "AudioEmotionScorer",
+    "BatchTranscriber",
+    "CaptureService",
+    "ConversationContext",
+    "DataflowScheduler",
+    "EmotionSampler",
+    "EmotionTimeline",
+    "EnergyEndpointer",
+    "EspeakBackend",
+    "GTTSBackend",
+    "InterviewEngine",
+    "InterviewService",
+    "InterviewSession",
+    "MediaServer",
+    "RingBuffer",
+    "Stage",
+    "StageDropped",
+    "StreamingTranscriber",
+    "TextTransport",
+    "TTSBackend",
+    "TTSCache",
+    "Tracer",
+    "Transport",
+    "TrimStats",
+    "VadStats",
+    "VoiceTransport",
+    "estimate_tokens",
+    "get_answer_scheduler",
+    "get_backend",
+    "get_batch_transcriber",
+    "get_capture_service",
+    "get_classifier",
+    "get_openai_client",
+    "get_pipeline",
+    "get_tracer",
+    "get_tts_cache",
+    "get_whisper_model",
+    "media_url",
+    "play_mp3",
+    "presynthesize",
+    "record_answer",
+    "record_until_silence",
+    "speak",
+    "synthesize_batch",
+    "synthesize_mp3",
+    "synthesize_text",
+    "transcribe",
+    "trim_silence",
+]
@@ -0,0 +1,62 @@
+"""
+Microphone, Whisper and speech helpers shared by all interviewer scripts.
+"""
+
+from . import config, tts
+from .models import get_whisper_model
+from .tracing import span
+from .tts import play_mp3
+from .vad import EnergyEndpointer, record_until_silence, trim_silence
+
+
+def record_answer(max_duration, fs=config.SAMPLE_RATE, vad_stats=None):
+    """
+    Records from the microphone until the candidate stops speaking (or
+    `max_duration` seconds pass) and trims leading/trailing silence.
+    Returns a 1D float32 numpy array normalized to [-1, 1].
+    """
+    print("Recording your answer...")
+    endpointer = EnergyEndpointer(fs=fs, trailing_silence_s=config.TRAILING_SILENCE_SECONDS)
+    with span("record"):
+        recording = record_until_silence(max_duration, fs, endpointer)
+    print("Recording complete.")
+    audio, stats = trim_silence(recording, fs)
+    if vad_stats is not None:
+        vad_stats.add(stats)
+    print(f"Trimmed {100 * stats.trimmed_ratio:.1f}% of samples as silence.")
+    return audio
+
+
+def transcribe(audio, model=None, fs=config.SAMPLE_RATE, language="en"):
+    """Transcribes a numpy array with the shared Whisper model."""
+    if audio is None or audio.size < fs * 0.5:
+        print("Transcription skipped: No valid audio data.")
+        return ""
+    model = model or get_whisper_model()
+    print("Transcribing your answer...")
+    with span("transcribe", audio_seconds=round(audio.size / fs, 2)):
+        result = model.transcribe(audio, language=language)
+    return result.get("text", "").strip()
+
+
+def synthesize_mp3(text, lang='en', cache=True):
+    """Converts text to MP3 bytes using gTTS, going through the TTS cache."""
+    return tts.synthesize(text, lang, tts.get_backend("gtts"), cache)
+
+
+def synthesize_text(text, lang='en'):
+    """
+    MP3 for a whole utterance, synthesized (and cached) sentence by sentence
+    so phrases shared between utterances are only synthesized once.
+    """
+    return tts.synthesize_utterance(text, lang, tts.get_backend("gtts"))
+
+
+def speak(text, lang='en', backend=None):
+    """
+    Converts text to speech with the configured TTS backend and plays it.
+    Local PCM backends are played directly without an MP3 round-trip.
+    """
+    backend = backend or tts.get_backend()
+    print("Speaking out:", text)
+    tts.play(tts.synthesize_utterance(text, lang, backend), backend)
@@ -0,0 +1,105 @@
+"""
+Voice emotion scored from the live microphone buffer.
+
+audiotest.py used to record a separate clip, write it to temp_audio.wav and
+hand the file name to the audio-classification pipeline, which read and
+resampled it again. An AudioEmotionScorer instead reads sliding windows
+straight out of the RingBuffer a StreamingTranscriber is already filling,
+so transcription and voice emotion share one capture and one buffer, with
+no file I/O. Windows are classified as in-memory float32 arrays on a worker
+thread and collected in an EmotionTimeline (one answer per start/stop), so
+the interview summary can merge them with the facial timeline.
+"""
+
+import threading
+
+import numpy as np
+
+from . import config
+from .models import get_classifier
+from .timeline import EmotionTimeline
+from .tracing import span
+
+AUDIO_EMOTION_MODEL = "Hatman/audio-emotion-detection"
+
+
+def get_audio_emotion_classifier():
+    """The voice emotion classifier (the int8 ONNX export when available)."""
+    return get_classifier("audio-classification", AUDIO_EMOTION_MODEL)
+
+
+def classify_audio(audio, fs=config.SAMPLE_RATE, classifier=None):
+    """{label: score} for a float32 mono clip."""
+    classifier = classifier or get_audio_emotion_classifier()
+    # As in emotion.classify_frames: top_k=None would still cut the scores to the top 5
+    predictions = classifier({"raw": audio, "sampling_rate": fs}, top_k=classifier.model.config.num_labels)
+    return {p["label"]: p["score"] for p in predictions}
+
+
+class AudioEmotionScorer:
+
+    def __init__(self, classifier=None, fs=config.SAMPLE_RATE, window_seconds=3.0, hop_seconds=1.5,
+                 min_tail_seconds=1.0, silence_rms=0.01, timeline=None):
+        self.classifier = classifier
+        self.fs = fs
+        self.window = int(window_seconds * fs)
+        self.hop = int(hop_seconds * fs)
+        self.min_tail = int(min_tail_seconds * fs)
+        self.silence_rms = silence_rms
+        self.timeline = timeline or EmotionTimeline()
+        self.windows_scored = 0
+        self.windows_silent = 0
+        self._buffer = None
+        self._next_start = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self, buffer):
+        """Starts scoring new audio arriving in `buffer` (a streaming.RingBuffer)."""
+        self.stop()
+        self._buffer = buffer
+        self._next_start = buffer.written
+        self.timeline.begin_answer()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="audio-emotion", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Scores what is left of the recording and returns this answer's
+        timeline summary (None if no voiced window was scored).
+        """
+        if self._thread is None:
+            return None
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        # A trailing partial window is still worth scoring if it is long enough.
+        end = self._buffer.written
+        if end - self._next_start >= self.min_tail:
+            self._score(max(self._next_start, end - self.window), end)
+        return self.timeline.end_answer()
+
+    def _run(self):
+        classifier = self.classifier or get_audio_emotion_classifier()
+        self.classifier = classifier
+        while not self._stop.wait(0.1):
+            while self._buffer.written - self._next_start >= self.window and not self._stop.is_set():
+                start = self._next_start
+                self._next_start += self.hop
+                self._score(start, start + self.window)
+
+    def _score(self, start, end):
+        audio, start = self._buffer.read(start, end)
+        if audio.size == 0:
+            return
+        if float(np.sqrt(np.mean(audio ** 2))) < self.silence_rms:
+            self.windows_silent += 1
+            return
+        try:
+            with span("emotion.voice", seconds=round(audio.size / self.fs, 2)):
+                scores = classify_audio(audio, self.fs, self.classifier)
+            self.timeline.add(scores)
+            self.windows_scored += 1
+        except Exception as e:
+            print(f"Audio emotion scoring failed: {e}")
@@ -0,0 +1,168 @@
+"""
+Micro-batched Whisper transcription shared by concurrent sessions.
+
+Instead of every session calling `model.transcribe` on its own answer (and
+queueing behind the others on the one shared model), sessions submit their
+audio to a BatchTranscriber. Its worker thread waits up to `max_wait_s` for
+more utterances to arrive, pads them all to Whisper's 30 s window and runs a
+single batched log-mel/encoder/decoder pass, then resolves each caller's
+future with its own text.
+
+get_batch_transcriber() keeps one BatchTranscriber per Whisper model for
+the whole process, so the final passes of every Streamlit session meet in
+the same batches.
+
+Utterances longer than one window go through `model.transcribe` on their
+own. Models without the openai-whisper internals (e.g. the load-test fake)
+are batched through their `transcribe_batch` method if they have one, or
+transcribed one by one.
+"""
+
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+
+from . import config
+from .metrics import Histogram, summarize
+from .models import get_whisper_model
+
+WINDOW_SECONDS = 30  # Whisper's fixed input length
+
+
+class BatchTranscriber:
+
+    def __init__(self, model, max_batch=8, max_wait_s=0.03, language="en", fs=config.SAMPLE_RATE, history=1000):
+        self.model = model
+        self.max_batch = max_batch
+        self.max_wait_s = max_wait_s
+        self.language = language
+        self.fs = fs
+        self.batch_sizes = Histogram([1, 2, 4, 8, 16, 32])
+        self.batch_latency = Histogram([50, 100, 250, 500, 1000, 2500, 5000], unit="ms")
+        self.batch_seconds = deque(maxlen=history)  # Latest `history` batches
+        self.wait_seconds = deque(maxlen=history)  # Time each utterance spent queued before its batch started
+        self._queue = queue.Queue()
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, name="whisper-batcher", daemon=True)
+        self._worker.start()
+
+    def submit(self, audio):
+        """Queues a float32 mono utterance; returns a Future with its text."""
+        future = Future()
+        if self._closed:
+            future.set_exception(RuntimeError("BatchTranscriber is closed"))
+            return future
+        if audio is None or audio.size < self.fs * 0.5:
+            future.set_result("")
+            return future
+        self._queue.put((audio, future, time.perf_counter()))
+        return future
+
+    def transcribe(self, audio, timeout=None):
+        """Blocking convenience wrapper around submit()."""
+        return self.submit(audio).result(timeout)
+
+    def close(self):
+        self._closed = True
+        self._queue.put(None)
+        self._worker.join()
+
+    def _collect(self):
+        """Blocks for the first utterance, then gathers more until the batch is full or max_wait_s passes."""
+        first = self._queue.get()
+        if first is None:
+            return None
+        batch = [first]
+        deadline = time.perf_counter() + self.max_wait_s
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is None:
+                self._queue.put(None)  # Finish this batch, stop on the next loop
+                break
+            batch.append(item)
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            if batch is None:
+                return
+            started = time.perf_counter()
+            self.wait_seconds.extend(started - queued for _, _, queued in batch)
+            try:
+                texts = self._transcribe_batch([audio for audio, _, _ in batch])
+            except Exception as e:
+                for _, future, _ in batch:
+                    future.set_exception(e)
+                continue
+            finally:
+                elapsed = time.perf_counter() - started
+                self.batch_seconds.append(elapsed)
+                self.batch_sizes.add(len(batch))
+                self.batch_latency.add(1000 * elapsed)
+            for (_, future, _), text in zip(batch, texts):
+                future.set_result(text.strip())
+
+    def _transcribe_batch(self, audios):
+        if not hasattr(self.model, "dims"):
+            if hasattr(self.model, "transcribe_batch"):
+                return self.model.transcribe_batch(audios, language=self.language)
+            return [self.model.transcribe(audio, language=self.language).get("text", "") for audio in audios]
+
+        texts = [None] * len(audios)
+        short = [i for i, audio in enumerate(audios) if len(audio) <= WINDOW_SECONDS * self.fs]
+        for i in set(range(len(audios))) - set(short):
+            texts[i] = self.model.transcribe(audios[i], language=self.language).get("text", "")
+        if short:
+            for i, text in zip(short, self._decode([audios[i] for i in short])):
+                texts[i] = text
+        return texts
+
+    def _decode(self, audios):
+        import torch
+        import whisper
+
+        mel = torch.stack([
+            whisper.log_mel_spectrogram(whisper.pad_or_trim(torch.from_numpy(audio)), n_mels=self.model.dims.n_mels)
+            for audio in audios
+        ]).to(self.model.device)
+        options = whisper.DecodingOptions(
+            language=self.language,
+            without_timestamps=True,
+            fp16=self.model.device.type != "cpu",
+        )
+        return [result.text for result in whisper.decode(self.model, mel, options)]
+
+    def report(self):
+        return (f"Batched ASR: {self.batch_sizes.total} batches, sizes {self.batch_sizes.buckets()}, "
+                f"latency {self.batch_latency.buckets()}, queue wait p95 "
+                f"{summarize(self.wait_seconds).get('p95_ms', 0)} ms.")
+
+    def stats(self):
+        return {
+            "batches": self.batch_sizes.total,
+            "batch_size_histogram": self.batch_sizes.buckets(),
+            "batch_latency_histogram": self.batch_latency.buckets(),
+            "batch_latency": summarize(self.batch_seconds),
+            "queue_wait": summarize(self.wait_seconds),
+        }
+
+
+_batchers = {}
+_batchers_lock = threading.Lock()
+
+
+def get_batch_transcriber(model_name=config.WHISPER_FAST_MODEL):
+    """Process-wide BatchTranscriber over the shared Whisper model `model_name`."""
+    with _batchers_lock:
+        if model_name not in _batchers:
+            _batchers[model_name] = BatchTranscriber(get_whisper_model(model_name))
+    return _batchers[model_name]
@@ -0,0 +1,238 @@
+"""
+Long-lived webcam capture for emotion sampling.
+
+Opening the camera for every answer costs hundreds of milliseconds (device
+open plus auto-exposure warm-up) and the first frame is often dark. A
+CaptureService opens the source once, keeps reading it in a background
+thread and holds only the most recent frame in a single slot, so callers
+never wait on the device:
+
+- latest_frame() returns the newest frame immediately (or None before the
+  first one arrives);
+- sample(n, interval) collects n distinct frames spaced `interval` seconds
+  apart from the running stream.
+
+Sources: a device index (opened with DirectShow on Windows, V4L2 on Linux,
+then OpenCV's default backend), a video file path (looped at its native
+frame rate), or "synthetic" for a generated test pattern that needs neither
+a camera nor OpenCV.
+"""
+
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+
+from . import config
+from .metrics import RateMeter
+
+
+class SyntheticSource:
+    """
+    cv2.VideoCapture-like source producing BGR frames: a drifting gradient
+    with a bright oval standing in for a face.
+    """
+
+    def __init__(self, width=640, height=480, fps=30.0):
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self._index = 0
+        self._next_time = time.perf_counter()
+        ys, xs = np.mgrid[0:height, 0:width]
+        self._base = ((xs + ys) % 256).astype(np.uint8)
+        cy, cx = height // 2, width // 2
+        self._face = ((xs - cx) / (width * 0.15)) ** 2 + ((ys - cy) / (height * 0.25)) ** 2 <= 1
+
+    def isOpened(self):
+        return True
+
+    def read(self):
+        # Pace like a real camera.
+        delay = self._next_time - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        self._next_time = max(self._next_time + 1 / self.fps, time.perf_counter())
+        gray = np.roll(self._base, self._index * 2, axis=1)
+        frame = np.stack([gray, gray // 2, 255 - gray], axis=-1)
+        frame[self._face] = (180, 200, 230)
+        self._index += 1
+        return True, frame
+
+    def get(self, prop):
+        return self.fps
+
+    def release(self):
+        pass
+
+
+def _camera_backends(cv2):
+    if sys.platform.startswith("win"):
+        return [cv2.CAP_DSHOW, cv2.CAP_ANY]
+    if sys.platform.startswith("linux"):
+        return [cv2.CAP_V4L2, cv2.CAP_ANY]
+    return [cv2.CAP_ANY]
+
+
+def open_source(source):
+    """
+    Opens `source` and returns (capture, is_file). Raises RuntimeError if no
+    backend can open it.
+    """
+    if isinstance(source, str) and source.strip().lower() == "synthetic":
+        return SyntheticSource(), False
+    if isinstance(source, str) and source.strip().isdigit():
+        source = int(source)
+
+    import cv2
+
+    if isinstance(source, str):
+        if not os.path.exists(source):
+            raise RuntimeError(f"Video file not found: {source}")
+        capture = cv2.VideoCapture(source)
+        if not capture.isOpened():
+            raise RuntimeError(f"Cannot open video file: {source}")
+        return capture, True
+
+    for backend in _camera_backends(cv2):
+        capture = cv2.VideoCapture(source, backend)
+        if capture.isOpened():
+            return capture, False
+        capture.release()
+    raise RuntimeError(f"Cannot open camera {source}")
+
+
+class CaptureService:
+
+    def __init__(self, source=config.CAMERA_SOURCE, warmup_frames=5, reopen_delay=1.0):
+        self.source = source
+        self.warmup_frames = warmup_frames
+        self.reopen_delay = reopen_delay
+        self.frames_read = 0
+        self.fps = RateMeter()
+        self.error = None
+        self.ready = threading.Event()  # Set once warm-up frames have been discarded
+        self._frame = None
+        self._frame_time = 0.0
+        self._frame_index = 0
+        self._condition = threading.Condition()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="camera-capture", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                capture, is_file = open_source(self.source)
+            except Exception as e:
+                self.error = str(e)
+                print(f"Camera capture: {e}")
+                self._stop.wait(self.reopen_delay)
+                continue
+            self.error = None
+            try:
+                self._read_loop(capture, is_file)
+            finally:
+                capture.release()
+
+    def _read_loop(self, capture, is_file):
+        fps = capture.get(5) if is_file else 0  # 5 == cv2.CAP_PROP_FPS
+        frame_interval = 1 / fps if fps and fps > 0 else 0
+        next_time = time.perf_counter()
+        skipped = 0
+        while not self._stop.is_set():
+            ok, frame = capture.read()
+            if not ok:
+                if is_file:
+                    capture.set(1, 0)  # 1 == cv2.CAP_PROP_POS_FRAMES: loop the clip
+                    continue
+                self.error = "Camera stopped delivering frames"
+                self._stop.wait(self.reopen_delay)
+                return
+            if frame_interval:
+                # Files decode faster than real time; play them at their frame rate.
+                next_time += frame_interval
+                delay = next_time - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            self.frames_read += 1
+            self.fps.tick()
+            if skipped < self.warmup_frames:
+                # Auto-exposure is still settling; these are usually dark.
+                skipped += 1
+                continue
+            with self._condition:
+                self._frame = frame
+                self._frame_time = time.time()
+                self._frame_index += 1
+                self._condition.notify_all()
+            self.ready.set()
+
+    def latest_frame(self, with_time=False):
+        """
+        The newest BGR frame without waiting, or None if none has arrived.
+        Frames are replaced, never modified, so callers may keep a reference.
+        """
+        with self._condition:
+            frame, frame_time = self._frame, self._frame_time
+        if with_time:
+            return frame, frame_time
+        return frame
+
+    def wait_frame(self, timeout=None, after=0):
+        """Waits for a frame newer than index `after`; returns (frame, index) or (None, after)."""
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._frame_index > after, timeout):
+                return None, after
+            return self._frame, self._frame_index
+
+    def sample(self, n, interval=0.2, timeout=None):
+        """
+        Collects up to `n` distinct frames at least `interval` seconds apart.
+        Returns early with what it has if no new frame arrives in `timeout`
+        (default: 1 s plus the interval).
+        """
+        timeout = timeout if timeout is not None else 1.0 + interval
+        frames = []
+        frame, index = self.wait_frame(timeout)  # The current frame, if there is one
+        while frame is not None:
+            frames.append(frame)
+            if len(frames) >= n or self._stop.wait(interval):
+                break
+            frame, index = self.wait_frame(timeout, index)
+        return frames
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+_services = {}
+_services_lock = threading.Lock()
+
+
+def get_capture_service(source=None):
+    """Process-wide running CaptureService for `source` (default: CAMERA_SOURCE)."""
+    source = config.CAMERA_SOURCE if source is None else source
+    key = str(source)
+    with _services_lock:
+        service = _services.get(key)
+        if service is None:
+            service = _services[key] = CaptureService(source)
+        return service.start()
@@ -0,0 +1,26 @@
+import os
+
+# NVIDIA's OpenAI-compatible endpoint used by every interviewer script.
+BASE_URL = "https://integrate.api.nvidia.com/v1"
+API_KEY = os.environ.get(
+    "NVIDIA_API_KEY",
+    "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",
+)
+
+LLM_MODEL = "meta/llama-3.3-70b-instruct"
+WHISPER_MODEL = os.environ.get("WHISPER_MODEL", "base")  # Options: "tiny", "base", "small", "medium", "large"
+# Tiered transcription (see interview_core.tiers): a fast speculative pass,
+# rescored by a larger model picked from measured CPU throughput ("auto").
+WHISPER_FAST_MODEL = os.environ.get("WHISPER_FAST_MODEL", "tiny")
+WHISPER_ACCURATE_MODEL = os.environ.get("WHISPER_ACCURATE_MODEL", "auto")
+SAMPLE_RATE = 16000
+NUM_QUESTIONS = 5
+TRAILING_SILENCE_SECONDS = 1.2
+
+CONCLUSION_PHRASE = "Thank you for appearing for the interview"
+
+# Webcam for emotion capture: a device index, a video file path or "synthetic".
+CAMERA_SOURCE = os.environ.get("CAMERA_SOURCE", "0")
+
+# Write a Chrome trace of the pipeline stages to this file (see interview_core.tracing).
+TRACE_PATH = os.environ.get("INTERVIEW_TRACE")
@@ -0,0 +1,125 @@
+"""
+Bounded prompt context for the interviewer LLM.
+
+Resending the whole conversation every turn makes prompt tokens grow
+quadratically over an interview. ConversationContext keeps the system
+prompt and the last few question/answer exchanges verbatim and folds older
+exchanges into a compact per-question scorecard appended to the system
+prompt, all under a hard token budget.
+"""
+
+import re
+
+_WORD = re.compile(r"\w+|[^\w\s]")
+MESSAGE_OVERHEAD_TOKENS = 4  # Role markers and separators per chat message
+
+
+def estimate_tokens(text):
+    """
+    Cheap local token estimate (no tokenizer download): Llama-style BPE
+    vocabularies average roughly 0.75 words or 4 characters per token.
+    """
+    if not text:
+        return 0
+    pieces = len(_WORD.findall(text))
+    return max(int(pieces * 1.1), len(text) // 4)
+
+
+def count_message_tokens(messages):
+    return sum(estimate_tokens(m["content"]) + MESSAGE_OVERHEAD_TOKENS for m in messages)
+
+
+def _shorten(text, limit):
+    text = " ".join(text.split())
+    return text if len(text) <= limit else text[:limit - 3].rstrip() + "..."
+
+
+class ConversationContext:
+
+    def __init__(self, keep_turns=2, max_tokens=1500, question_chars=100, answer_chars=160):
+        self.keep_turns = keep_turns
+        self.max_tokens = max_tokens
+        self.question_chars = question_chars
+        self.answer_chars = answer_chars
+        self._scorecard = []   # One line per compacted question
+        self._compacted = 0    # Number of conversation messages (after the system prompt) folded in
+        self.full_tokens_total = 0
+        self.sent_tokens_total = 0
+        self.turns = 0
+
+    def _exchanges(self, turns):
+        """Splits turns into exchanges, each starting at an assistant message."""
+        exchanges = []
+        for message in turns:
+            if message["role"] == "assistant" or not exchanges:
+                exchanges.append([message])
+            else:
+                exchanges[-1].append(message)
+        return exchanges
+
+    def _scorecard_line(self, number, exchange):
+        question = " ".join(m["content"] for m in exchange if m["role"] == "assistant")
+        answer = " ".join(m["content"] for m in exchange if m["role"] == "user")
+        return (f"Q{number}: {_shorten(question, self.question_chars)} "
+                f"A: {_shorten(answer, self.answer_chars) or '(no answer)'}")
+
+    def _compact(self, turns, keep_turns):
+        """Folds every exchange older than the last `keep_turns` into the scorecard."""
+        exchanges = self._exchanges(turns[self._compacted:])
+        while len(exchanges) > keep_turns:
+            exchange = exchanges.pop(0)
+            # Instructions without an answer (e.g. "Please ask the first question") just drop out.
+            if any(m["role"] == "user" for m in exchange):
+                self._scorecard.append(self._scorecard_line(len(self._scorecard) + 1, exchange))
+            self._compacted += len(exchange)
+        return [m for exchange in exchanges for m in exchange]
+
+    def _system_message(self, system, scorecard):
+        content = system["content"] if system else ""
+        if scorecard:
+            content += "\n\nEarlier questions and answers (condensed):\n" + "\n".join(scorecard)
+        return {"role": "system", "content": content}
+
+    def build(self, conversation, suffix=None, reissue=False):
+        """
+        Returns the messages to send for `conversation` (system prompt first),
+        plus an optional trailing assistant instruction `suffix`. A `reissue`
+        re-sends the latest turn (e.g. with a corrected answer): its tokens
+        are counted, but it is not counted as another LLM call.
+        """
+        system = conversation[0] if conversation and conversation[0]["role"] == "system" else None
+        turns = conversation[1:] if system else list(conversation)
+        extra = [{"role": "assistant", "content": suffix}] if suffix else []
+
+        recent = self._compact(turns, self.keep_turns)
+        scorecard = list(self._scorecard)
+        messages = [self._system_message(system, scorecard)] + recent + extra
+
+        # Enforce the hard budget: compact verbatim turns down to the latest
+        # exchange first, then leave out the oldest scorecard lines.
+        keep_turns = self.keep_turns
+        while count_message_tokens(messages) > self.max_tokens:
+            if keep_turns > 1:
+                keep_turns -= 1
+                recent = self._compact(turns, keep_turns)
+                scorecard = list(self._scorecard)
+            elif scorecard:
+                scorecard.pop(0)
+            else:
+                break
+            messages = [self._system_message(system, scorecard)] + recent + extra
+
+        full_tokens = count_message_tokens(conversation) + count_message_tokens(extra)
+        sent_tokens = count_message_tokens(messages)
+        if not reissue:
+            self.turns += 1
+        self.full_tokens_total += full_tokens
+        self.sent_tokens_total += sent_tokens
+        print(f"Prompt tokens (estimated): {sent_tokens} sent vs {full_tokens} for the full history.")
+        return messages
+
+    def report(self):
+        saved = self.full_tokens_total - self.sent_tokens_total
+        ratio = 100 * saved / self.full_tokens_total if self.full_tokens_total else 0.0
+        return (f"Context: {self.turns} LLM calls, {self.sent_tokens_total} prompt tokens sent vs "
+                f"{self.full_tokens_total} with full history ({ratio:.0f}% saved).")
@@ -0,0 +1,208 @@
+"""
+Small dataflow scheduler for the per-answer work.
+
+Each Stage owns a bounded queue and a fixed number of worker threads.
+Submitting returns a concurrent.futures.Future, so the caller can wait for
+the one result it needs next (the transcript, to send the LLM request)
+while the other stages (voice and facial emotion) finish in the background.
+The work done while the candidate is still answering (streaming
+transcription windows, facial emotion samples) runs on stages too, so it
+is bounded and measured the same way across sessions.
+
+When a stage's queue is full its policy decides what happens:
+
+- "block": the caller waits for room (work that must not be lost, e.g. ASR);
+- "drop_newest": the new item is rejected;
+- "drop_oldest": the oldest queued item is rejected to make room (work
+  where the latest data matters most, e.g. emotion samples).
+
+Rejected items fail their future with StageDropped and run their optional
+`on_drop` cleanup. Every stage keeps queue-wait and run-time latencies plus
+submitted/completed/dropped/failed counters.
+"""
+
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+
+from .metrics import summarize
+
+POLICIES = ("block", "drop_newest", "drop_oldest")
+
+
+class StageDropped(Exception):
+    """An item was rejected by a full stage queue."""
+
+
+def _call(task):
+    return task()
+
+
+class Stage:
+
+    def __init__(self, name, function=_call, workers=1, queue_size=4, policy="block", history=1000):
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown backpressure policy '{policy}' (expected one of {POLICIES})")
+        self.name = name
+        self.function = function
+        self.policy = policy
+        self.submitted = 0
+        self.completed = 0
+        self.dropped = 0
+        self.failed = 0
+        self.max_depth = 0
+        self.wait_seconds = deque(maxlen=history)
+        self.run_seconds = deque(maxlen=history)
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self._workers = [
+            threading.Thread(target=self._run, name=f"stage-{name}-{i}", daemon=True) for i in range(workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def submit(self, item, timeout=None, on_drop=None):
+        """Queues `item`; `on_drop(item)` runs if the queue rejects it."""
+        future = Future()
+        entry = (item, future, time.perf_counter(), on_drop)
+        with self._lock:
+            self.submitted += 1
+        if self.policy == "block":
+            try:
+                self._queue.put(entry, timeout=timeout)
+            except queue.Full:
+                self._drop(entry, "timed out waiting for queue space")
+        else:
+            while True:
+                try:
+                    self._queue.put_nowait(entry)
+                    break
+                except queue.Full:
+                    if self.policy == "drop_newest":
+                        self._drop(entry, "queue full")
+                        break
+                    try:
+                        oldest = self._queue.get_nowait()
+                    except queue.Empty:
+                        continue
+                    self._queue.task_done()
+                    self._drop(oldest, "replaced by a newer item")
+        with self._lock:
+            self.max_depth = max(self.max_depth, self._queue.qsize())
+        return future
+
+    def _drop(self, entry, reason):
+        item, future, _, on_drop = entry
+        with self._lock:
+            self.dropped += 1
+        if on_drop is not None:
+            try:
+                on_drop(item)
+            except Exception as e:
+                print(f"Stage {self.name}: cleanup of a dropped item failed: {e}")
+        future.set_exception(StageDropped(f"{self.name}: {reason}"))
+
+    def _run(self):
+        while True:
+            entry = self._queue.get()
+            if entry is None:
+                self._queue.task_done()
+                return
+            item, future, queued, _ = entry
+            started = time.perf_counter()
+            if not future.set_running_or_notify_cancel():
+                self._queue.task_done()
+                continue
+            try:
+                result = self.function(item)
+            except Exception as e:
+                with self._lock:
+                    self.failed += 1
+                future.set_exception(e)
+            else:
+                with self._lock:
+                    self.completed += 1
+                future.set_result(result)
+            finally:
+                with self._lock:
+                    self.wait_seconds.append(started - queued)
+                    self.run_seconds.append(time.perf_counter() - started)
+                self._queue.task_done()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "policy": self.policy,
+                "workers": len(self._workers),
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "dropped": self.dropped,
+                "failed": self.failed,
+                "queue_depth": self._queue.qsize(),
+                "max_queue_depth": self.max_depth,
+                "queue_wait": summarize(self.wait_seconds),
+                "run": summarize(self.run_seconds),
+            }
+
+    def close(self):
+        for _ in self._workers:
+            self._queue.put(None)
+        for worker in self._workers:
+            worker.join()
+
+
+class DataflowScheduler:
+
+    def __init__(self):
+        self.stages = {}
+
+    def add_stage(self, name, function=_call, workers=1, queue_size=4, policy="block"):
+        self.stages[name] = Stage(name, function, workers, queue_size, policy)
+        return self.stages[name]
+
+    def submit(self, stage, item, timeout=None, on_drop=None):
+        return self.stages[stage].submit(item, timeout, on_drop)
+
+    def stats(self):
+        return {name: stage.stats() for name, stage in self.stages.items()}
+
+    def report(self):
+        lines = []
+        for name, stats in self.stats().items():
+            run = stats["run"]
+            lines.append(f"{name}: {stats['completed']} done, {stats['dropped']} dropped, {stats['failed']} failed, "
+                         f"run p50 {run.get('p50_ms', 0)} ms / p95 {run.get('p95_ms', 0)} ms, "
+                         f"queue wait p95 {stats['queue_wait'].get('p95_ms', 0)} ms")
+        return "Answer pipeline: " + ("; ".join(lines) or "idle")
+
+    def close(self):
+        for stage in self.stages.values():
+            stage.close()
+
+
+_answer_scheduler = None
+_answer_scheduler_lock = threading.Lock()
+
+
+def get_answer_scheduler():
+    """
+    Process-wide scheduler for recording and finishing an answer, shared by
+    all sessions. The final transcript and the voice-emotion tail block for
+    room; final transcripts run side by side so that
+    batching.get_batch_transcriber can decode them in one batch. Streaming transcription windows and facial emotion
+    samples are superseded by the next one anyway, so they are dropped
+    (oldest first) under load, and so is the facial timeline's final step.
+    """
+    global _answer_scheduler
+    with _answer_scheduler_lock:
+        if _answer_scheduler is None:
+            scheduler = DataflowScheduler()
+            scheduler.add_stage("transcribe_window", workers=1, queue_size=2, policy="drop_oldest")
+            scheduler.add_stage("emotion_sample", workers=1, queue_size=2, policy="drop_oldest")
+            scheduler.add_stage("transcribe", workers=4, queue_size=8, policy="block")
+            scheduler.add_stage("voice_emotion", workers=1, queue_size=4, policy="block")
+            scheduler.add_stage("face_emotion", workers=1, queue_size=4, policy="drop_oldest")
+            _answer_scheduler = scheduler
+    return _answer_scheduler
@@ -0,0 +1,166 @@
+"""
+Facial emotion classification on webcam frames.
+
+LiveEmotionPipeline decouples the three rates that used to be locked
+together in CV.py's loop: frames are captured at camera rate (by a
+CaptureService), sampled at `infer_hz` and classified `batch_size` at a time
+on a background thread, and each result is folded into an exponential
+moving average over the score vectors. Display code just reads the latest
+smoothed label, so the overlay runs at camera rate whatever the model costs.
+With a FaceTracker, sampled frames are cropped to the face first and frames
+without a face are not classified at all.
+"""
+
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+from .metrics import RateMeter, summarize
+from .models import get_classifier
+from .tracing import span
+
+EMOTION_MODEL = "prithivMLmods/Facial-Emotion-Detection-SigLIP2"
+
+
+def get_emotion_classifier():
+    """The facial emotion classifier (the int8 ONNX export when available)."""
+    return get_classifier("image-classification", EMOTION_MODEL)
+
+
+def to_pil(frame):
+    """BGR (OpenCV) frame to an RGB PIL image."""
+    from PIL import Image
+
+    return Image.fromarray(np.ascontiguousarray(frame[..., ::-1]))
+
+
+def classify_frames(frames, classifier=None):
+    """Scores for every label, one {label: score} dict per BGR frame, in one batched call."""
+    if not frames:
+        return []
+    classifier = classifier or get_emotion_classifier()
+    # top_k=None still means 5 in the pipeline; EmotionTimeline needs the full label set every time
+    results = classifier([to_pil(frame) for frame in frames], top_k=classifier.model.config.num_labels,
+                         batch_size=len(frames))
+    if results and isinstance(results[0], dict):
+        results = [results]  # A single image comes back unwrapped
+    return [{p["label"]: p["score"] for p in predictions} for predictions in results]
+
+
+class EmotionSmoother:
+    """Exponential moving average over per-label score vectors."""
+
+    def __init__(self, alpha=0.3):
+        self.alpha = alpha
+        self.scores = {}
+
+    def update(self, scores):
+        if not self.scores:
+            self.scores = dict(scores)
+        else:
+            labels = set(self.scores) | set(scores)
+            self.scores = {
+                label: self.alpha * scores.get(label, 0.0) + (1 - self.alpha) * self.scores.get(label, 0.0)
+                for label in labels
+            }
+        return self.top()
+
+    def top(self):
+        """(label, score) with the highest smoothed score, or (None, 0.0)."""
+        if not self.scores:
+            return None, 0.0
+        label = max(self.scores, key=self.scores.get)
+        return label, self.scores[label]
+
+    def reset(self):
+        self.scores = {}
+
+
+class LiveEmotionPipeline:
+
+    def __init__(self, capture, classifier=None, infer_hz=4.0, batch_size=2, alpha=0.3, face_tracker=None,
+                 history=1000):
+        self.capture = capture
+        self.face_tracker = face_tracker
+        self.classifier = classifier
+        self.infer_hz = infer_hz
+        self.batch_size = batch_size
+        self.smoother = EmotionSmoother(alpha)
+        self.result = (None, 0.0)  # Latest smoothed (label, score)
+        self.batch_latencies = deque(maxlen=history)  # Seconds per classifier call, latest `history`
+        self.frame_latencies = deque(maxlen=history)  # The same, divided by the batch size
+        self.frames_inferred = 0
+        self.frames_without_face = 0
+        self.inference_rate = RateMeter()
+        self.error = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="emotion-inference", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _sample_batch(self, index):
+        """Takes `batch_size` frames spaced 1/infer_hz apart; returns (frames, last index)."""
+        frames = []
+        interval = 1 / self.infer_hz if self.infer_hz > 0 else 0
+        next_time = time.perf_counter()
+        while len(frames) < self.batch_size and not self._stop.is_set():
+            delay = next_time - time.perf_counter()
+            if delay > 0 and self._stop.wait(delay):
+                break
+            next_time = max(next_time + interval, time.perf_counter())
+            frame, index = self.capture.wait_frame(timeout=1.0, after=index)
+            if frame is not None:
+                frames.append(frame)
+        return frames, index
+
+    def _run(self):
+        classifier = self.classifier or get_emotion_classifier()
+        index = 0
+        while not self._stop.is_set():
+            frames, index = self._sample_batch(index)
+            if self.face_tracker is not None:
+                crops = [self.face_tracker.crop(frame) for frame in frames]
+                frames = [crop for crop in crops if crop is not None]
+                self.frames_without_face += len(crops) - len(frames)
+            if not frames:
+                continue
+            started = time.perf_counter()
+            try:
+                with span("emotion.face", frames=len(frames)):
+                    batch_scores = classify_frames(frames, classifier)
+            except Exception as e:
+                self.error = str(e)
+                print(f"Emotion inference failed: {e}")
+                self._stop.wait(1.0)
+                continue
+            elapsed = time.perf_counter() - started
+            self.batch_latencies.append(elapsed)
+            self.frame_latencies.append(elapsed / len(frames))
+            for scores in batch_scores:
+                self.result = self.smoother.update(scores)
+            self.frames_inferred += len(frames)
+            self.inference_rate.tick(len(frames))
+
+    def stats(self):
+        return {
+            "capture_fps": round(self.capture.fps.rate(), 1),
+            "inference_fps": round(self.inference_rate.rate(), 1),
+            "frames_captured": self.capture.frames_read,
+            "frames_inferred": self.frames_inferred,
+            "frames_without_face": self.frames_without_face,
+            "batch_latency": summarize(self.batch_latencies),
+            "per_frame_latency": summarize(self.frame_latencies),
+        }
@@ -0,0 +1,103 @@
+from . import config
+from .context import ConversationContext
+from .llm import stream_sentences
+from .models import get_openai_client
+from .tracing import span, transition
+
+NEXT_QUESTION_PROMPT = "Please ask the next interview question based on the candidate's skillset."
+CONCLUDE_PROMPT = ("Please conclude the interview by saying 'Thank you for appearing for the interview' and "
+                   "provide a performance summary including the total number of correct and incorrect answers, "
+                   "and whether the candidate passed with at least 70% correct answers.")
+
+
+class InterviewEngine:
+    """
+    Holds the conversation with the LLM interviewer and runs the question /
+    answer loop over any Transport. With `stream=True` replies are streamed
+    and handed to the transport sentence by sentence, so speech can start
+    before the LLM has finished. Prompts are built by a ConversationContext,
+    so older turns are condensed instead of resent verbatim.
+    """
+
+    def __init__(self, system_prompt, num_questions=config.NUM_QUESTIONS, client=None,
+                 model=config.LLM_MODEL, temperature=0.2, top_p=0.7, max_tokens=1024, stream=True,
+                 context=None):
+        self.conversation = [{"role": "system", "content": system_prompt}]
+        self.num_questions = num_questions
+        self.client = client or get_openai_client()
+        self.model = model
+        self.temperature = temperature
+        self.top_p = top_p
+        self.max_tokens = max_tokens
+        self.stream = stream
+        self.context = context or ConversationContext()
+
+    def _context(self, prompt):
+        return self.context.build(self.conversation, prompt)
+
+    def _params(self):
+        return dict(model=self.model, temperature=self.temperature, top_p=self.top_p, max_tokens=self.max_tokens)
+
+    def ask_llm(self, prompt=None):
+        """
+        Sends the conversation (plus an optional trailing assistant instruction)
+        to the LLM and returns its reply.
+        """
+        with span("llm", stream=False):
+            completion = self.client.chat.completions.create(
+                messages=self._context(prompt),
+                stream=False,
+                **self._params()
+            )
+        return completion.choices[0].message.content
+
+    def ask_llm_stream(self, prompt=None):
+        """Like ask_llm, but returns a SentenceStream over the streamed reply."""
+        return stream_sentences(self.client, self._context(prompt), **self._params())
+
+    def _reply(self, transport, prompt):
+        """Gets the next reply from the LLM and says it; returns the reply text."""
+        if not self.stream:
+            reply = self.ask_llm(prompt)
+            transport.say(reply)
+            return reply
+        sentences = self.ask_llm_stream(prompt)
+        transport.say_stream(sentences)
+        return sentences.text.strip()
+
+    def prompt_after(self, answered):
+        """Instruction for the LLM after `answered` candidate answers."""
+        return NEXT_QUESTION_PROMPT if answered < self.num_questions else CONCLUDE_PROMPT
+
+    def run(self, transport, opening=None, first_prompt=None):
+        """
+        Runs a full interview. Either speaks a fixed `opening` line or asks the
+        LLM for the first question with `first_prompt`.
+        """
+        transition('start', key=id(self))
+        if opening is None:
+            opening = self._reply(transport, first_prompt)
+        else:
+            transport.say(opening)
+        self.conversation.append({"role": "assistant", "content": opening})
+
+        try:
+            for answered in range(1, self.num_questions + 1):
+                transition('waiting_for_answer', key=id(self))
+                candidate_answer = transport.listen()
+                transition('processing_answer', key=id(self))
+                self.conversation.append({"role": "user", "content": candidate_answer})
+                # Allow candidate to exit early.
+                if candidate_answer.strip().lower() == "exit":
+                    break
+
+                reply = self._reply(transport, self.prompt_after(answered))
+                self.conversation.append({"role": "assistant", "content": reply})
+
+                # If the final summary is reached, stop asking.
+                if config.CONCLUSION_PHRASE in reply:
+                    break
+        finally:
+            transition('finished', key=id(self))
+            print(self.context.report())
+            transport.close()
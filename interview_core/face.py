@@ -0,0 +1,141 @@
+"""
+Face localization in front of the emotion classifier.
+
+The webcam frame is mostly background and the classifier resizes it to its
+input size anyway, so the face ends up a few dozen pixels wide. FaceTracker
+finds the face with OpenCV's Haar cascade, crops it with a margin, levels
+the eyes and resizes it to the classifier's input size. Callers skip
+inference when no face is found.
+
+Detection runs on a downscaled full frame only every `redetect_every`
+frames or after the face is lost; in between it searches a small region
+around the last box, which is several times cheaper.
+"""
+
+import math
+import time
+from collections import deque
+
+from .metrics import summarize
+
+
+def _largest(boxes):
+    if len(boxes) == 0:
+        return None
+    return tuple(int(v) for v in max(boxes, key=lambda b: b[2] * b[3]))
+
+
+class FaceTracker:
+
+    def __init__(self, redetect_every=10, detect_scale=0.5, search_margin=0.5, crop_margin=0.2,
+                 output_size=224, align=True, history=1000):
+        import cv2
+
+        self.cv2 = cv2
+        self.redetect_every = redetect_every
+        self.detect_scale = detect_scale
+        self.search_margin = search_margin
+        self.crop_margin = crop_margin
+        self.output_size = output_size
+        self.align = align
+        self._faces = cv2.CascadeClassifier(cv2.data.haarcascades + "haarcascade_frontalface_default.xml")
+        self._eyes = cv2.CascadeClassifier(cv2.data.haarcascades + "haarcascade_eye.xml")
+        if self._faces.empty():
+            raise RuntimeError("Could not load OpenCV's frontal face Haar cascade")
+        self.box = None  # Last (x, y, w, h) in frame coordinates
+        self._since_detect = 0
+        self.frames = 0
+        self.full_detections = 0
+        self.tracked = 0
+        self.misses = 0
+        self.locate_seconds = deque(maxlen=history)  # Latest `history` frames
+
+    def reset(self):
+        self.box = None
+        self._since_detect = 0
+
+    def _detect_full(self, gray):
+        cv2 = self.cv2
+        small = cv2.resize(gray, None, fx=self.detect_scale, fy=self.detect_scale, interpolation=cv2.INTER_AREA)
+        side = max(24, int(min(small.shape[:2]) * 0.15))
+        box = _largest(self._faces.detectMultiScale(small, scaleFactor=1.1, minNeighbors=5, minSize=(side, side)))
+        if box is None:
+            return None
+        return tuple(int(v / self.detect_scale) for v in box)
+
+    def _detect_near(self, gray, box):
+        x, y, w, h = box
+        pad_x, pad_y = int(w * self.search_margin), int(h * self.search_margin)
+        x0, y0 = max(0, x - pad_x), max(0, y - pad_y)
+        x1, y1 = min(gray.shape[1], x + w + pad_x), min(gray.shape[0], y + h + pad_y)
+        side = max(24, int(min(w, h) * 0.6))
+        found = _largest(self._faces.detectMultiScale(gray[y0:y1, x0:x1], scaleFactor=1.1, minNeighbors=4,
+                                                      minSize=(side, side)))
+        if found is None:
+            return None
+        fx, fy, fw, fh = found
+        return x0 + fx, y0 + fy, fw, fh
+
+    def locate(self, frame):
+        """(x, y, w, h) of the main face in a BGR frame, or None."""
+        started = time.perf_counter()
+        cv2 = self.cv2
+        gray = cv2.equalizeHist(cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY))
+        self.frames += 1
+        box = None
+        if self.box is not None and self._since_detect < self.redetect_every:
+            box = self._detect_near(gray, self.box)
+            if box is not None:
+                self.tracked += 1
+                self._since_detect += 1
+        if box is None:
+            box = self._detect_full(gray)
+            self.full_detections += 1
+            self._since_detect = 0
+        if box is None:
+            self.misses += 1
+        self.box = box
+        self.locate_seconds.append(time.perf_counter() - started)
+        return box
+
+    def _level_eyes(self, face):
+        """Rotates the crop so the eyes are horizontal; returns it unchanged if they are not found."""
+        cv2 = self.cv2
+        h, w = face.shape[:2]
+        upper = cv2.cvtColor(face[:h // 2], cv2.COLOR_BGR2GRAY)
+        eyes = self._eyes.detectMultiScale(upper, scaleFactor=1.1, minNeighbors=5, minSize=(w // 10, w // 10))
+        if len(eyes) < 2:
+            return face
+        eyes = sorted(sorted(eyes, key=lambda e: e[2] * e[3])[-2:], key=lambda e: e[0])
+        (lx, ly, lw, lh), (rx, ry, rw, rh) = eyes
+        angle = math.degrees(math.atan2((ry + rh / 2) - (ly + lh / 2), (rx + rw / 2) - (lx + lw / 2)))
+        if abs(angle) > 25:
+            return face  # Two detections that are not a pair of eyes
+        rotation = cv2.getRotationMatrix2D((w / 2, h / 2), angle, 1.0)
+        return cv2.warpAffine(face, rotation, (w, h), borderMode=cv2.BORDER_REPLICATE)
+
+    def crop(self, frame):
+        """Aligned, square `output_size` BGR face crop, or None when no face is visible."""
+        box = self.locate(frame)
+        if box is None:
+            return None
+        x, y, w, h = box
+        side = int(max(w, h) * (1 + 2 * self.crop_margin))
+        cx, cy = x + w // 2, y + h // 2
+        x0, y0 = max(0, cx - side // 2), max(0, cy - side // 2)
+        x1, y1 = min(frame.shape[1], x0 + side), min(frame.shape[0], y0 + side)
+        face = frame[y0:y1, x0:x1]
+        if face.size == 0:
+            return None
+        if self.align:
+            face = self._level_eyes(face)
+        return self.cv2.resize(face, (self.output_size, self.output_size), interpolation=self.cv2.INTER_AREA)
+
+    def stats(self):
+        return {
+            "frames": self.frames,
+            "full_detections": self.full_detections,
+            "tracked": self.tracked,
+            "no_face": self.misses,
+            "locate_latency": summarize(self.locate_seconds),
+        }
@@ -0,0 +1,101 @@
+"""
+Local stand-ins for the remote/heavy dependencies, used by the load test
+and benchmarks so the interview pipeline can run without network access,
+a GPU or audio devices.
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+from . import config
+from .tts import TTSBackend
+
+
+class FakeLLMClient:
+    """
+    Mimics `OpenAI(...).chat.completions.create` (with and without
+    stream=True). Asks `num_questions` canned questions, then concludes.
+    Latency is `first_token_latency` plus `token_latency` per streamed word.
+    """
+
+    def __init__(self, first_token_latency=0.3, token_latency=0.01, num_questions=config.NUM_QUESTIONS):
+        self.first_token_latency = first_token_latency
+        self.token_latency = token_latency
+        self.num_questions = num_questions
+        self.calls = 0
+        self._lock = threading.Lock()
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def reply_for(self, messages):
+        answers = sum(1 for m in messages if m["role"] == "user")
+        # Condensed turns are listed in the system prompt as "Qn: ... A: ..." lines.
+        answers += sum(line.startswith("Q") and " A: " in line
+                       for line in messages[0]["content"].splitlines()) if messages else 0
+        if answers >= self.num_questions:
+            return (f"{config.CONCLUSION_PHRASE}. Summary: Correct answers: {answers}, "
+                    "Incorrect answers: 0. Result: Pass")
+        return (f"Question {answers + 1}: Can you explain how a hash map handles collisions? "
+                "Please also mention the average time complexity of lookups.")
+
+    def _words(self, text):
+        words = text.split(" ")
+        return [word if i == 0 else " " + word for i, word in enumerate(words)]
+
+    def create(self, messages, stream=False, **params):
+        with self._lock:
+            self.calls += 1
+        text = self.reply_for(messages)
+        time.sleep(self.first_token_latency)
+        if not stream:
+            time.sleep(self.token_latency * len(text.split()))
+            return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=text))])
+        return self._stream(text)
+
+    def _stream(self, text):
+        for word in self._words(text):
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=word))])
+            time.sleep(self.token_latency)
+
+
+class FakeWhisperModel:
+    """
+    Stand-in for a Whisper model: burns `realtime_factor` seconds of wall
+    time per second of audio and returns a fixed transcript.
+    """
+
+    def __init__(self, realtime_factor=0.1, fs=config.SAMPLE_RATE, batch_cost=0.25,
+                 text="A hash map uses chaining or open addressing and lookups are constant time on average."):
+        self.realtime_factor = realtime_factor
+        self.batch_cost = batch_cost
+        self.fs = fs
+        self.text = text
+
+    def transcribe(self, audio, **kwargs):
+        duration = len(audio) / self.fs
+        time.sleep(duration * self.realtime_factor)
+        return {"text": self.text, "segments": [{"start": 0.0, "end": duration, "text": self.text}]}
+
+    def transcribe_batch(self, audios, **kwargs):
+        """
+        Batched pass: like Whisper, every item is padded to the longest one,
+        and each extra item costs `batch_cost` of a full pass.
+        """
+        longest = max(len(audio) for audio in audios) / self.fs
+        time.sleep(longest * self.realtime_factor * (1 + self.batch_cost * (len(audios) - 1)))
+        return [self.text for _ in audios]
+
+
+class FakeTTSBackend(TTSBackend):
+    """PCM backend that returns silence after a fixed synthesis delay."""
+
+    name = "fake"
+    format = "pcm"
+    sample_rate = 16000
+
+    def __init__(self, latency=0.05):
+        self.latency = latency
+
+    def synthesize(self, text, lang='en'):
+        time.sleep(self.latency)
+        return b"\0\0" * int(self.sample_rate * 0.06 * len(text.split()))
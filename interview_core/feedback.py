@@ -0,0 +1,62 @@
+"""
+Fixed end-of-interview texts and the emotion-based feedback shown in the
+`show_summary` state.
+"""
+
+from collections import Counter
+
+FINAL_SUMMARY_TEMPLATE = (
+    "Thank you for appearing for the interview.\n"
+    "Summary: Correct answers: X, Incorrect answers: Y.\n"
+    "Result: [Pass/Fail]\n"
+)
+FEEDBACK_MESSAGES = {
+    "happy": "Great job! Your expressions suggest confidence and positivity.",
+    "nervous": "It seems you were nervous. Consider practicing to build more confidence.",
+    "neutral": "Your expressions were neutral. Try to be more expressive to convey enthusiasm. Speak clear and stay confident.",
+    None: "No emotion data was captured.",
+}
+# Voice models abbreviate some labels (e.g. the SUPERB emotion heads); facial ones are capitalized.
+EMOTION_LABEL_ALIASES = {
+    "hap": "happy",
+    "neu": "neutral",
+    "ang": "angry",
+    "fea": "fear",
+    "fearful": "fear",
+    "dis": "disgust",
+    "sur": "surprise",
+    "surprised": "surprise",
+}
+CONNECTION_ERROR_MESSAGE = "Sorry, there was a connection error. Please try refreshing."
+FIXED_UTTERANCES = [CONNECTION_ERROR_MESSAGE] + [
+    FINAL_SUMMARY_TEMPLATE + "\nFeedback: " + message for message in FEEDBACK_MESSAGES.values()
+]
+
+
+def emotion_label(label):
+    """Canonical lowercase form of a facial or voice emotion label ("Happy", "hap" -> "happy")."""
+    label = label.strip().lower()
+    return EMOTION_LABEL_ALIASES.get(label, label)
+
+
+def emotion_feedback(emotions):
+    """Feedback message for the most common captured emotion label."""
+    if not emotions:
+        return FEEDBACK_MESSAGES[None]
+    most_common_emotion, _ = Counter(emotion_label(emotion) for emotion in emotions).most_common(1)[0]
+    if most_common_emotion == "happy":
+        return FEEDBACK_MESSAGES["happy"]
+    if most_common_emotion == "nervous":
+        return FEEDBACK_MESSAGES["nervous"]
+    return FEEDBACK_MESSAGES["neutral"]
+
+
+def merged_emotion_feedback(*timelines, fallback=()):
+    """
+    Feedback from several EmotionTimelines (e.g. face and voice): every
+    answer's dominant label in each timeline is one vote, counted by its
+    emotion_label() so "Happy" and "happy" add up. Uses the `fallback`
+    labels when no timeline has any samples.
+    """
+    votes = [label for timeline in timelines for label in timeline.dominant_labels()]
+    return emotion_feedback(votes or list(fallback))
@@ -0,0 +1,83 @@
+"""
+Helpers for consuming `stream=True` chat completions sentence by sentence,
+so speech synthesis can start before the whole reply has arrived.
+"""
+
+import re
+import time
+
+from .tracing import get_tracer
+
+# A sentence ends at . ! or ? (optionally followed by a closing quote or
+# bracket) plus whitespace, or at a line break.
+_SENTENCE_END = re.compile(r'(?<=[.!?])["\')\]]*\s+|\n+')
+_ABBREVIATIONS = ("e.g.", "i.e.", "etc.", "vs.", "mr.", "mrs.", "dr.")
+
+
+def iter_deltas(completion):
+    """Yields the text deltas of a streamed chat completion."""
+    for chunk in completion:
+        if not chunk.choices:
+            continue
+        content = chunk.choices[0].delta.content
+        if content is not None:
+            yield content
+
+
+def split_sentences(deltas, min_chars=20):
+    """
+    Regroups streamed text deltas into sentences. Boundaries closer than
+    `min_chars` to the start of the pending text are skipped so that
+    abbreviations and very short fragments are not synthesized on their own.
+    """
+    buffer = ""
+    for delta in deltas:
+        buffer += delta
+        while True:
+            for match in _SENTENCE_END.finditer(buffer):
+                if match.start() >= min_chars and not buffer[:match.start()].lower().endswith(_ABBREVIATIONS):
+                    sentence = buffer[:match.start()].strip()
+                    buffer = buffer[match.end():]
+                    if sentence:
+                        yield sentence
+                    break
+            else:
+                break
+    if buffer.strip():
+        yield buffer.strip()
+
+
+class SentenceStream:
+    """
+    Iterates over the sentences of a streamed reply. `text` holds the raw
+    reply received so far (with its original line breaks).
+    """
+
+    def __init__(self, deltas, min_chars=20, started_ns=None):
+        self.text = ""
+        self._deltas = deltas
+        self._min_chars = min_chars
+        self._started_ns = started_ns or time.perf_counter_ns()
+
+    def _collect(self):
+        first_token_ns = None
+        for delta in self._deltas:
+            if first_token_ns is None:
+                first_token_ns = time.perf_counter_ns()
+            self.text += delta
+            yield delta
+        tracer = get_tracer()
+        if tracer.enabled:
+            first_token_ms = (first_token_ns - self._started_ns) / 1e6 if first_token_ns else None
+            tracer.add("llm", self._started_ns, time.perf_counter_ns(),
+                       args={"stream": True, "first_token_ms": first_token_ms, "chars": len(self.text)})
+
+    def __iter__(self):
+        return split_sentences(self._collect(), self._min_chars)
+
+
+def stream_sentences(client, messages, **params):
+    """Calls the chat endpoint with stream=True and returns a SentenceStream."""
+    started_ns = time.perf_counter_ns()
+    completion = client.chat.completions.create(messages=messages, stream=True, **params)
+    return SentenceStream(iter_deltas(completion), started_ns=started_ns)
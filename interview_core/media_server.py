@@ -0,0 +1,246 @@
+"""
+Static media server for the Streamlit apps' interviewer video.
+
+Embedding the MP4 as a base64 data URI put the whole file into the page on
+every rerun. Instead the file is registered here once per process and the
+page only carries its URL. The server answers GET/HEAD with byte-range
+support (206 Partial Content, which browsers use for <video> seeking and
+streaming) and a strong ETag plus Cache-Control, so a browser downloads
+the file once and revalidates with 304 Not Modified afterwards.
+
+Only registered files are served; request paths never touch the filesystem.
+
+The server listens on the Streamlit host's loopback address, so its URLs
+only work for a browser on that machine (and an http:// URL would be mixed
+content on an HTTPS page). media_url() therefore hands out a server URL
+only when the page itself was opened on localhost, or when MEDIA_PUBLIC_URL
+says how browsers reach the server; any other client gets the file as a
+data URI again, encoded once per file version.
+"""
+
+import base64
+import hashlib
+import mimetypes
+import os
+import re
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import quote, unquote
+
+DEFAULT_HOST = os.environ.get("MEDIA_HOST", "127.0.0.1")
+DEFAULT_PORT = int(os.environ.get("MEDIA_PORT", 0))  # 0 = any free port
+PUBLIC_URL = os.environ.get("MEDIA_PUBLIC_URL")  # e.g. behind a reverse proxy
+CHUNK_SIZE = 256 * 1024
+MAX_AGE_SECONDS = 86400
+
+_RANGE = re.compile(r"bytes=(\d*)-(\d*)$")
+LOOPBACK_HOSTS = {"localhost", "127.0.0.1", "::1"}
+
+
+class _MediaFile:
+
+    def __init__(self, path):
+        self.path = os.path.abspath(path)
+        self.name = os.path.basename(self.path)
+        self.content_type = mimetypes.guess_type(self.name)[0] or "application/octet-stream"
+        self.refresh()
+
+    def refresh(self):
+        stat = os.stat(self.path)
+        self.size = stat.st_size
+        self.etag = '"' + hashlib.sha1(f"{self.path}:{stat.st_size}:{stat.st_mtime_ns}".encode()).hexdigest()[:20] + '"'
+        self.mtime = stat.st_mtime
+
+
+def parse_range(header, size):
+    """
+    (start, end) inclusive for a single "bytes=" range, None when the header
+    is absent or unsupported (serve the whole file), or ValueError when the
+    range cannot be satisfied.
+    """
+    if not header:
+        return None
+    match = _RANGE.match(header.strip())
+    if not match or not any(match.groups()):
+        return None  # Multi-range or malformed: fall back to a full response
+    first, last = match.groups()
+    if not first:
+        # Suffix range: the last N bytes.
+        length = int(last)
+        if length == 0:
+            raise ValueError("Empty suffix range")
+        return max(0, size - length), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise ValueError("Range starts past the end of the file")
+    return start, end
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "InterviewMedia/1.0"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass  # Keep Streamlit's console readable
+
+    def do_HEAD(self):
+        self._serve(send_body=False)
+
+    def do_GET(self):
+        self._serve(send_body=True)
+
+    def _serve(self, send_body):
+        media = self.server.media_server.lookup(unquote(self.path.split("?", 1)[0]))
+        if media is None:
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+        try:
+            media.refresh()
+        except OSError:
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+
+        if media.etag in [tag.strip() for tag in self.headers.get("If-None-Match", "").split(",")]:
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self._common_headers(media)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        # If-Range: only honour the range when the client's copy is current.
+        range_header = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        if if_range and if_range.strip() != media.etag:
+            range_header = None
+        try:
+            byte_range = parse_range(range_header, media.size)
+        except ValueError:
+            self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+            self.send_header("Content-Range", f"bytes */{media.size}")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        if byte_range is None:
+            start, end = 0, media.size - 1
+            self.send_response(HTTPStatus.OK)
+        else:
+            start, end = byte_range
+            self.send_response(HTTPStatus.PARTIAL_CONTENT)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{media.size}")
+        length = max(0, end - start + 1)
+        self._common_headers(media)
+        self.send_header("Content-Type", media.content_type)
+        self.send_header("Content-Length", str(length))
+        self.end_headers()
+        if not send_body or not length:
+            return
+
+        with open(media.path, "rb") as f:
+            f.seek(start)
+            remaining = length
+            try:
+                while remaining:
+                    chunk = f.read(min(CHUNK_SIZE, remaining))
+                    if not chunk:
+                        break
+                    self.wfile.write(chunk)
+                    remaining -= len(chunk)
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # The browser cancelled (e.g. it only wanted the first range)
+
+    def _common_headers(self, media):
+        self.send_header("ETag", media.etag)
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Cache-Control", f"public, max-age={MAX_AGE_SECONDS}")
+        self.send_header("Last-Modified", self.date_time_string(media.mtime))
+
+
+class MediaServer:
+
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, public_url=PUBLIC_URL):
+        self._files = {}
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.media_server = self
+        self.host, self.port = self._httpd.server_address[:2]
+        self.base_url = (public_url or f"http://{self.host}:{self.port}").rstrip("/")
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="media-server", daemon=True)
+        self._thread.start()
+
+    def register(self, path):
+        """Makes `path` available and returns its URL path (e.g. /media/ab12.../video.mp4)."""
+        media = _MediaFile(path)
+        token = hashlib.sha1(media.path.encode("utf-8")).hexdigest()[:12]
+        route = f"/media/{token}/{media.name}"
+        with self._lock:
+            self._files[route] = media
+        return route
+
+    def url_for(self, path):
+        return self.base_url + quote(self.register(path))
+
+    def lookup(self, route):
+        with self._lock:
+            return self._files.get(route)
+
+    def close(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+_server = None
+_server_lock = threading.Lock()
+
+
+def get_media_server():
+    """Process-wide server, started on first use (shared by every rerun and session)."""
+    global _server
+    with _server_lock:
+        if _server is None:
+            _server = MediaServer()
+            print(f"Media server listening on {_server.base_url}")
+    return _server
+
+
+def is_local_host(host):
+    """True for a loopback Host header value ("localhost:8501", "[::1]:8501", ...)."""
+    if not host:
+        return False
+    host = host.strip().lower()
+    if host.startswith("["):
+        host = host[1:].split("]", 1)[0]
+    elif host.count(":") == 1:
+        host = host.split(":", 1)[0]
+    return host in LOOPBACK_HOSTS or host.startswith("127.")
+
+
+_data_uris = {}
+_data_uris_lock = threading.Lock()
+
+
+def data_uri(path):
+    """`path` as a base64 data URI, re-encoded only when the file changes."""
+    media = _MediaFile(path)
+    with _data_uris_lock:
+        cached = _data_uris.get(media.path)
+        if cached is None or cached[0] != media.etag:
+            with open(media.path, "rb") as f:
+                encoded = base64.b64encode(f.read()).decode("ascii")
+            cached = media.etag, f"data:{media.content_type};base64,{encoded}"
+            _data_uris[media.path] = cached
+    return cached[1]
+
+
+def media_url(path, page_host=None):
+    """
+    URL for `path` as seen by a browser that opened the page at `page_host`
+    (its Host header): the shared media server's URL when that browser can
+    reach it, otherwise a data URI.
+    """
+    if PUBLIC_URL or is_local_host(page_host):
+        return get_media_server().url_for(path)
+    return data_uri(path)
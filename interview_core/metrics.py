@@ -0,0 +1,87 @@
+"""
+Small latency helpers shared by the service, the load test and the
+benchmarks.
+"""
+
+import time
+from collections import deque
+
+
+def percentile(values, q):
+    """q-th percentile (0-100) with linear interpolation; 0.0 for no data."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(values):
+    """count / mean / p50 / p95 / p99 / max of a list of seconds, in ms."""
+    if not values:
+        return {"count": 0}
+    return {
+        "count": len(values),
+        "mean_ms": round(1000 * sum(values) / len(values), 2),
+        "p50_ms": round(1000 * percentile(values, 50), 2),
+        "p95_ms": round(1000 * percentile(values, 95), 2),
+        "p99_ms": round(1000 * percentile(values, 99), 2),
+        "max_ms": round(1000 * max(values), 2),
+    }
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram. `bounds` are inclusive upper edges; values above
+    the last bound land in an overflow bucket.
+    """
+
+    def __init__(self, bounds, unit=""):
+        self.bounds = list(bounds)
+        self.unit = unit
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.total = 0
+
+    def add(self, value):
+        for i, bound in enumerate(self.bounds):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.total += 1
+
+    def buckets(self):
+        """{label: count} for the non-empty buckets, in bucket order."""
+        labels = [f"<={bound:g}{self.unit}" for bound in self.bounds] + [f">{self.bounds[-1]:g}{self.unit}"]
+        return {label: count for label, count in zip(labels, self.counts) if count}
+
+
+class RateMeter:
+    """Events per second over a sliding window (e.g. capture or display FPS)."""
+
+    def __init__(self, window_s=2.0):
+        self.window_s = window_s
+        self.total = 0
+        self._times = deque()
+
+    def tick(self, count=1, now=None):
+        now = time.perf_counter() if now is None else now
+        for _ in range(count):
+            self._times.append(now)
+        self.total += count
+        self._trim(now)
+
+    def _trim(self, now):
+        while self._times and now - self._times[0] > self.window_s:
+            self._times.popleft()
+
+    def rate(self, now=None):
+        now = time.perf_counter() if now is None else now
+        self._trim(now)
+        if len(self._times) < 2:
+            return 0.0
+        span = now - self._times[0]
+        return len(self._times) / span if span > 0 else 0.0
@@ -0,0 +1,105 @@
+"""
+Process-wide, lazily loaded singletons for the heavy objects every
+interviewer entry point needs. The first caller pays the load cost, every
+later caller (another script importing us, another Streamlit rerun or
+session, another thread) gets the same instance.
+"""
+
+import os
+import threading
+import time
+
+from . import config
+
+_lock = threading.Lock()  # Guards _load_locks; held only briefly, never while loading
+_load_locks = {}  # (cache, key) -> lock held while that one object loads
+_whisper_models = {}
+_openai_clients = {}
+_pipelines = {}
+load_times = {}  # name -> seconds spent loading, for benchmarks
+
+
+def _load_lock(cache, key):
+    with _lock:
+        return _load_locks.setdefault((id(cache), key), threading.Lock())
+
+
+def _get_or_load(cache, key, label, loader):
+    instance = cache.get(key)
+    if instance is not None:
+        return instance
+    # Concurrent callers for the same object wait for one load; other objects load (or return) meanwhile.
+    with _load_lock(cache, key):
+        instance = cache.get(key)
+        if instance is None:
+            print(f"Loading {label}...")
+            started = time.perf_counter()
+            instance = loader()
+            load_times[label] = time.perf_counter() - started
+            print(f"{label} loaded in {load_times[label]:.2f}s.")
+            cache[key] = instance
+    return instance
+
+
+def get_whisper_model(name=None):
+    """Returns the shared Whisper model, loading it on first use."""
+    name = name or config.WHISPER_MODEL
+
+    def load():
+        import whisper
+        return whisper.load_model(name)
+
+    return _get_or_load(_whisper_models, name, f"Whisper model '{name}'", load)
+
+
+def release_whisper_model(name):
+    """Drops a Whisper model from the cache (it is freed once nobody else holds it)."""
+    with _lock:
+        _whisper_models.pop(name, None)
+
+
+def get_openai_client(api_key=None, base_url=None):
+    """Returns the shared OpenAI client for the NVIDIA endpoint."""
+    api_key = api_key or config.API_KEY
+    base_url = base_url or config.BASE_URL
+
+    def load():
+        from openai import OpenAI
+        return OpenAI(base_url=base_url, api_key=api_key)
+
+    return _get_or_load(_openai_clients, (base_url, api_key), f"OpenAI client for {base_url}", load)
+
+
+def get_pipeline(task, model):
+    """Returns a shared transformers pipeline (e.g. the emotion classifiers)."""
+
+    def load():
+        from transformers import pipeline
+        return pipeline(task, model=model)
+
+    return _get_or_load(_pipelines, (task, model), f"{task} pipeline '{model}'", load)
+
+
+def get_classifier(task, model):
+    """
+    Shared classifier for an image-/audio-classification model: the int8
+    ONNX Runtime export if one exists (see interview_core.onnx_models),
+    otherwise the transformers pipeline. Set INTERVIEW_ONNX=0 to always use
+    the pipeline.
+    """
+    from . import onnx_models
+
+    if os.environ.get("INTERVIEW_ONNX", "1") != "0" and onnx_models.has_artifact(model):
+        try:
+            import onnxruntime  # noqa: F401
+        except ImportError:
+            pass
+        else:
+            return _get_or_load(_pipelines, ("onnx", task, model), f"{task} ONNX model '{model}'",
+                                lambda: onnx_models.OnnxClassifier(task, model))
+    return get_pipeline(task, model)
+
+
+def loaded():
+    """Names of everything loaded so far in this process."""
+    return list(load_times)
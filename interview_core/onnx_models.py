@@ -0,0 +1,297 @@
+"""
+ONNX Runtime export of the emotion classifiers, with dynamic int8
+quantization.
+
+The transformers pipelines for the facial (SigLIP2) and audio emotion
+models load full fp32 PyTorch weights in every process and run slowly on
+CPU. `export` traces a model to ONNX, quantizes its weights to int8 and
+checks the result against the PyTorch outputs on real inputs (windows of
+recording.wav, fixed face crops from images in the repo) before keeping it.
+`OnnxClassifier` then serves the artifact with the same call signature and
+output as the pipeline, and models.get_classifier picks it automatically
+whenever an artifact exists.
+
+Export once per machine (add --check to re-run only the parity check):
+
+    python -m interview_core.onnx_models face audio
+"""
+
+import argparse
+import json
+import os
+import re
+from types import SimpleNamespace
+
+import numpy as np
+
+ONNX_DIR = os.environ.get(
+    "ONNX_MODEL_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "interview_core", "onnx"),
+)
+MODEL_FILE = "model.int8.onnx"
+PARITY_FILE = "parity.json"
+MIN_TOP1_AGREEMENT = 0.9
+MAX_ABS_PROB_DIFF = 0.1  # Largest class-probability difference allowed on any parity input
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PARITY_AUDIO = os.path.join(REPO_ROOT, "recording.wav")
+PARITY_FACES = (  # Image and face box (left, top, right, bottom)
+    (os.path.join(REPO_ROOT, "A2FGit_Banner_03.png"), (1220, 170, 1500, 470)),
+    (os.path.join(REPO_ROOT, "backend", "Hackathon.png"), (40, 20, 145, 125)),
+)
+
+TASKS = {
+    "image-classification": "image",
+    "audio-classification": "audio",
+}
+EMOTION_MODELS = {
+    "face": ("image-classification", "prithivMLmods/Facial-Emotion-Detection-SigLIP2"),
+    "audio": ("audio-classification", "Hatman/audio-emotion-detection"),
+}
+
+
+def artifact_dir(model):
+    return os.path.join(ONNX_DIR, re.sub(r"[^A-Za-z0-9_.-]+", "--", model))
+
+
+def has_artifact(model):
+    return os.path.exists(os.path.join(artifact_dir(model), MODEL_FILE))
+
+
+def _softmax(logits):
+    logits = logits - logits.max(axis=-1, keepdims=True)
+    exp = np.exp(logits)
+    return exp / exp.sum(axis=-1, keepdims=True)
+
+
+def _load_torch(task, model):
+    import transformers
+
+    if TASKS[task] == "image":
+        processor = transformers.AutoImageProcessor.from_pretrained(model)
+        network = transformers.AutoModelForImageClassification.from_pretrained(model)
+    else:
+        processor = transformers.AutoFeatureExtractor.from_pretrained(model)
+        network = transformers.AutoModelForAudioClassification.from_pretrained(model)
+    return processor, network.eval()
+
+
+def _sample_inputs(task, count=8, seed=0):
+    """Deterministic calibration/parity inputs: noise images or noise clips."""
+    rng = np.random.default_rng(seed)
+    if TASKS[task] == "image":
+        from PIL import Image
+
+        return [Image.fromarray(rng.integers(0, 256, (224, 224, 3), dtype=np.uint8)) for _ in range(count)]
+    return [(0.1 * rng.standard_normal(16000 * 2)).astype(np.float32) for _ in range(count)]
+
+
+def _parity_inputs(task, count=8, seconds=2.0):
+    """
+    Real parity inputs: `count` windows spread over PARITY_AUDIO, or the
+    PARITY_FACES crops with growing margins, every other one mirrored.
+    """
+    if TASKS[task] == "image":
+        from PIL import Image, ImageOps
+
+        crops = []
+        for i in range(count):
+            path, (left, top, right, bottom) = PARITY_FACES[i % len(PARITY_FACES)]
+            variant = i // len(PARITY_FACES)
+            pad = int(0.05 * (variant // 2) * (right - left))
+            with Image.open(path) as image:
+                crop = image.convert("RGB").crop((left - pad, top - pad, right + pad, bottom + pad))
+            crops.append(ImageOps.mirror(crop) if variant % 2 else crop)
+        return crops
+    from .replay import load_wav
+
+    audio = load_wav(PARITY_AUDIO)
+    window = min(int(seconds * 16000), audio.size)
+    starts = np.linspace(0, audio.size - window, count).astype(int)
+    return [audio[start:start + window] for start in starts]
+
+
+def _features(task, processor, inputs):
+    if TASKS[task] == "image":
+        return dict(processor(images=inputs, return_tensors="np"))
+    return dict(processor(inputs, sampling_rate=processor.sampling_rate, return_tensors="np", padding=True))
+
+
+def export(task, model, quantize=True, samples=8):
+    """
+    Exports `model` to ONNX under artifact_dir(model), quantizes it and runs
+    the parity check. Returns the parity report; the artifact is removed
+    again if the check fails (top-1 agreement below MIN_TOP1_AGREEMENT or a
+    probability off by more than MAX_ABS_PROB_DIFF).
+    """
+    import torch
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    directory = artifact_dir(model)
+    os.makedirs(directory, exist_ok=True)
+    processor, network = _load_torch(task, model)
+
+    features = _features(task, processor, _sample_inputs(task, 1))
+    names = list(features)
+    dynamic_axes = {name: {0: "batch"} for name in names}
+    if TASKS[task] == "audio":
+        dynamic_axes = {name: {0: "batch", 1: "time"} for name in names}
+    dynamic_axes["logits"] = {0: "batch"}
+
+    fp32_path = os.path.join(directory, "model.fp32.onnx")
+    final_path = os.path.join(directory, MODEL_FILE)
+    with torch.no_grad():
+        torch.onnx.export(
+            network,
+            tuple(torch.from_numpy(features[name]) for name in names),
+            fp32_path,
+            input_names=names,
+            output_names=["logits"],
+            dynamic_axes=dynamic_axes,
+            opset_version=17,
+        )
+    if quantize:
+        quantize_dynamic(fp32_path, final_path, weight_type=QuantType.QInt8)
+        os.remove(fp32_path)
+    else:
+        os.replace(fp32_path, final_path)
+
+    processor.save_pretrained(directory)
+    network.config.save_pretrained(directory)
+    with open(os.path.join(directory, "export.json"), "w") as f:
+        json.dump({"task": task, "model": model, "quantized": quantize, "inputs": names}, f, indent=2)
+
+    report = check_parity(task, model, samples, processor=processor, network=network)
+    with open(os.path.join(directory, PARITY_FILE), "w") as f:
+        json.dump(report, f, indent=2)
+    if not report["passed"]:
+        os.remove(final_path)
+        raise RuntimeError(f"ONNX export of {model} failed the parity check: {report}")
+    return report
+
+
+def check_parity(task, model, samples=8, processor=None, network=None):
+    """
+    Compares ONNX and PyTorch class probabilities on the same real inputs
+    (_parity_inputs) against MIN_TOP1_AGREEMENT and MAX_ABS_PROB_DIFF.
+    """
+    import torch
+
+    if network is None:
+        processor, network = _load_torch(task, model)
+    inputs = _parity_inputs(task, samples)
+    features = _features(task, processor, inputs)
+    with torch.no_grad():
+        reference = _softmax(network(**{k: torch.from_numpy(v) for k, v in features.items()}).logits.numpy())
+    candidate = _softmax(OnnxClassifier(task, model).run(features))
+    top1_agreement = float(np.mean(reference.argmax(-1) == candidate.argmax(-1)))
+    max_abs_prob_diff = float(np.abs(reference - candidate).max())
+    return {
+        "inputs": PARITY_AUDIO if TASKS[task] == "audio" else [path for path, _ in PARITY_FACES],
+        "samples": len(inputs),
+        "top1_agreement": top1_agreement,
+        "min_top1_agreement": MIN_TOP1_AGREEMENT,
+        "max_abs_prob_diff": max_abs_prob_diff,
+        "max_abs_prob_diff_tolerance": MAX_ABS_PROB_DIFF,
+        "mean_abs_prob_diff": float(np.abs(reference - candidate).mean()),
+        "passed": top1_agreement >= MIN_TOP1_AGREEMENT and max_abs_prob_diff <= MAX_ABS_PROB_DIFF,
+    }
+
+
+class OnnxClassifier:
+    """
+    Drop-in for a transformers image-/audio-classification pipeline backed
+    by the exported ONNX Runtime artifact.
+    """
+
+    def __init__(self, task, model, threads=None):
+        import onnxruntime
+        import transformers
+
+        self.task = task
+        directory = artifact_dir(model)
+        if TASKS[task] == "image":
+            self.processor = transformers.AutoImageProcessor.from_pretrained(directory)
+        else:
+            self.processor = transformers.AutoFeatureExtractor.from_pretrained(directory)
+        config = transformers.AutoConfig.from_pretrained(directory)
+        self.labels = [config.id2label[i] for i in range(len(config.id2label))]
+        # Mirrors pipeline.model, so callers can ask for classifier.model.config.num_labels scores
+        self.model = SimpleNamespace(name_or_path=model, config=config)
+        options = onnxruntime.SessionOptions()
+        if threads:
+            options.intra_op_num_threads = threads
+        self.session = onnxruntime.InferenceSession(
+            os.path.join(directory, MODEL_FILE), options, providers=["CPUExecutionProvider"])
+        self.input_names = [i.name for i in self.session.get_inputs()]
+
+    def run(self, features):
+        """Logits for already-preprocessed numpy features."""
+        feed = {name: features[name] for name in self.input_names if name in features}
+        return self.session.run(["logits"], feed)[0]
+
+    def _load_audio(self, item):
+        if isinstance(item, str):
+            import soundfile as sf
+
+            audio, fs = sf.read(item, dtype="float32", always_2d=True)
+            return audio.mean(axis=1), fs
+        if isinstance(item, dict):
+            return np.asarray(item["raw"], dtype=np.float32), item.get("sampling_rate", self.processor.sampling_rate)
+        return np.asarray(item, dtype=np.float32).reshape(-1), self.processor.sampling_rate
+
+    def _audio_features(self, items):
+        clips = []
+        for item in items:
+            audio, fs = self._load_audio(item)
+            if fs != self.processor.sampling_rate:
+                positions = np.linspace(0, len(audio) - 1, int(len(audio) * self.processor.sampling_rate / fs))
+                audio = np.interp(positions, np.arange(len(audio)), audio).astype(np.float32)
+            clips.append(audio)
+        return _features(self.task, self.processor, clips)
+
+    def __call__(self, inputs, top_k=5, batch_size=None, **kwargs):
+        """Like the pipeline: the `top_k` best labels per input (all of them for top_k=None)."""
+        single = not isinstance(inputs, list)
+        items = [inputs] if single else inputs
+        if TASKS[self.task] == "image":
+            features = _features(self.task, self.processor, items)
+        else:
+            features = self._audio_features(items)
+        probabilities = _softmax(self.run(features))
+        results = []
+        for row in probabilities:
+            order = np.argsort(row)[::-1][:top_k]
+            results.append([{"label": self.labels[i], "score": float(row[i])} for i in order])
+        return results[0] if single else results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the emotion classifiers to int8 ONNX")
+    parser.add_argument("models", nargs="+", choices=sorted(EMOTION_MODELS))
+    parser.add_argument("--no-quantize", action="store_true")
+    parser.add_argument("--samples", type=int, default=8, help="Inputs used for the parity check")
+    parser.add_argument("--check", action="store_true", help="Only re-run the parity check on existing exports")
+    args = parser.parse_args()
+    failed = []
+    for name in args.models:
+        task, model = EMOTION_MODELS[name]
+        if args.check:
+            report = check_parity(task, model, args.samples)
+        else:
+            try:
+                report = export(task, model, quantize=not args.no_quantize, samples=args.samples)
+            except RuntimeError as e:
+                print(e)
+                failed.append(name)
+                continue
+        print(f"{model} -> {artifact_dir(model)}")
+        print(json.dumps(report, indent=2))
+        if not report["passed"]:
+            failed.append(name)
+    if failed:
+        raise SystemExit(f"Parity check failed for: {', '.join(failed)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+"""
+Headless replay of recorded interviews, for end-to-end latency runs.
+
+ReplayTransport answers every question by streaming a recorded WAV file
+(e.g. recording.wav) through the same StreamingTranscriber +
+EnergyEndpointer path backend.py uses for the microphone, optionally
+samples facial emotion from a video file while it "speaks", and
+synthesizes the interviewer's replies sentence by sentence instead of
+playing them. MockLLMServer is a local OpenAI-compatible
+/v1/chat/completions endpoint (plain and stream=True) with configurable
+latency, so the real OpenAI client and HTTP stack are exercised without
+the remote model.
+
+Every turn is timed per stage: capture (feeding the recording), VAD (the
+endpointer's share of that), ASR (final transcript after the recording
+stops), emotion (per classified frame), LLM and TTS, and the turnaround
+from the end of an answer to the first synthesized sentence of the reply.
+As in backend.py, transcription and emotion sampling run on the answer
+scheduler, and the answer's emotion timeline is closed on it while the LLM
+request is already out.
+"""
+
+import json
+import threading
+import time
+import uuid
+import wave
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+from . import config, tts
+from .context import count_message_tokens, estimate_tokens
+from .dataflow import get_answer_scheduler
+from .fakes import FakeLLMClient
+from .metrics import summarize
+from .streaming import StreamingTranscriber
+from .transport import Transport
+from .vad import EnergyEndpointer
+
+STAGES = ("capture", "vad", "asr", "emotion", "llm", "tts", "turnaround")
+
+
+def load_wav(path, fs=config.SAMPLE_RATE):
+    """Reads a PCM WAV file as mono float32 in [-1, 1], resampled to `fs`."""
+    with wave.open(path, "rb") as f:
+        channels, width, rate = f.getnchannels(), f.getsampwidth(), f.getframerate()
+        data = f.readframes(f.getnframes())
+    if width == 1:
+        audio = (np.frombuffer(data, dtype=np.uint8).astype(np.float32) - 128) / 128
+    elif width in (2, 4):
+        dtype = np.int16 if width == 2 else np.int32
+        audio = np.frombuffer(data, dtype=dtype).astype(np.float32) / np.iinfo(dtype).max
+    else:
+        raise ValueError(f"Unsupported sample width in {path}: {width} bytes")
+    audio = audio.reshape(-1, channels).mean(axis=1)
+    if rate != fs:
+        positions = np.arange(int(len(audio) * fs / rate)) * rate / fs
+        audio = np.interp(positions, np.arange(len(audio)), audio)
+    return audio.astype(np.float32)
+
+
+class _LLMHandler(BaseHTTPRequestHandler):
+    server_version = "MockLLM/1.0"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+        request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        self.server.mock.completion(self, request)
+
+
+class MockLLMServer:
+    """
+    OpenAI-compatible chat endpoint answering with FakeLLMClient's canned
+    interview (`num_questions` questions, then the conclusion). Replies
+    start after `first_token_latency` seconds and stream one word every
+    `token_latency` seconds. Point a client at `base_url`.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, first_token_latency=0.3, token_latency=0.01,
+                 num_questions=config.NUM_QUESTIONS):
+        self.replies = FakeLLMClient(first_token_latency, token_latency, num_questions)
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), _LLMHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.mock = self
+        self.host, self.port = self._httpd.server_address[:2]
+        self.base_url = f"http://{self.host}:{self.port}/v1"
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="mock-llm", daemon=True)
+        self._thread.start()
+
+    def completion(self, handler, request):
+        with self._lock:
+            self.requests += 1
+        messages = request.get("messages", [])
+        text = self.replies.reply_for(messages)
+        words = self.replies._words(text)
+        response_id = "chatcmpl-" + uuid.uuid4().hex[:12]
+        common = {"id": response_id, "created": int(time.time()), "model": request.get("model", "mock")}
+        time.sleep(self.replies.first_token_latency)
+
+        if not request.get("stream"):
+            time.sleep(self.replies.token_latency * len(words))
+            prompt_tokens = count_message_tokens(messages)
+            completion_tokens = estimate_tokens(text)
+            body = json.dumps(dict(common, object="chat.completion", choices=[{
+                "index": 0,
+                "message": {"role": "assistant", "content": text},
+                "finish_reason": "stop",
+            }], usage={
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            })).encode("utf-8")
+            handler.send_response(HTTPStatus.OK)
+            handler.send_header("Content-Type", "application/json")
+            handler.send_header("Content-Length", str(len(body)))
+            handler.end_headers()
+            handler.wfile.write(body)
+            return
+
+        handler.send_response(HTTPStatus.OK)
+        handler.send_header("Content-Type", "text/event-stream")
+        handler.send_header("Cache-Control", "no-cache")
+        handler.send_header("Transfer-Encoding", "chunked")
+        handler.end_headers()
+
+        def send(data):
+            event = f"data: {data}\n\n".encode("utf-8")
+            handler.wfile.write(b"%x\r\n%s\r\n" % (len(event), event))
+            handler.wfile.flush()
+
+        def chunk(delta, finish_reason=None):
+            return json.dumps(dict(common, object="chat.completion.chunk", choices=[
+                {"index": 0, "delta": delta, "finish_reason": finish_reason}]))
+
+        send(chunk({"role": "assistant", "content": ""}))
+        for word in words:
+            send(chunk({"content": word}))
+            time.sleep(self.replies.token_latency)
+        send(chunk({}, "stop"))
+        send("[DONE]")
+        handler.wfile.write(b"0\r\n\r\n")
+
+    def close(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+class ReplayTransport(Transport):
+    """
+    Candidate I/O for InterviewEngine without devices: every answer is
+    `audio` (float32 at `fs`) followed by `tail_silence` seconds of silence,
+    fed in 100 ms blocks at `speed` x real time (0 = as fast as possible).
+    With an `emotion_sampler` (timeline.EmotionSampler over a video file's
+    CaptureService) facial emotion is sampled for the length of each answer.
+    """
+
+    def __init__(self, audio, model, fs=config.SAMPLE_RATE, speed=1.0, tail_silence=1.5, max_duration=15,
+                 tts_backend=None, tts_cache=False, emotion_sampler=None):
+        self.audio = np.concatenate((audio, np.zeros(int(tail_silence * fs), dtype=np.float32)))
+        self.model = model
+        self.fs = fs
+        self.speed = speed
+        self.max_duration = max_duration
+        self.tts_backend = tts_backend or tts.get_backend()
+        self.tts_cache = tts_cache
+        self.emotion_sampler = emotion_sampler
+        self.turns = []
+        self.stages = {stage: [] for stage in STAGES}
+        self.replies = []
+        self._answer_ended = self._reply_started = time.perf_counter()
+        self._emotion = None
+
+    def _synthesize(self, text):
+        started = time.perf_counter()
+        tts.synthesize(text, backend=self.tts_backend, cache=self.tts_cache)
+        return time.perf_counter() - started
+
+    def say(self, text):
+        self.say_stream([text])
+
+    def say_stream(self, sentences):
+        synthesis = 0.0
+        first_audio = None
+        for sentence in sentences:
+            synthesis += self._synthesize(sentence)
+            if first_audio is None:
+                first_audio = time.perf_counter() - self._answer_ended
+        # The LLM request went out as soon as the previous answer was transcribed.
+        generation = time.perf_counter() - self._reply_started - synthesis
+        self.stages["llm"].append(generation)
+        self.stages["tts"].append(synthesis)
+        if first_audio is not None:
+            self.stages["turnaround"].append(first_audio)
+        self.replies.append({"llm_s": round(generation, 3), "tts_s": round(synthesis, 3),
+                             "first_audio_s": round(first_audio or 0.0, 3)})
+        self._collect_emotion()
+
+    def _collect_emotion(self):
+        if self._emotion is None:
+            return
+        future, classified, turn = self._emotion
+        self._emotion = None
+        try:
+            summary = future.result(timeout=5)
+        except Exception as e:
+            print(f"Emotion timeline unavailable for answer {turn['answer']}: {e}")
+            summary = None
+        turn["emotion"] = summary["dominant"] if summary else None
+        self.stages["emotion"].extend(self.emotion_sampler.latencies_since(classified))
+
+    def _feed(self, transcriber, endpointer):
+        """Feeds the recording like a microphone; returns (seconds fed, seconds in feed())."""
+        block = int(self.fs * 0.1)
+        limit = min(len(self.audio), int(self.max_duration * self.fs))
+        started = time.perf_counter()
+        in_feed = 0.0
+        position = 0
+        while position < limit and not endpointer.done:
+            samples = self.audio[position:min(position + block, limit)]
+            fed = time.perf_counter()
+            transcriber.feed(samples)
+            in_feed += time.perf_counter() - fed
+            position += len(samples)
+            if self.speed > 0:
+                delay = started + position / self.fs / self.speed - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+        return position / self.fs, in_feed
+
+    def listen(self):
+        scheduler = get_answer_scheduler()
+        endpointer = EnergyEndpointer(fs=self.fs, trailing_silence_s=config.TRAILING_SILENCE_SECONDS)
+        transcriber = StreamingTranscriber(self.model, fs=self.fs, endpointer=endpointer, scheduler=scheduler)
+        if self.emotion_sampler is not None:
+            answer = self.emotion_sampler.start_answer()
+            classified = self.emotion_sampler.classified
+        started = time.perf_counter()
+        transcriber.start(microphone=False)
+        seconds, in_feed = self._feed(transcriber, endpointer)
+        self._answer_ended = time.perf_counter()
+        capture = self._answer_ended - started
+
+        text = scheduler.submit("transcribe", transcriber.stop).result()
+        self._reply_started = time.perf_counter()
+        asr = self._reply_started - self._answer_ended
+
+        turn = {
+            "answer": len(self.turns) + 1,
+            "audio_s": round(seconds, 2),
+            "endpointed": endpointer.done,
+            "trimmed_ratio": round(transcriber.trim_stats.trimmed_ratio, 3),
+            "capture_s": round(capture, 3),
+            "vad_ms": round(1000 * in_feed, 2),
+            "asr_s": round(asr, 3),
+            "transcript": text,
+        }
+        self.stages["capture"].append(capture)
+        self.stages["vad"].append(in_feed)
+        self.stages["asr"].append(asr)
+        if self.emotion_sampler is not None:
+            sampler = self.emotion_sampler
+            future = scheduler.submit("face_emotion", lambda: sampler.stop_answer(answer), on_drop=lambda stop: stop())
+            self._emotion = (future, classified, turn)
+        self.turns.append(turn)
+        return text
+
+    def close(self):
+        self._collect_emotion()
+
+    def report(self):
+        return {
+            "stages": {stage: summarize(values) for stage, values in self.stages.items()},
+            "turns": self.turns,
+            "replies": self.replies,
+        }
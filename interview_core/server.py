@@ -0,0 +1,240 @@
+"""
+Asyncio interview service.
+
+Runs the Streamlit apps' interview state machine
+
+    start -> waiting_for_answer -> processing_answer -> show_summary -> finished
+
+for many concurrent sessions on one event loop. Nothing blocking runs on the
+loop itself: transcription, speech synthesis and emotion capture go to
+small bounded thread pools (one Whisper worker by default, so a single model
+is shared first come, first served; or pass a BatchTranscriber to
+micro-batch answers that arrive together), and LLM calls - which only wait on the
+network - run on a wider pool capped by a semaphore. A slow stage in one
+session then only delays the sessions queued behind it on that stage.
+"""
+
+import asyncio
+import itertools
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+from . import config
+from .audio import transcribe
+from .context import ConversationContext
+from .feedback import CONNECTION_ERROR_MESSAGE, FINAL_SUMMARY_TEMPLATE, emotion_feedback
+from .metrics import summarize
+from .tts import synthesize_utterance
+
+FIRST_QUESTION_PROMPT = "Please ask the first interview question."
+EMPTY_REPLY_MESSAGE = "Sorry, I encountered an issue generating a response. Let's try again."
+MANUAL_SUMMARY_MESSAGE = "Thank you for appearing for the interview. (Could not generate final score summary)."
+
+
+def default_system_prompt(num_questions=config.NUM_QUESTIONS):
+    return f"""
+You are an AI Interviewer simulating a technical screening interview.
+Your goal is to assess the candidate based on their responses.
+
+*Interview Flow:*
+1. Ask exactly {num_questions} questions, one at a time.
+2. Wait for the candidate's answer.
+3. Internally evaluate each answer without disclosing evaluation.
+4. After {num_questions} answers, provide a final summary starting with "Thank you for appearing for the interview."
+
+*Example Final Output:*
+Thank you for appearing for the interview.
+Summary: Correct answers: 4, Incorrect answers: 1.
+Result: Pass
+"""
+
+
+class InterviewSession:
+    """Per-candidate state; the fields mirror the Streamlit session_state keys."""
+
+    def __init__(self, session_id, system_prompt, context):
+        self.session_id = session_id
+        self.interview_state = 'start'
+        self.conversation = [{"role": "system", "content": system_prompt}]
+        self.llm_context = context
+        self.question_count = 0
+        self.emotions = []
+        self.current_interviewer_text = ""
+        self.last_user_transcription = ""
+        self.audio_to_play = None
+        self.error = None
+        self._lock = asyncio.Lock()  # One state transition at a time per session
+
+
+class InterviewService:
+    """
+    Hosts any number of InterviewSessions. `capture_emotion` is an optional
+    blocking callable returning an emotion label (or None) for a session;
+    it runs next to transcription on its own pool. With a `transcriber`
+    (interview_core.batching.BatchTranscriber) answers are transcribed in
+    micro-batches instead of one at a time on the ASR pool.
+    """
+
+    def __init__(self, client, whisper_model, tts_backend=None, capture_emotion=None,
+                 system_prompt=None, num_questions=config.NUM_QUESTIONS, model=config.LLM_MODEL,
+                 asr_workers=1, tts_workers=4, emotion_workers=1, llm_concurrency=16,
+                 tts_cache=True, context_tokens=1500, fs=config.SAMPLE_RATE, transcriber=None,
+                 history=1000):
+        self.client = client
+        self.whisper_model = whisper_model
+        self.transcriber = transcriber
+        self.tts_backend = tts_backend
+        self.capture_emotion = capture_emotion
+        self.system_prompt = system_prompt or default_system_prompt(num_questions)
+        self.num_questions = num_questions
+        self.model = model
+        self.tts_cache = tts_cache
+        self.context_tokens = context_tokens
+        self.fs = fs
+        self.sessions = {}
+        # stage -> seconds of the latest `history` calls, queueing included
+        self.stage_latencies = defaultdict(lambda: deque(maxlen=history))
+        self._ids = itertools.count(1)
+        self._asr_pool = ThreadPoolExecutor(asr_workers, thread_name_prefix="asr")
+        self._tts_pool = ThreadPoolExecutor(tts_workers, thread_name_prefix="tts")
+        self._emotion_pool = ThreadPoolExecutor(emotion_workers, thread_name_prefix="emotion")
+        self._llm_pool = ThreadPoolExecutor(llm_concurrency, thread_name_prefix="llm")
+        self._llm_slots = asyncio.Semaphore(llm_concurrency)
+
+    async def _run(self, pool, stage, function, *args):
+        started = time.perf_counter()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(pool, function, *args)
+        finally:
+            self.stage_latencies[stage].append(time.perf_counter() - started)
+
+    def _session(self, session_id):
+        try:
+            return self.sessions[session_id]
+        except KeyError:
+            raise KeyError(f"Unknown session '{session_id}'") from None
+
+    # -- blocking stage bodies (run on the pools) --
+
+    def _complete(self, messages):
+        completion = self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=0.4,
+            top_p=0.9,
+            max_tokens=300,
+            stream=False,
+        )
+        return completion.choices[0].message.content or ""
+
+    def _transcribe(self, audio):
+        return transcribe(audio, self.whisper_model, self.fs)
+
+    def _synthesize(self, text):
+        return synthesize_utterance(text, backend=self.tts_backend, cache=self.tts_cache)
+
+    # -- state machine --
+
+    async def _transcribe_answer(self, audio):
+        if self.transcriber is None:
+            return await self._run(self._asr_pool, "asr", self._transcribe, audio)
+        started = time.perf_counter()
+        try:
+            return await asyncio.wrap_future(self.transcriber.submit(audio))
+        finally:
+            self.stage_latencies["asr"].append(time.perf_counter() - started)
+
+    async def _say(self, session, text):
+        session.current_interviewer_text = text
+        session.audio_to_play = await self._run(self._tts_pool, "tts", self._synthesize, text)
+
+    async def _call_llm(self, session):
+        messages = session.llm_context.build(session.conversation)
+        try:
+            async with self._llm_slots:
+                reply = (await self._run(self._llm_pool, "llm", self._complete, messages)).strip()
+        except Exception as e:
+            print(f"[{session.session_id}] Error calling LLM: {e}")
+            session.error = str(e)
+            session.interview_state = 'finished'
+            await self._say(session, CONNECTION_ERROR_MESSAGE)
+            return
+
+        if not reply:
+            reply = EMPTY_REPLY_MESSAGE
+        session.conversation.append({"role": "assistant", "content": reply})
+        if config.CONCLUSION_PHRASE in reply:
+            session.interview_state = 'show_summary'
+        elif session.question_count >= self.num_questions:
+            reply = MANUAL_SUMMARY_MESSAGE
+            session.conversation.append({"role": "assistant", "content": reply})
+            session.interview_state = 'show_summary'
+        else:
+            session.interview_state = 'waiting_for_answer'
+        await self._say(session, reply)
+
+    async def start_session(self):
+        """Creates a session and asks the first question."""
+        session_id = f"s{next(self._ids)}"
+        context = ConversationContext(max_tokens=self.context_tokens)
+        session = self.sessions[session_id] = InterviewSession(session_id, self.system_prompt, context)
+        async with session._lock:
+            session.conversation.append({"role": "assistant", "content": FIRST_QUESTION_PROMPT})
+            await self._call_llm(session)
+        return session
+
+    async def submit_answer(self, session_id, audio):
+        """
+        Transcribes a recorded answer (float32 mono at `fs`) and gets the next
+        question or the conclusion. Returns the transcription ("" when nothing
+        was understood; the session then keeps waiting for an answer).
+        """
+        session = self._session(session_id)
+        async with session._lock:
+            if session.interview_state != 'waiting_for_answer':
+                raise ValueError(f"Session {session_id} is not waiting for an answer "
+                                 f"(state: {session.interview_state})")
+            session.interview_state = 'processing_answer'
+            session.audio_to_play = None
+
+            asr = self._transcribe_answer(audio)
+            if self.capture_emotion:
+                emotion = self._run(self._emotion_pool, "emotion", self.capture_emotion, session)
+                transcription, detected_emotion = await asyncio.gather(asr, emotion)
+            else:
+                transcription, detected_emotion = await asr, None
+
+            session.last_user_transcription = transcription
+            if not transcription:
+                session.interview_state = 'waiting_for_answer'
+                return ""
+            session.question_count += 1
+            session.conversation.append({"role": "user", "content": transcription})
+            if detected_emotion:
+                session.emotions.append(detected_emotion)
+            await self._call_llm(session)
+            return transcription
+
+    async def finish(self, session_id):
+        """Runs the `show_summary` state; returns the final summary text."""
+        session = self._session(session_id)
+        async with session._lock:
+            if session.interview_state != 'show_summary':
+                raise ValueError(f"Session {session_id} has no summary to show "
+                                 f"(state: {session.interview_state})")
+            final_text = FINAL_SUMMARY_TEMPLATE + "\nFeedback: " + emotion_feedback(session.emotions)
+            session.conversation.append({"role": "assistant", "content": final_text})
+            session.interview_state = 'finished'
+            await self._say(session, final_text)
+            return final_text
+
+    def close_session(self, session_id):
+        self.sessions.pop(session_id, None)
+
+    def stats(self):
+        return {stage: summarize(values) for stage, values in sorted(self.stage_latencies.items())}
+
+    def shutdown(self):
+        for pool in (self._asr_pool, self._tts_pool, self._emotion_pool, self._llm_pool):
+            pool.shutdown(wait=True)
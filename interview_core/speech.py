@@ -0,0 +1,81 @@
+"""
+Pipelined text-to-speech: sentences are synthesized on worker threads as
+soon as they arrive and played back in order, so the first sentence is
+heard while later ones (and later LLM tokens) are still in flight.
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from . import tts
+from .audio import synthesize_mp3
+
+
+class SpeechPipeline:
+    """
+    Speaks sentences with a TTS backend (default: TTS_ENGINE). `synthesize`
+    and `play` can be overridden, e.g. to run without audio devices.
+    """
+
+    def __init__(self, backend=None, synthesize=None, play=None, workers=2):
+        self.backend = backend or tts.get_backend()
+        self.synthesize = synthesize or (lambda text: tts.synthesize(text, backend=self.backend))
+        self.play = play or (lambda audio: tts.play(audio, self.backend))
+        self.workers = workers
+        self.time_to_first_audio = None  # Seconds from speak_sentences() to first playback
+
+    def _player(self, pending, started):
+        while True:
+            future = pending.get()
+            if future is None:
+                return
+            try:
+                audio = future.result()
+            except Exception as e:
+                print(f"Error during TTS generation: {e}")
+                continue
+            if self.time_to_first_audio is None:
+                self.time_to_first_audio = time.perf_counter() - started
+                print(f"Time to first audio: {1000 * self.time_to_first_audio:.0f} ms")
+            self.play(audio)
+
+    def speak_sentences(self, sentences):
+        """
+        Speaks an iterable of sentences (e.g. llm.stream_sentences) and returns
+        the full text once everything has been played.
+        """
+        started = time.perf_counter()
+        self.time_to_first_audio = None
+        pending = queue.Queue()
+        player = threading.Thread(target=self._player, args=(pending, started), daemon=True)
+        player.start()
+
+        spoken = []
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            try:
+                for sentence in sentences:
+                    print("Speaking out:", sentence)
+                    spoken.append(sentence)
+                    pending.put(executor.submit(self.synthesize, sentence))
+            finally:
+                pending.put(None)
+                player.join()
+        return " ".join(spoken)
+
+
+def synthesize_sentences(sentences, synthesize=synthesize_mp3, workers=2):
+    """
+    Synthesizes sentences concurrently while they are still being produced
+    and returns (full_text, mp3_bytes). MP3 frames can be concatenated, so the
+    clips are simply joined in order.
+    """
+    spoken = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = []
+        for sentence in sentences:
+            spoken.append(sentence)
+            futures.append(executor.submit(synthesize, sentence))
+        clips = [future.result() for future in futures]
+    return " ".join(spoken), b"".join(clips)
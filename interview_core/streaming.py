@@ -0,0 +1,302 @@
+import threading
+import time
+
+import numpy as np
+
+from .dataflow import StageDropped
+from .tracing import span
+from .vad import TrimStats
+
+
+class RingBuffer:
+    """
+    Fixed-capacity float32 ring buffer addressed by absolute sample index.
+    The microphone callback writes into it, the transcription worker reads
+    windows out of it, so nothing has to wait for the full recording.
+    """
+
+    def __init__(self, capacity):
+        self._data = np.zeros(int(capacity), dtype=np.float32)
+        self._capacity = int(capacity)
+        self._written = 0  # Total number of samples ever written
+        self._lock = threading.Lock()
+
+    @property
+    def capacity(self):
+        return self._capacity
+
+    @property
+    def written(self):
+        with self._lock:
+            return self._written
+
+    def write(self, samples):
+        samples = np.asarray(samples, dtype=np.float32).reshape(-1)
+        n = samples.size
+        if n == 0:
+            return
+        with self._lock:
+            if n >= self._capacity:
+                # Only the newest `capacity` samples can survive anyway.
+                self._written += n - self._capacity
+                samples = samples[-self._capacity:]
+                n = self._capacity
+            pos = self._written % self._capacity
+            first = min(n, self._capacity - pos)
+            self._data[pos:pos + first] = samples[:first]
+            if first < n:
+                self._data[:n - first] = samples[first:]
+            self._written += n
+
+    def read(self, start, end=None):
+        """
+        Returns (audio, start) for samples in [start, end). `start` is clamped to
+        the oldest sample still held, so the returned start may be larger than
+        the one requested.
+        """
+        with self._lock:
+            end = self._written if end is None else min(end, self._written)
+            start = max(start, self._written - self._capacity, 0)
+            n = max(end - start, 0)
+            pos = start % self._capacity
+            if pos + n <= self._capacity:
+                audio = self._data[pos:pos + n].copy()
+            else:
+                first = self._capacity - pos
+                audio = np.concatenate((self._data[pos:], self._data[:n - first]))
+        return audio, start
+
+
+class StreamingTranscriber:
+    """
+    Records from the microphone through an sd.InputStream callback and keeps
+    transcribing the audio in overlapping windows on a background worker while
+    the candidate is still speaking.
+
+    Once the pending (uncommitted) audio grows past `window_seconds`, every
+    Whisper segment except the last one is committed and the next window starts
+    at the beginning of that last segment, which gives the overlap. When the
+    recording stops only the short uncommitted tail has to be transcribed.
+
+    With an `endpointer` (see vad.EnergyEndpointer) recording stops shortly
+    after the candidate does, and leading/trailing silence is never sent to
+    Whisper; `trim_stats` then reports how much audio was skipped.
+
+    With a `scheduler` (see dataflow.get_answer_scheduler) the windows run on
+    its "transcribe_window" stage instead of the worker thread itself. With a
+    `batcher` (batching.BatchTranscriber) the final pass is micro-batched with
+    the answers of other sessions, without the committed-text prompt.
+    """
+
+    def __init__(self, model, fs=16000, window_seconds=8.0, step_seconds=1.0,
+                 buffer_seconds=120.0, language="en", silence_rms=0.01,
+                 endpointer=None, pad_seconds=0.15, scheduler=None, batcher=None):
+        self.model = model
+        self.fs = fs
+        self.window_samples = int(window_seconds * fs)
+        self.step_seconds = step_seconds
+        self.language = language
+        self.silence_rms = silence_rms
+        self.buffer = RingBuffer(int(buffer_seconds * fs))
+        self.endpointer = endpointer
+        self.pad_samples = int(pad_seconds * fs)
+        self.trim_stats = None
+        self.scheduler = scheduler
+        self.batcher = batcher
+
+        self._stream = None
+        self._worker = None
+        self._stop_event = threading.Event()
+        self._endpoint_event = threading.Event()
+        self._committed = 0          # Absolute sample index already turned into text
+        self._committed_text = []
+        self._hypothesis = ""        # Latest text for the uncommitted region
+        self._hypothesis_end = 0     # Absolute sample index the hypothesis covers up to
+        self._state_lock = threading.Lock()
+
+    # --- Capture ---
+    def _callback(self, indata, frames, time_info, status):
+        if status:
+            print(f"Input stream status: {status}")
+        self.feed(indata[:, 0])
+
+    def start(self, microphone=True):
+        """
+        Starts the background transcription worker and, unless `microphone`
+        is False, the input stream (otherwise samples come in through feed()).
+        """
+        self._stop_event.clear()
+        self._endpoint_event.clear()
+        if self.endpointer is not None:
+            self.endpointer.reset()
+        if microphone:
+            import sounddevice as sd
+
+            self._stream = sd.InputStream(
+                samplerate=self.fs,
+                channels=1,
+                dtype='float32',
+                blocksize=int(self.fs * 0.1),
+                callback=self._callback,
+            )
+            self._stream.start()
+        self._worker = threading.Thread(target=self._run, name="streaming-transcriber", daemon=True)
+        self._worker.start()
+        print("Streaming transcription started.")
+
+    def feed(self, samples):
+        """Pushes samples without a live stream (e.g. from a file)."""
+        self.buffer.write(samples)
+        if self.endpointer is not None and self.endpointer.process(samples):
+            self._endpoint_event.set()
+
+    def wait(self, timeout):
+        """Blocks until the endpointer fires or `timeout` seconds pass."""
+        if self.endpointer is None:
+            time.sleep(timeout)
+            return False
+        return self._endpoint_event.wait(timeout)
+
+    def _speech_bounds(self, end):
+        """Region of [committed, end) worth transcribing, or None if no speech yet."""
+        start = self._committed
+        if self.endpointer is None:
+            return start, end
+        if not self.endpointer.speech_started:
+            return None
+        start = max(start, self.endpointer.speech_start - self.pad_samples)
+        if self.endpointer.done:
+            end = min(end, self.endpointer.speech_end + self.pad_samples)
+        return start, end
+
+    # --- Transcription ---
+    def _run(self):
+        while not self._stop_event.wait(self.step_seconds):
+            if self.scheduler is None:
+                self._transcribe_window()
+                continue
+            try:
+                self.scheduler.submit("transcribe_window", self._transcribe_window).result()
+            except StageDropped:
+                pass  # The next window covers this audio too
+
+    def _transcribe_window(self):
+        try:
+            with span("transcribe.window"):
+                self._transcribe_pending(final=False)
+        except Exception as e:
+            print(f"Background transcription failed: {e}")
+
+    def _prompt(self):
+        # Tail of the committed text keeps wording consistent across windows.
+        return " ".join(self._committed_text)[-200:] or None
+
+    def _transcribe_pending(self, final):
+        end = self.buffer.written
+        bounds = self._speech_bounds(end)
+        if bounds is None:
+            if final:
+                self._committed = end
+            return
+        audio, start = self.buffer.read(*bounds)
+        if audio.size < self.fs * 0.5:
+            if final:
+                self._committed = end
+            return
+
+        if final and self.batcher is not None:
+            result = {"text": self.batcher.transcribe(audio)}
+        else:
+            result = self.model.transcribe(
+                audio,
+                language=self.language,
+                condition_on_previous_text=False,
+                initial_prompt=self._prompt(),
+            )
+        segments = result.get("segments") or []
+
+        with self._state_lock:
+            if final:
+                self._committed_text.append(result.get("text", "").strip())
+                self._committed = end
+                self._hypothesis = ""
+                self._hypothesis_end = end
+            elif audio.size >= self.window_samples and len(segments) > 1:
+                # The last segment may be cut mid-word: keep it for the next window.
+                keep = segments[-1]
+                self._committed_text.append("".join(s["text"] for s in segments[:-1]).strip())
+                self._committed = start + int(keep["start"] * self.fs)
+                self._hypothesis = keep["text"].strip()
+                self._hypothesis_end = end
+            else:
+                self._hypothesis = result.get("text", "").strip()
+                self._hypothesis_end = end
+
+    def _tail_is_silent(self, end):
+        if self.endpointer is not None and self.endpointer.speech_end is not None:
+            return self.endpointer.done and self.endpointer.speech_end <= self._hypothesis_end
+        tail, _ = self.buffer.read(self._hypothesis_end, end)
+        if tail.size == 0:
+            return True
+        return float(np.sqrt(np.mean(tail ** 2))) < self.silence_rms
+
+    def speech_audio(self):
+        """The recorded answer without leading/trailing silence, e.g. for a second pass after stop()."""
+        end = self.buffer.written
+        start = 0
+        if self.endpointer is not None and self.endpointer.speech_started:
+            start = self.endpointer.speech_start - self.pad_samples
+            if self.endpointer.done:
+                end = min(end, self.endpointer.speech_end + self.pad_samples)
+        audio, _ = self.buffer.read(max(start, 0), end)
+        return audio
+
+    def partial_text(self):
+        """Best current guess of the transcript; safe to call while recording."""
+        with self._state_lock:
+            return " ".join(t for t in self._committed_text + [self._hypothesis] if t).strip()
+
+    def stop(self):
+        """Stops capture and returns the final transcript."""
+        if self._stream is not None:
+            self._stream.stop()
+            self._stream.close()
+            self._stream = None
+        self._stop_event.set()
+        if self._worker is not None:
+            self._worker.join()
+            self._worker = None
+
+        started = time.perf_counter()
+        end = self.buffer.written
+        with span("transcribe", streaming=True) as final_span:
+            if self._hypothesis_end > self._committed and self._tail_is_silent(end):
+                # The worker already covered everything but trailing silence.
+                final_span.set(reused_window=True)
+                with self._state_lock:
+                    self._committed_text.append(self._hypothesis)
+                    self._committed = end
+                    self._hypothesis = ""
+            else:
+                self._transcribe_pending(final=True)
+        text = " ".join(t for t in self._committed_text if t).strip()
+
+        if self.endpointer is not None:
+            kept = 0
+            if self.endpointer.speech_started:
+                speech_end = self.endpointer.speech_end if self.endpointer.done else end
+                kept = (min(end, speech_end + self.pad_samples)
+                        - max(0, self.endpointer.speech_start - self.pad_samples))
+            self.trim_stats = TrimStats(end, kept)
+            print(f"Skipped {100 * self.trim_stats.trimmed_ratio:.1f}% of recorded samples as silence.")
+        print(f"Final transcript ready {1000 * (time.perf_counter() - started):.0f} ms after stop: '{text}'")
+        return text
+
+    def record(self, duration):
+        """Records for up to `duration` seconds and returns the transcript."""
+        self.start()
+        try:
+            self.wait(duration)
+        finally:
+            text = self.stop()
+        return text
@@ -0,0 +1,203 @@
+"""
+Two-tier Whisper transcription with a speculative fast pass.
+
+A fast model ("tiny") and a larger one are both kept loaded. The fast
+tier's transcript is used right away so the LLM request can go out, while
+the accurate tier re-transcribes the same audio on a background thread.
+When the two transcripts differ materially (word error rate above
+`threshold`) the caller re-issues the LLM turn with the accurate text;
+otherwise the speculative reply stands. Accuracy is that of the accurate
+tier, latency that of the fast one in the common case.
+
+The accurate tier is picked at startup from measured throughput: candidate
+models are timed on a probe clip, smallest first, and the largest one that
+transcribes faster than `max_rtf` x real time is kept. On a machine too
+slow for anything above the fast tier, rescoring is switched off.
+"""
+
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import numpy as np
+
+from . import config
+from .metrics import summarize
+from .models import get_whisper_model, release_whisper_model
+from .tracing import span
+
+TIERS = ("tiny", "base", "small", "medium", "large")  # Fastest first
+AUTO_CANDIDATES = ("base", "small")
+_WORD = re.compile(r"[a-z0-9']+")
+
+
+def word_error_rate(reference, hypothesis):
+    """Word-level edit distance between two transcripts, relative to `reference`."""
+    ref = _WORD.findall(reference.lower())
+    hyp = _WORD.findall(hypothesis.lower())
+    if not ref:
+        return 0.0 if not hyp else 1.0
+    previous = list(range(len(hyp) + 1))
+    for i, word in enumerate(ref, 1):
+        current = [i]
+        for j, other in enumerate(hyp, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (word != other)))
+        previous = current
+    return previous[-1] / len(ref)
+
+
+def probe_audio(seconds=4.0, fs=config.SAMPLE_RATE, seed=0):
+    """Speech-band noise bursts, so the decoder does some work."""
+    rng = np.random.default_rng(seed)
+    audio = 0.05 * rng.standard_normal(int(seconds * fs)).astype(np.float32)
+    envelope = (np.sin(np.linspace(0, 6 * np.pi * seconds, audio.size)) > 0).astype(np.float32)
+    return audio * envelope
+
+
+def measure_rtf(model, audio=None, fs=config.SAMPLE_RATE, language="en"):
+    """Seconds of compute per second of audio for one transcription (after a warm-up)."""
+    audio = probe_audio(fs=fs) if audio is None else audio
+    model.transcribe(audio[:fs], language=language, condition_on_previous_text=False)
+    started = time.perf_counter()
+    model.transcribe(audio, language=language, condition_on_previous_text=False)
+    return (time.perf_counter() - started) / (audio.size / fs)
+
+
+def select_accurate_tier(fast=config.WHISPER_FAST_MODEL, candidates=AUTO_CANDIDATES, max_rtf=0.5, audio=None):
+    """
+    Largest of `candidates` (tried smallest first) that runs under `max_rtf`
+    here, or `fast` if none does. Returns (name, {name: measured rtf}).
+    Models that are too slow are released again.
+    """
+    chosen, rtfs = fast, {}
+    for name in sorted(candidates, key=TIERS.index):
+        if TIERS.index(name) <= TIERS.index(fast):
+            continue
+        rtfs[name] = round(measure_rtf(get_whisper_model(name), audio), 3)
+        if rtfs[name] > max_rtf:
+            release_whisper_model(name)
+            break
+        chosen = name
+    return chosen, rtfs
+
+
+class TieredTranscriber:
+
+    def __init__(self, fast=config.WHISPER_FAST_MODEL, accurate=config.WHISPER_ACCURATE_MODEL, max_rtf=0.5,
+                 threshold=0.15, language="en", fs=config.SAMPLE_RATE, history=1000):
+        self.fast = fast
+        self.accurate = None if accurate == "auto" else accurate
+        self.max_rtf = max_rtf
+        self.threshold = threshold
+        self.language = language
+        self.fs = fs
+        self.rtfs = {}
+        self.rescored = 0
+        self.revised = 0
+        self.rescore_seconds = deque(maxlen=history)  # Latest `history` rescoring passes
+        self.ready = threading.Event()  # Set once the accurate tier is loaded (or chosen)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="whisper-rescore")
+        self._lock = threading.Lock()
+
+    @property
+    def fast_model(self):
+        return get_whisper_model(self.fast)
+
+    @property
+    def rescoring(self):
+        """Whether answers get a second, accurate pass."""
+        return self.ready.is_set() and self.accurate not in (None, self.fast)
+
+    def warm(self):
+        """Loads the fast tier now and picks/loads the accurate tier in the background."""
+        self.fast_model
+        threading.Thread(target=self._warm_accurate, name="whisper-tiers", daemon=True).start()
+        return self
+
+    def _warm_accurate(self):
+        try:
+            if self.accurate is None:
+                self.accurate, self.rtfs = select_accurate_tier(self.fast, max_rtf=self.max_rtf)
+                print(f"Whisper tiers: fast '{self.fast}', accurate '{self.accurate}' (measured RTF {self.rtfs}).")
+            else:
+                get_whisper_model(self.accurate)
+        except Exception as e:
+            print(f"Accurate Whisper tier unavailable, using '{self.fast}' only: {e}")
+            self.accurate = self.fast
+        self.ready.set()
+
+    def transcribe(self, audio):
+        """Fast-tier transcript of a numpy array."""
+        with span("transcribe", tier=self.fast):
+            result = self.fast_model.transcribe(audio, language=self.language, condition_on_previous_text=False)
+        return result.get("text", "").strip()
+
+    def rescore(self, audio):
+        """
+        Future for the accurate-tier transcript of `audio`; resolves to None
+        right away when rescoring is off or the accurate tier is still loading.
+        """
+        if not self.rescoring or audio is None or audio.size < self.fs * 0.5:
+            future = Future()
+            future.set_result(None)
+            return future
+        return self._executor.submit(self._rescore, audio)
+
+    def _rescore(self, audio):
+        started = time.perf_counter()
+        with span("transcribe", tier=self.accurate):
+            result = get_whisper_model(self.accurate).transcribe(
+                audio, language=self.language, condition_on_previous_text=False)
+        with self._lock:
+            self.rescored += 1
+            self.rescore_seconds.append(time.perf_counter() - started)
+        return result.get("text", "").strip()
+
+    def revision(self, future, fast_text, timeout=30):
+        """
+        The accurate transcript if it differs materially from `fast_text`
+        (the LLM turn should then be re-issued), else None.
+        """
+        if future is None:
+            return None
+        try:
+            accurate_text = future.result(timeout=timeout)
+        except Exception as e:
+            print(f"Accurate transcription failed, keeping the fast transcript: {e}")
+            return None
+        if not accurate_text or word_error_rate(accurate_text, fast_text) <= self.threshold:
+            return None
+        with self._lock:
+            self.revised += 1
+        return accurate_text
+
+    def stats(self):
+        with self._lock:
+            return {
+                "fast": self.fast,
+                "accurate": self.accurate,
+                "measured_rtf": self.rtfs,
+                "rescored": self.rescored,
+                "revised": self.revised,
+                "rescore_latency": summarize(self.rescore_seconds),
+            }
+
+    def report(self):
+        stats = self.stats()
+        return (f"Whisper tiers: fast '{stats['fast']}', accurate '{stats['accurate']}'; "
+                f"{stats['rescored']} answers rescored, {stats['revised']} LLM turns re-issued.")
+
+
+_tiers = None
+_tiers_lock = threading.Lock()
+
+
+def get_tiered_transcriber():
+    """Process-wide TieredTranscriber (WHISPER_FAST_MODEL / WHISPER_ACCURATE_MODEL), warming on first use."""
+    global _tiers
+    with _tiers_lock:
+        if _tiers is None:
+            _tiers = TieredTranscriber().warm()
+    return _tiers
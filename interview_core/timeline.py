@@ -0,0 +1,257 @@
+"""
+Per-answer emotion timelines.
+
+Instead of one webcam snapshot after each answer, an EmotionSampler
+classifies the latest frame from the shared CaptureService at a low rate
+(1 Hz by default) for as long as the candidate is answering. Every sample
+is a label-probability vector stored in a fixed-size float32 array per
+answer; when an answer outgrows it, neighbouring samples are averaged
+pairwise, so an answer never holds more than `capacity` rows however long
+it runs. Means, variances, the dominant label and label transitions are
+kept as running sums, so summaries cost O(labels) and do not rescan the
+samples.
+"""
+
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+from .dataflow import StageDropped
+from .emotion import classify_frames, get_emotion_classifier
+from .tracing import span
+
+
+class AnswerTimeline:
+
+    def __init__(self, labels, capacity=64):
+        self.labels = labels
+        self.capacity = capacity
+        self.started = time.time()
+        self.ended = None
+        self._samples = np.zeros((capacity, len(labels)), dtype=np.float32)
+        self._length = 0
+        self._stride = 1  # Raw samples per stored row after compaction
+        self._pending = np.zeros(len(labels), dtype=np.float64)
+        self._pending_count = 0
+        self.count = 0
+        self._sum = np.zeros(len(labels), dtype=np.float64)
+        self._sum_squares = np.zeros(len(labels), dtype=np.float64)
+        self._top_counts = np.zeros(len(labels), dtype=np.int64)
+        self.transitions = 0
+        self._last_top = None
+
+    def add(self, vector):
+        self.count += 1
+        self._sum += vector
+        self._sum_squares += vector * vector
+        top = int(np.argmax(vector))
+        self._top_counts[top] += 1
+        if self._last_top is not None and top != self._last_top:
+            self.transitions += 1
+        self._last_top = top
+
+        # Store one row per `_stride` raw samples.
+        self._pending += vector
+        self._pending_count += 1
+        if self._pending_count < self._stride:
+            return
+        if self._length == self.capacity:
+            self._compact()
+        self._samples[self._length] = self._pending / self._pending_count
+        self._length += 1
+        self._pending[:] = 0
+        self._pending_count = 0
+
+    def _compact(self):
+        """Halves the stored rows by averaging neighbours and doubles the stride."""
+        half = self._length // 2
+        rows = self._samples[:half * 2].reshape(half, 2, -1).mean(axis=1)
+        self._samples[:half] = rows
+        self._samples[half:] = 0
+        self._length = half
+        self._stride *= 2
+
+    @property
+    def samples(self):
+        """Stored (possibly averaged) rows, oldest first; a view, do not modify."""
+        return self._samples[:self._length]
+
+    def mean(self):
+        return self._sum / self.count if self.count else np.zeros(len(self.labels))
+
+    def variance(self):
+        if not self.count:
+            return np.zeros(len(self.labels))
+        mean = self.mean()
+        return np.maximum(self._sum_squares / self.count - mean * mean, 0.0)
+
+    def dominant(self):
+        """Label with the highest mean probability over the answer, or None."""
+        return self.labels[int(np.argmax(self._sum))] if self.count else None
+
+    def summary(self):
+        mean = self.mean()
+        return {
+            "samples": self.count,
+            "seconds": round((self.ended or time.time()) - self.started, 1),
+            "dominant": self.dominant(),
+            "dominant_share": round(float(self._top_counts.max()) / self.count, 2) if self.count else 0.0,
+            "mean": {label: round(float(p), 3) for label, p in zip(self.labels, mean)},
+            "variability": round(float(self.variance().sum()), 4),
+            "transitions": self.transitions,
+        }
+
+
+class EmotionTimeline:
+    """All answers of one session; at most `max_answers` are kept."""
+
+    def __init__(self, labels=None, capacity=64, max_answers=20):
+        self.labels = list(labels) if labels else None
+        self.capacity = capacity
+        self.max_answers = max_answers
+        self.answers = []
+        self.current = None
+        self._lock = threading.Lock()
+
+    def begin_answer(self):
+        with self._lock:
+            self._close_current()
+            self.current = None  # Created on the first sample, once labels are known
+
+    def _close_current(self):
+        if self.current is not None:
+            self.current.ended = time.time()
+            self.answers.append(self.current)
+            if len(self.answers) > self.max_answers:
+                self.answers.pop(0)
+            self.current = None
+
+    def end_answer(self):
+        """Closes the current answer; returns its summary (None if nothing was sampled)."""
+        with self._lock:
+            answer = self.current
+            self._close_current()
+        return answer.summary() if answer else None
+
+    def add(self, scores):
+        """Adds one {label: probability} sample to the current answer."""
+        with self._lock:
+            if self.labels is None:
+                self.labels = sorted(scores)
+            if self.current is None:
+                self.current = AnswerTimeline(self.labels, self.capacity)
+            # Labels the model never reported before are ignored.
+            self.current.add(np.array([scores.get(label, 0.0) for label in self.labels]))
+
+    def dominant_labels(self):
+        """Dominant label of every finished answer that has samples."""
+        return [answer.dominant() for answer in self.answers if answer.count]
+
+    def dominant_label(self):
+        """Label with the highest mean probability across all answers."""
+        answers = [answer for answer in self.answers if answer.count]
+        if not answers:
+            return None
+        total = sum(answer.mean() for answer in answers)
+        return self.labels[int(np.argmax(total))]
+
+    def summaries(self):
+        return [answer.summary() for answer in self.answers]
+
+    def nbytes(self):
+        return sum(answer._samples.nbytes for answer in self.answers)
+
+
+class EmotionSampler:
+    """
+    Samples emotions from a CaptureService into an EmotionTimeline while an
+    answer window is open (start_answer() ... stop_answer()). With a
+    `scheduler` each frame is classified on its "emotion_sample" stage.
+    """
+
+    def __init__(self, capture, timeline=None, rate_hz=1.0, classifier=None, face_tracker=None, scheduler=None,
+                 history=1000):
+        self.capture = capture
+        self.timeline = timeline or EmotionTimeline()
+        self.rate_hz = rate_hz
+        self.classifier = classifier
+        self.face_tracker = face_tracker
+        self.scheduler = scheduler
+        self.frames_without_face = 0
+        self.sample_latencies = deque(maxlen=history)  # Seconds per classified frame, latest `history`
+        self.classified = 0  # Frames classified in total
+        self.answer = 0  # Id of the latest answer window
+        self._stop = None  # Per answer, so a thread that outlives its join cannot be revived
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def start_answer(self):
+        """Opens a new answer window, closing any open one; returns its id for stop_answer()."""
+        with self._lock:
+            self._stop_current()
+            self.timeline.begin_answer()
+            self.answer += 1
+            self._stop = threading.Event()
+            self._thread = threading.Thread(target=self._run, args=(self._stop,), name="emotion-timeline",
+                                            daemon=True)
+            self._thread.start()
+            return self.answer
+
+    def stop_answer(self, answer=None):
+        """
+        Stops sampling and returns the finished answer's summary (or None).
+        With an `answer` id only that answer is stopped: a stop that arrives
+        after the next answer has started (e.g. queued on a busy stage) does
+        nothing.
+        """
+        with self._lock:
+            if answer is not None and answer != self.answer:
+                return None
+            return self._stop_current()
+
+    def _stop_current(self):
+        if self._thread is None:
+            return None
+        self._stop.set()
+        self._thread.join(timeout=5)
+        self._thread = None
+        return self.timeline.end_answer()
+
+    def _classify(self, frame, classifier, stop):
+        classified = time.perf_counter()
+        with span("emotion.face"):
+            scores = classify_frames([frame], classifier)[0]
+        if not stop.is_set():  # The answer may have closed while the frame was queued
+            self.timeline.add(scores)
+        self.sample_latencies.append(time.perf_counter() - classified)
+        self.classified += 1
+
+    def latencies_since(self, classified):
+        """Latencies of the frames classified after the first `classified` (those still held)."""
+        count = min(self.classified - classified, len(self.sample_latencies))
+        return list(self.sample_latencies)[len(self.sample_latencies) - count:]
+
+    def _run(self, stop):
+        classifier = self.classifier or get_emotion_classifier()
+        interval = 1 / self.rate_hz
+        while not stop.is_set():
+            started = time.perf_counter()
+            frame = self.capture.latest_frame()
+            if frame is not None and self.face_tracker is not None:
+                frame = self.face_tracker.crop(frame)
+                if frame is None:
+                    self.frames_without_face += 1
+            if frame is not None:
+                try:
+                    if self.scheduler is None:
+                        self._classify(frame, classifier, stop)
+                    else:
+                        self.scheduler.submit("emotion_sample",
+                                              lambda: self._classify(frame, classifier, stop)).result()
+                except StageDropped:
+                    pass  # A newer frame is sampled on the next tick
+                except Exception as e:
+                    print(f"Emotion sampling failed: {e}")
+            stop.wait(max(0.0, interval - (time.perf_counter() - started)))
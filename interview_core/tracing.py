@@ -0,0 +1,188 @@
+"""
+Structured tracing for the interview pipeline.
+
+Stages (record, transcribe, llm, tts, emotion.face, emotion.voice) are
+recorded as spans, and every interview state change (start ->
+waiting_for_answer -> processing_answer -> ...) as a span covering the
+time spent in the previous state. Spans are exported in the Chrome trace
+event format (open the file in chrome://tracing or https://ui.perfetto.dev)
+and aggregated into p50/p95/p99 latencies per stage.
+
+Tracing is off unless INTERVIEW_TRACE names an output file. When it is
+off, span() returns a shared no-op context manager after a single
+attribute check, so instrumented hot paths cost next to nothing.
+"""
+
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+
+from . import config
+from .metrics import summarize
+
+
+class _NoopSpan:
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set(self, **args):
+        pass
+
+
+_NOOP = _NoopSpan()
+
+
+class Span:
+    __slots__ = ("tracer", "name", "category", "args", "start")
+
+    def __init__(self, tracer, name, category, args):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.args["error"] = f"{exc_type.__name__}: {exc}"
+        self.tracer.add(self.name, self.start, time.perf_counter_ns(), self.category, self.args)
+        return False
+
+    def set(self, **args):
+        """Attaches extra arguments (shown in the trace viewer) to the span."""
+        self.args.update(args)
+
+
+class Tracer:
+
+    def __init__(self, path=None, enabled=None, max_events=100000, history=1000):
+        self.path = path
+        self.enabled = bool(path) if enabled is None else enabled
+        self.history = history
+        self.events = deque(maxlen=max_events)
+        self.durations = {}  # span name -> recent durations in seconds
+        self._origin = time.perf_counter_ns()
+        self._pid = os.getpid()
+        self._threads = {}
+        self._states = {}  # key -> (state, entered at)
+        self._lock = threading.Lock()
+
+    def span(self, name, category="stage", **args):
+        """Context manager timing one stage; a no-op while tracing is disabled."""
+        if not self.enabled:
+            return _NOOP
+        return Span(self, name, category, args)
+
+    def add(self, name, start_ns, end_ns, category="stage", args=None):
+        """Records a finished span from perf_counter_ns() timestamps."""
+        if not self.enabled:
+            return
+        thread = threading.current_thread()
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start_ns - self._origin) / 1000,
+            "dur": (end_ns - start_ns) / 1000,
+            "pid": self._pid,
+            "tid": thread.ident,
+        }
+        if args:
+            event["args"] = args
+        with self._lock:
+            self.events.append(event)
+            self._threads[thread.ident] = thread.name
+            samples = self.durations.get(name)
+            if samples is None:
+                samples = self.durations[name] = deque(maxlen=self.history)
+            samples.append((end_ns - start_ns) / 1e9)
+
+    def transition(self, state, key="default", **args):
+        """
+        Notes that `key` (a session) is now in `state`. The time spent in the
+        previous state is recorded as a "state:<name>" span; repeated calls
+        with an unchanged state (e.g. Streamlit reruns) are ignored.
+        """
+        if not self.enabled:
+            return
+        now = time.perf_counter_ns()
+        with self._lock:
+            previous = self._states.get(key)
+            if previous is not None and previous[0] == state:
+                return
+            self._states[key] = (state, now)
+        if previous is not None:
+            self.add(f"state:{previous[0]}", previous[1], now, "state", dict(args, next=state, session=str(key)))
+
+    def stats(self):
+        with self._lock:
+            durations = {name: list(samples) for name, samples in self.durations.items()}
+        return {name: summarize(samples) for name, samples in sorted(durations.items())}
+
+    def report(self):
+        lines = [f"{name}: {s['count']} spans, p50 {s['p50_ms']} ms / p95 {s['p95_ms']} ms / p99 {s['p99_ms']} ms"
+                 for name, s in self.stats().items()]
+        return "Trace: " + ("; ".join(lines) or "no spans recorded")
+
+    def export(self, path=None):
+        """Writes the spans so far as a Chrome trace file; returns its path."""
+        path = path or self.path
+        with self._lock:
+            events = list(self.events)
+            threads = dict(self._threads)
+        metadata = [{"name": "thread_name", "ph": "M", "pid": self._pid, "tid": tid, "args": {"name": name}}
+                    for tid, name in threads.items()]
+        with open(path, "w") as f:
+            json.dump({"traceEvents": metadata + events, "displayTimeUnit": "ms"}, f)
+        return path
+
+
+def traced(name, category="stage"):
+    """Decorator wrapping every call of a function in a span."""
+
+    def decorate(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _tracer.enabled:
+                return function(*args, **kwargs)
+            with _tracer.span(name, category):
+                return function(*args, **kwargs)
+        return wrapper
+
+    return decorate
+
+
+def _flush_at_exit(tracer):
+    if tracer.events:
+        print(tracer.report())
+        print(f"Trace written to {tracer.export()}")
+
+
+_tracer = Tracer(config.TRACE_PATH)
+if _tracer.enabled:
+    atexit.register(_flush_at_exit, _tracer)
+
+
+def get_tracer():
+    """The process-wide tracer (enabled by INTERVIEW_TRACE)."""
+    return _tracer
+
+
+def span(name, category="stage", **args):
+    return _tracer.span(name, category, **args)
+
+
+def transition(state, key="default", **args):
+    _tracer.transition(state, key, **args)
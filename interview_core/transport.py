@@ -0,0 +1,77 @@
+"""
+How the interview engine talks to the candidate. The engine only calls
+say()/say_stream()/listen()/close(), so the same interview loop runs over a voice
+session, a plain terminal or anything else that implements these.
+"""
+
+from . import config
+from .audio import record_answer, speak, transcribe
+from .speech import SpeechPipeline
+from .vad import VadStats
+
+
+class Transport:
+    """Base class for candidate-facing I/O."""
+
+    def say(self, text):
+        raise NotImplementedError
+
+    def say_stream(self, sentences):
+        """Says a reply that is still being generated, one sentence at a time."""
+        self.say(" ".join(sentences))
+
+    def listen(self):
+        """Returns the candidate's next answer as text."""
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class TextTransport(Transport):
+    """Typed answers in the terminal."""
+
+    def say(self, text):
+        print("\nInterviewer:", text, "\n")
+
+    def say_stream(self, sentences):
+        print("\nInterviewer:", end="", flush=True)
+        for sentence in sentences:
+            print("", sentence, end="", flush=True)
+        print("\n")
+
+    def listen(self):
+        return input("Your answer (or type 'exit' to finish): ")
+
+
+class VoiceTransport(Transport):
+    """Spoken questions through the speakers, spoken answers through the microphone."""
+
+    def __init__(self, max_duration=15, fs=config.SAMPLE_RATE, model=None):
+        self.max_duration = max_duration
+        self.fs = fs
+        self.model = model
+        self.vad_stats = VadStats()
+        self.speech = SpeechPipeline()
+
+    def say(self, text):
+        print("\nInterviewer:", text, "\n")
+        speak(text)
+
+    def say_stream(self, sentences):
+        text = self.speech.speak_sentences(sentences)
+        print("\nInterviewer:", text, "\n")
+
+    def listen(self):
+        input("\nPress Enter to start recording your answer "
+              "(recording stops when you finish, max {} seconds)...".format(self.max_duration))
+        audio = record_answer(self.max_duration, self.fs, self.vad_stats)
+        if audio.size == 0:
+            print("No speech detected.")
+            return ""
+        transcription = transcribe(audio, self.model, self.fs)
+        print("You said:", transcription)
+        return transcription
+
+    def close(self):
+        print(self.vad_stats.report(self.fs))
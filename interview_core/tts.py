@@ -0,0 +1,197 @@
+"""
+Text-to-speech backends. Every backend turns text into bytes in its own
+`format`:
+
+- "mp3": encoded audio (gTTS). Needs a network round-trip per utterance and
+  a decode step before playback.
+- "pcm": raw 16-bit mono samples at `sample_rate` (espeak-ng). Synthesized
+  locally and played directly, with no encode/decode step.
+
+Pick the default with the TTS_ENGINE environment variable ("gtts",
+"espeak" or "auto" = espeak if installed, else gtts).
+"""
+
+import os
+import shutil
+import struct
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from .llm import split_sentences
+from .tracing import span
+from .tts_cache import get_tts_cache
+
+
+class TTSBackend:
+    name = None
+    format = None
+    sample_rate = None
+    voice = None  # Engine-specific settings that change the audio, part of the cache key
+    words_per_minute = None
+
+    def synthesize(self, text, lang='en'):
+        raise NotImplementedError
+
+
+class GTTSBackend(TTSBackend):
+    name = "gtts"
+    format = "mp3"
+
+    def synthesize(self, text, lang='en'):
+        from gtts import gTTS
+
+        tts = gTTS(text=text, lang=lang, slow=False)
+        audio_stream = BytesIO()
+        tts.write_to_fp(audio_stream)
+        return audio_stream.getvalue()
+
+
+def _wav_to_pcm(data):
+    """Returns (pcm_bytes, sample_rate) from a RIFF/WAVE byte string."""
+    if data[:4] != b"RIFF" or data[8:12] != b"WAVE":
+        raise ValueError("Not a WAV stream")
+    sample_rate = None
+    pos = 12
+    while pos + 8 <= len(data):
+        chunk_id = data[pos:pos + 4]
+        size = struct.unpack("<I", data[pos + 4:pos + 8])[0]
+        body = pos + 8
+        if chunk_id == b"fmt ":
+            sample_rate = struct.unpack("<I", data[body + 4:body + 8])[0]
+        elif chunk_id == b"data":
+            # Streamed WAVs may carry a bogus size; take whatever is there.
+            return data[body:min(len(data), body + size)], sample_rate
+        pos = body + size + (size & 1)
+    raise ValueError("WAV stream has no data chunk")
+
+
+class EspeakBackend(TTSBackend):
+    """Local synthesis through the espeak-ng (or espeak) command line tool."""
+
+    name = "espeak"
+    format = "pcm"
+    sample_rate = 22050
+
+    def __init__(self, voice=None, words_per_minute=160):
+        self.executable = shutil.which("espeak-ng") or shutil.which("espeak")
+        self.voice = voice
+        self.words_per_minute = words_per_minute
+
+    @classmethod
+    def available(cls):
+        return bool(shutil.which("espeak-ng") or shutil.which("espeak"))
+
+    def synthesize(self, text, lang='en'):
+        if not self.executable:
+            raise RuntimeError("espeak-ng is not installed")
+        # Text goes through stdin so it can never be parsed as an option.
+        command = [self.executable, "--stdout", "-v", self.voice or lang, "-s", str(self.words_per_minute)]
+        wav = subprocess.run(command, input=text.encode("utf-8"), check=True, capture_output=True).stdout
+        pcm, sample_rate = _wav_to_pcm(wav)
+        if sample_rate:
+            self.sample_rate = sample_rate
+        return pcm
+
+
+_backends = {}
+_backends_lock = threading.Lock()
+_mixer_lock = threading.Lock()
+_mixer_ready = False
+
+
+def get_backend(name=None):
+    """Returns the shared backend instance for `name` (default: TTS_ENGINE)."""
+    name = (name or os.environ.get("TTS_ENGINE", "gtts")).lower()
+    if name == "auto":
+        name = "espeak" if EspeakBackend.available() else "gtts"
+    with _backends_lock:
+        if name not in _backends:
+            if name == "gtts":
+                _backends[name] = GTTSBackend()
+            elif name == "espeak":
+                _backends[name] = EspeakBackend()
+            else:
+                raise ValueError(f"Unknown TTS engine '{name}'")
+        return _backends[name]
+
+
+def synthesize(text, lang='en', backend=None, cache=True):
+    """Synthesizes one sentence, going through the TTS cache."""
+    backend = backend or get_backend()
+    with span("tts", backend=backend.name, chars=len(text)):
+        if not cache:
+            return backend.synthesize(text, lang)
+        return get_tts_cache().get_or_synthesize(text, lang, backend.name, backend.synthesize,
+                                                 voice=backend.voice, rate=backend.words_per_minute)
+
+
+def synthesize_utterance(text, lang='en', backend=None, cache=True):
+    """
+    Audio for a whole utterance, synthesized (and cached) sentence by sentence.
+    Both MP3 frames and raw PCM can simply be concatenated.
+    """
+    return b"".join(synthesize(sentence, lang, backend, cache) for sentence in split_sentences([text]))
+
+
+def synthesize_batch(texts, lang='en', backend=None, workers=4):
+    """
+    Pre-renders a list of sentences in parallel (filling the cache) and
+    returns their audio in the same order.
+    """
+    backend = backend or get_backend()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda text: synthesize(text, lang, backend), texts))
+
+
+def presynthesize(utterances, lang='en', backend=None, workers=4):
+    """
+    Splits utterances into sentences and pre-renders all distinct ones into
+    the cache in parallel. Errors are reported, not raised, so this is safe
+    to run in a background thread at startup.
+    """
+    sentences = []
+    for utterance in utterances:
+        for sentence in split_sentences([utterance]):
+            if sentence not in sentences:
+                sentences.append(sentence)
+    try:
+        synthesize_batch(sentences, lang, backend, workers)
+        print(f"Pre-synthesized {len(sentences)} sentences.")
+    except Exception as e:
+        print(f"Pre-synthesis failed: {e}")
+
+
+def _init_mixer():
+    global _mixer_ready
+    import pygame
+
+    with _mixer_lock:
+        if not _mixer_ready:
+            pygame.mixer.init()
+            _mixer_ready = True
+    return pygame
+
+
+def play_mp3(mp3_bytes):
+    """Plays MP3 bytes through pygame and waits until playback finishes."""
+    pygame = _init_mixer()
+    pygame.mixer.music.load(BytesIO(mp3_bytes), 'mp3')
+    pygame.mixer.music.play()
+    while pygame.mixer.music.get_busy():
+        time.sleep(0.1)
+
+
+def play(audio, backend=None):
+    """Plays audio produced by `backend` and waits until it finishes."""
+    backend = backend or get_backend()
+    if backend.format == "pcm":
+        import numpy as np
+        import sounddevice as sd
+
+        sd.play(np.frombuffer(audio, dtype=np.int16), samplerate=backend.sample_rate)
+        sd.wait()
+    else:
+        play_mp3(audio)
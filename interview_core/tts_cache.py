@@ -0,0 +1,149 @@
+"""
+On-disk cache for synthesized speech. Entries are keyed by (text, lang,
+engine, voice, rate), stored under the SHA-256 of that key and evicted
+least recently used first once the cache exceeds its byte budget. Fixed phrases (error
+messages, the opening prompt, feedback templates) then cost no synthesis
+round-trip after the first time.
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+
+DEFAULT_DIR = os.environ.get(
+    "TTS_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "interview_core", "tts"),
+)
+DEFAULT_MAX_BYTES = int(os.environ.get("TTS_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+
+
+class TTSCache:
+
+    def __init__(self, directory=DEFAULT_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()  # digest -> size in bytes, oldest first
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._load_index()
+
+    @staticmethod
+    def key(text, lang, engine, voice=None, rate=None):
+        """Digest of an entry; engines without voice and rate settings (gTTS) keep their old keys."""
+        if voice is None and rate is None:
+            return hashlib.sha256(f"{engine}\0{lang}\0{text}".encode("utf-8")).hexdigest()
+        return hashlib.sha256(f"{engine}\0{voice or ''}\0{rate or ''}\0{lang}\0{text}".encode("utf-8")).hexdigest()
+
+    def _path(self, digest):
+        return os.path.join(self.directory, digest[:2], digest)
+
+    def _load_index(self):
+        """Rebuilds the LRU order from file modification times."""
+        found = []
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if name.endswith(".tmp"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                found.append((stat.st_mtime, name, stat.st_size))
+        for _, digest, size in sorted(found):
+            self._entries[digest] = size
+            self._total_bytes += size
+        self._evict()
+
+    def _evict(self):
+        while self._total_bytes > self.max_bytes and self._entries:
+            digest, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            self.evictions += 1
+            try:
+                os.remove(self._path(digest))
+            except OSError:
+                pass
+
+    def get(self, text, lang, engine, voice=None, rate=None):
+        digest = self.key(text, lang, engine, voice, rate)
+        with self._lock:
+            if digest not in self._entries:
+                self.misses += 1
+                return None
+            try:
+                with open(self._path(digest), "rb") as f:
+                    data = f.read()
+            except OSError:
+                # Deleted behind our back: forget it.
+                self._total_bytes -= self._entries.pop(digest)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(digest)
+            self.hits += 1
+        try:
+            os.utime(self._path(digest))  # Keep LRU order across restarts
+        except OSError:
+            pass
+        return data
+
+    def put(self, text, lang, engine, data, voice=None, rate=None):
+        if len(data) > self.max_bytes:
+            return
+        digest = self.key(text, lang, engine, voice, rate)
+        path = self._path(digest)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write to a temp file first so readers never see a partial entry.
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        with self._lock:
+            if digest in self._entries:
+                self._total_bytes -= self._entries.pop(digest)
+            self._entries[digest] = len(data)
+            self._total_bytes += len(data)
+            self._evict()
+
+    def get_or_synthesize(self, text, lang, engine, synthesize, voice=None, rate=None):
+        data = self.get(text, lang, engine, voice, rate)
+        if data is None:
+            data = synthesize(text, lang)
+            self.put(text, lang, engine, data, voice, rate)
+        return data
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._total_bytes,
+            }
+
+    def report(self):
+        stats = self.stats()
+        lookups = stats["hits"] + stats["misses"]
+        hit_rate = 100 * stats["hits"] / lookups if lookups else 0.0
+        return (f"TTS cache: {stats['hits']} hits, {stats['misses']} misses ({hit_rate:.0f}% hit rate), "
+                f"{stats['entries']} entries, {stats['bytes'] / 1024:.0f} KiB.")
+
+
+_default_cache = None
+_default_lock = threading.Lock()
+
+
+def get_tts_cache():
+    """Process-wide cache instance in DEFAULT_DIR."""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = TTSCache()
+    return _default_cache
@@ -0,0 +1,192 @@
+import queue
+import time
+from collections import namedtuple
+
+import numpy as np
+
+
+class TrimStats(namedtuple("TrimStats", ["original_samples", "kept_samples"])):
+    """How much audio survived silence trimming."""
+
+    @property
+    def trimmed_samples(self):
+        return self.original_samples - self.kept_samples
+
+    @property
+    def trimmed_ratio(self):
+        if not self.original_samples:
+            return 0.0
+        return self.trimmed_samples / self.original_samples
+
+
+class VadStats:
+    """Accumulates TrimStats over an interview to measure the compute saved."""
+
+    def __init__(self):
+        self.answers = 0
+        self.original_samples = 0
+        self.kept_samples = 0
+
+    def add(self, stats):
+        self.answers += 1
+        self.original_samples += stats.original_samples
+        self.kept_samples += stats.kept_samples
+
+    @property
+    def trimmed_ratio(self):
+        return TrimStats(self.original_samples, self.kept_samples).trimmed_ratio
+
+    def report(self, fs=16000):
+        return (f"VAD: {self.answers} answers, kept {self.kept_samples / fs:.1f}s of "
+                f"{self.original_samples / fs:.1f}s recorded "
+                f"(trimmed {100 * self.trimmed_ratio:.1f}%).")
+
+
+def frame_rms(audio, frame_len):
+    """RMS energy of consecutive non-overlapping frames (the tail is dropped)."""
+    n = audio.size // frame_len
+    if n == 0:
+        return np.zeros(0, dtype=np.float32)
+    frames = audio[:n * frame_len].reshape(n, frame_len)
+    return np.sqrt(np.mean(frames.astype(np.float32) ** 2, axis=1))
+
+
+class EnergyEndpointer:
+    """
+    Frame-energy voice activity detector that decides when the candidate has
+    finished speaking. Feed it audio in chunks of any size with process(); it
+    returns True once `trailing_silence_s` of silence followed at least
+    `min_speech_s` of speech, or if nobody spoke for `max_leading_silence_s`.
+
+    The speech threshold tracks the background noise floor before the
+    candidate starts speaking, so it works with different microphones
+    without manual tuning; once speech has started the floor is frozen.
+    """
+
+    def __init__(self, fs=16000, frame_ms=30, trailing_silence_s=1.2, min_speech_s=0.3,
+                 max_leading_silence_s=8.0, threshold_ratio=3.0, min_rms=0.005):
+        self.fs = fs
+        self.frame_len = int(fs * frame_ms / 1000)
+        self.trailing_silence_frames = int(trailing_silence_s * 1000 / frame_ms)
+        self.min_speech_frames = max(1, int(min_speech_s * 1000 / frame_ms))
+        self.max_leading_silence_frames = int(max_leading_silence_s * 1000 / frame_ms)
+        self.threshold_ratio = threshold_ratio
+        self.min_rms = min_rms
+        self.reset()
+
+    def reset(self):
+        self.noise_floor = None
+        self.speech_started = False
+        self.done = False
+        self.speech_start = None   # Absolute sample index of the first speech frame
+        self.speech_end = None     # Absolute sample index after the last speech frame
+        self._pending = np.zeros(0, dtype=np.float32)
+        self._frames_seen = 0
+        self._speech_run = 0
+        self._run_start = None
+        self._silence_run = 0
+
+    @property
+    def threshold(self):
+        floor = self.noise_floor if self.noise_floor is not None else 0.0
+        return max(self.min_rms, floor * self.threshold_ratio)
+
+    def process(self, samples):
+        if self.done:
+            return True
+        samples = np.asarray(samples, dtype=np.float32).reshape(-1)
+        audio = np.concatenate((self._pending, samples)) if self._pending.size else samples
+        energies = frame_rms(audio, self.frame_len)
+        self._pending = audio[energies.size * self.frame_len:].copy()
+
+        for rms in energies:
+            frame_start = self._frames_seen * self.frame_len
+            self._frames_seen += 1
+            if rms > self.threshold:
+                if self._speech_run == 0:
+                    self._run_start = frame_start
+                self._speech_run += 1
+                self._silence_run = 0
+                if self._speech_run >= self.min_speech_frames and not self.speech_started:
+                    self.speech_started = True
+                    self.speech_start = self._run_start
+                if self.speech_started:
+                    self.speech_end = frame_start + self.frame_len
+            else:
+                self._speech_run = 0
+                self._silence_run += 1
+                # Only quiet frames before the answer update the noise floor estimate; during
+                # the answer soft speech would pull the threshold up above the voice itself.
+                if self.noise_floor is None:
+                    self.noise_floor = float(rms)
+                elif not self.speech_started:
+                    self.noise_floor = 0.95 * self.noise_floor + 0.05 * float(rms)
+
+            if self.speech_started and self._silence_run >= self.trailing_silence_frames:
+                self.done = True
+                break
+            if not self.speech_started and self._frames_seen >= self.max_leading_silence_frames:
+                self.done = True
+                break
+        return self.done
+
+
+def trim_silence(audio, fs=16000, frame_ms=30, pad_ms=150, threshold_ratio=3.0, min_rms=0.005):
+    """
+    Cuts leading and trailing silence from a recording, keeping `pad_ms` of
+    context on both sides. Returns (trimmed_audio, TrimStats).
+    """
+    audio = np.asarray(audio, dtype=np.float32).reshape(-1)
+    frame_len = int(fs * frame_ms / 1000)
+    energies = frame_rms(audio, frame_len)
+    if energies.size == 0:
+        return audio, TrimStats(audio.size, audio.size)
+
+    noise_floor = float(np.percentile(energies, 10))
+    threshold = max(min_rms, noise_floor * threshold_ratio)
+    voiced = np.flatnonzero(energies > threshold)
+    if voiced.size == 0:
+        return audio[:0], TrimStats(audio.size, 0)
+
+    pad = int(fs * pad_ms / 1000)
+    start = max(0, voiced[0] * frame_len - pad)
+    end = min(audio.size, (voiced[-1] + 1) * frame_len + pad)
+    trimmed = audio[start:end]
+    return trimmed, TrimStats(audio.size, trimmed.size)
+
+
+def record_until_silence(max_duration, fs=16000, endpointer=None):
+    """
+    Records from the default microphone until the endpointer detects the end of
+    the answer or `max_duration` seconds have passed. Returns a 1D float32
+    numpy array normalized to [-1, 1].
+    """
+    import sounddevice as sd
+
+    endpointer = endpointer or EnergyEndpointer(fs=fs)
+    endpointer.reset()
+    chunks = queue.Queue()
+
+    def callback(indata, frames, time_info, status):
+        if status:
+            print(f"Input stream status: {status}")
+        chunks.put(indata[:, 0].copy())
+
+    recorded = []
+    deadline = time.monotonic() + max_duration
+    with sd.InputStream(samplerate=fs, channels=1, dtype='float32',
+                        blocksize=int(fs * 0.1), callback=callback):
+        while time.monotonic() < deadline:
+            try:
+                chunk = chunks.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            recorded.append(chunk)
+            if endpointer.process(chunk):
+                break
+    while not chunks.empty():
+        recorded.append(chunks.get_nowait())
+
+    if not recorded:
+        return np.zeros(0, dtype=np.float32)
+    return np.concatenate(recorded)
@@ -0,0 +1,23 @@
+from interview_core.feedback import FEEDBACK_MESSAGES, emotion_label, merged_emotion_feedback
+
+
+class Timeline:
+
+    def __init__(self, labels):
+        self.labels = labels
+
+    def dominant_labels(self):
+        return self.labels
+
+
+def test_emotion_labels_are_canonical():
+    assert emotion_label("Happy") == "happy"
+    assert emotion_label("hap") == "happy"
+    assert emotion_label("Neutral") == "neutral"
+
+
+def test_face_and_voice_votes_add_up_across_case():
+    # Split by case, "Happy"/"happy" (2 + 2) would lose to "sad" (3).
+    face = Timeline(["Happy", "Happy", "Sad"])
+    voice = Timeline(["happy", "sad", "hap", "sad"])
+    assert merged_emotion_feedback(face, voice) == FEEDBACK_MESSAGES["happy"]
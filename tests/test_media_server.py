@@ -0,0 +1,20 @@
+import os
+
+from interview_core.media_server import is_local_host, media_url
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WAV = os.path.join(REPO_ROOT, "recording.wav")
+
+
+def test_loopback_hosts():
+    assert is_local_host("localhost:8501")
+    assert is_local_host("127.0.0.1")
+    assert is_local_host("[::1]:8501")
+    assert not is_local_host("interview.example.com")
+    assert not is_local_host("192.168.1.20:8501")
+    assert not is_local_host(None)
+
+
+def test_remote_pages_get_a_data_uri():
+    assert media_url(WAV, "localhost:8501").startswith("http://")
+    assert media_url(WAV, "interview.example.com").startswith("data:audio/")
@@ -0,0 +1,110 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from course_search import SearchCache, cache, courses_from_json, courses_to_json, parse_video_items
+from course_search.fakes import FakeApiError, FakeYouTubeClient
+
+
+class Clock:
+    """Stands in for the cache's time.time(), so entries age without sleeping."""
+
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache, "time", SimpleNamespace(time=clock.time))
+    return clock
+
+
+def search_cache(client, directory=None, ttl=60, stale_ttl=60):
+    def fetch(query, tag, max_results):
+        request = client.search().list(part="snippet", q=f"{query} {tag}", type="video", maxResults=max_results)
+        return parse_video_items(request.execute().get("items", []))
+
+    return SearchCache(fetch, namespace="test", ttl=ttl, stale_ttl=stale_ttl, directory=directory,
+                       encode=courses_to_json, decode=courses_from_json)
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+
+def test_fresh_entry_is_served_from_memory(clock):
+    client = FakeYouTubeClient(latency=0)
+    courses = search_cache(client)
+    first = courses.get("Python", "beginners", 2)
+    clock.now += 59
+    assert courses.get("  python ", "Beginners", 2) is first
+    assert client.calls == 1
+    assert courses.stats()["hits"] == 1
+
+
+def test_stale_entry_is_served_while_it_refreshes(clock):
+    client = FakeYouTubeClient(latency=0)
+    courses = search_cache(client)
+    first = courses.get("python", "beginners", 2)
+    clock.now += 90  # Past ttl, within ttl + stale_ttl
+    assert courses.get("python", "beginners", 2) is first
+    assert courses.stats()["stale_hits"] == 1
+    wait_for(lambda: client.calls == 2 and not courses._inflight)
+    refreshed = courses.get("python", "beginners", 2)
+    assert refreshed is not first
+    assert courses.stats()["hits"] == 1
+
+
+def test_expired_entry_is_fetched_again(clock):
+    client = FakeYouTubeClient(latency=0)
+    courses = search_cache(client)
+    first = courses.get("python", "beginners", 2)
+    clock.now += 121  # Past ttl + stale_ttl
+    assert courses.get("python", "beginners", 2) is not first
+    assert client.calls == 2
+    assert courses.stats()["misses"] == 2
+
+
+def test_concurrent_lookups_share_one_upstream_call(clock):
+    client = FakeYouTubeClient(latency=0.2)
+    courses = search_cache(client)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(courses.get("react", "beginners", 2)))
+               for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert client.calls == 1
+    assert len(results) == 8 and all(result is results[0] for result in results)
+    assert courses.stats()["coalesced"] == 7
+
+
+def test_failed_fetches_are_not_cached(clock, tmp_path):
+    client = FakeYouTubeClient(latency=0, failures=1)
+    courses = search_cache(client, directory=str(tmp_path))
+    with pytest.raises(FakeApiError):
+        courses.get("python", "beginners", 2)
+    assert courses.stats()["entries"] == 0
+    assert not list(tmp_path.rglob("*.json"))
+    assert len(courses.get("python", "beginners", 2)) == 2
+    assert client.calls == 2
+
+
+def test_disk_entry_survives_a_new_instance(clock, tmp_path):
+    client = FakeYouTubeClient(latency=0)
+    first = search_cache(client, directory=str(tmp_path)).get("docker", "beginners", 2)
+    restarted = search_cache(client, directory=str(tmp_path))
+    again = restarted.get("docker", "beginners", 2)
+    assert [course.to_dict() for course in again] == [course.to_dict() for course in first]
+    assert client.calls == 1
+    assert restarted.stats()["disk_hits"] == 1
@@ -0,0 +1,37 @@
+import os
+
+from interview_core import config
+from interview_core.replay import load_wav
+from interview_core.vad import EnergyEndpointer
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FS = config.SAMPLE_RATE
+
+
+def replay(audio, endpointer, block=FS // 10):
+    """Feeds `audio` in microphone-sized blocks; returns the seconds fed when the endpointer fired."""
+    for position in range(0, audio.size, block):
+        if endpointer.process(audio[position:position + block]):
+            return (position + block) / FS
+    return None
+
+
+def test_recording_endpoint_falls_after_the_answer():
+    # recording.wav holds speech from about 1.1 s to 3.1 s; soft speech must not raise the threshold.
+    endpointer = EnergyEndpointer(fs=FS, trailing_silence_s=config.TRAILING_SILENCE_SECONDS)
+    fired = replay(load_wav(os.path.join(REPO_ROOT, "recording.wav")), endpointer)
+    assert fired is not None and fired > 3.0
+    assert endpointer.speech_end / FS > 3.0
+    assert endpointer.speech_start / FS < 1.2
+
+
+def test_noise_floor_is_frozen_during_speech():
+    endpointer = EnergyEndpointer(fs=FS)
+    audio = load_wav(os.path.join(REPO_ROOT, "recording.wav"))
+    floor = None
+    for position in range(0, audio.size, FS // 10):
+        endpointer.process(audio[position:position + FS // 10])
+        if endpointer.speech_started and floor is None:
+            floor = endpointer.noise_floor
+    assert floor is not None
+    assert endpointer.noise_floor == floor